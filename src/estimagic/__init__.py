@@ -10,9 +10,10 @@ from estimagic.estimation.estimate_msm import MomentsResult, estimate_msm
 from estimagic.estimation.msm_weighting import get_moments_cov
 from estimagic.inference.bootstrap import BootstrapResult, bootstrap
 from estimagic.logging.read_log import OptimizeLogReader
-from estimagic.optimization.optimize import maximize, minimize
-from estimagic.optimization.optimize_result import OptimizeResult
+from estimagic.optimization.optimize import maximize, minimize, minimize_many
+from estimagic.optimization.optimize_result import ManyOptimizeResult, OptimizeResult
 from estimagic.parameters.constraint_tools import check_constraints, count_free_params
+from estimagic.sharding import get_sharded_function, shard_data
 from estimagic.visualization.convergence_plot import convergence_plot
 from estimagic.visualization.derivative_plot import derivative_plot
 from estimagic.visualization.estimation_table import (
@@ -36,6 +37,7 @@ except ImportError:
 __all__ = [
     "maximize",
     "minimize",
+    "minimize_many",
     "utilities",
     "first_derivative",
     "second_derivative",
@@ -61,8 +63,11 @@ __all__ = [
     "params_plot",
     "count_free_params",
     "check_constraints",
+    "shard_data",
+    "get_sharded_function",
     "OptimizeLogReader",
     "OptimizeResult",
+    "ManyOptimizeResult",
     "BootstrapResult",
     "LikelihoodResult",
     "MomentsResult",
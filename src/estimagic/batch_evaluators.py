@@ -5,6 +5,9 @@ can be used used as batch evaluator in estimagic.
 
 """
 
+import warnings
+
+import numpy as np
 from joblib import Parallel, delayed
 
 try:
@@ -15,7 +18,18 @@ except ImportError:
     pathos_is_available = False
 
 from estimagic.config import DEFAULT_N_CORES as N_CORES
+from estimagic.config import IS_JAX_INSTALLED
 from estimagic.decorators import catch, unpack
+from estimagic.exceptions import StopOptimizationError
+
+if IS_JAX_INSTALLED:
+    import jax
+    import jax.numpy as jnp
+    from jax.experimental import enable_x64
+
+# a StopOptimizationError signals that the optimization has to stop, e.g. because the
+# budget is exhausted, and must not be converted into a failed evaluation
+_ALWAYS_RAISED = (KeyboardInterrupt, SystemExit, StopOptimizationError)
 
 
 def pathos_mp_batch_evaluator(
@@ -43,7 +57,7 @@ def pathos_mp_batch_evaluator(
         error_handling (str): Can take the values "raise" (raise the error and stop all
             tasks as soon as one task fails) and "continue" (catch exceptions and set
             the traceback of the raised exception.
-            KeyboardInterrupt and SystemExit are always raised.
+            KeyboardInterrupt, SystemExit and StopOptimizationError are always raised.
         unpack_symbol (str or None). Can be "**", "*" or None. If None, func just takes
             one argument. If "*", the elements of arguments are positional arguments for
             func. If "**", the elements of arguments are keyword arguments for func.
@@ -65,7 +79,7 @@ def pathos_mp_batch_evaluator(
     reraise = error_handling == "raise"
 
     @unpack(symbol=unpack_symbol)
-    @catch(default="__traceback__", reraise=reraise)
+    @catch(default="__traceback__", reraise=reraise, exclude=_ALWAYS_RAISED)
     def internal_func(*args, **kwargs):
         return func(*args, **kwargs)
 
@@ -104,7 +118,7 @@ def joblib_batch_evaluator(
         error_handling (str): Can take the values "raise" (raise the error and stop all
             tasks as soon as one task fails) and "continue" (catch exceptions and set
             the output of failed tasks to the traceback of the raised exception.
-            KeyboardInterrupt and SystemExit are always raised.
+            KeyboardInterrupt, SystemExit and StopOptimizationError are always raised.
         unpack_symbol (str or None). Can be "**", "*" or None. If None, func just takes
             one argument. If "*", the elements of arguments are positional arguments for
             func. If "**", the elements of arguments are keyword arguments for func.
@@ -120,7 +134,7 @@ def joblib_batch_evaluator(
     reraise = error_handling == "raise"
 
     @unpack(symbol=unpack_symbol)
-    @catch(default="__traceback__", reraise=reraise)
+    @catch(default="__traceback__", reraise=reraise, exclude=_ALWAYS_RAISED)
     def internal_func(*args, **kwargs):
         return func(*args, **kwargs)
 
@@ -132,6 +146,96 @@ def joblib_batch_evaluator(
     return res
 
 
+def jax_batch_evaluator(
+    func,
+    arguments,
+    *,
+    n_cores=N_CORES,
+    error_handling="continue",
+    unpack_symbol=None,
+):
+    """Batch evaluator that vectorizes func with jax.vmap.
+
+    The arguments are stacked along a new leading axis and func is evaluated once for
+    the whole batch on the CPU and in double precision. This requires a JAX traceable
+    func and arguments that are pytrees of arrays and floats with the same structure.
+    If func cannot be vectorized, the batch evaluator warns and falls back to the
+    joblib_batch_evaluator.
+
+    It can be used wherever a user function is evaluated directly on a batch of
+    params, for example via the batch_evaluator argument of slice_plot. It is not
+    supported in the exploration phase of multistart optimizations. There, estimagic's
+    internal criterion function is evaluated, which converts params, handles errors
+    and logs evaluations and therefore cannot be traced.
+
+    Args:
+        func (Callable): The function that is evaluated.
+        arguments (Iterable): Arguments for the functions. Their interperation
+            depends on the unpack argument.
+        n_cores (int): Only used in the fallback to the joblib_batch_evaluator.
+        error_handling (str): Can take the values "raise" and "continue". Only used in
+            the fallback to the joblib_batch_evaluator. Note that vectorized
+            evaluations do not raise errors for individual arguments but return NaNs.
+        unpack_symbol (str or None). Can be "**", "*" or None. If None, func just takes
+            one argument. If "*", the elements of arguments are positional arguments for
+            func. If "**", the elements of arguments are keyword arguments for func.
+
+
+    Returns:
+        list: The function evaluations.
+
+    """
+    if not IS_JAX_INSTALLED:
+        raise NotImplementedError(
+            "To use the jax_batch_evaluator, install jax with pip install jax."
+        )
+
+    _check_inputs(func, arguments, n_cores, error_handling, unpack_symbol)
+    arguments = list(arguments)
+    if not arguments:
+        return []
+
+    if unpack_symbol == "*":
+        internal_func = lambda args: func(*args)
+    elif unpack_symbol == "**":
+        internal_func = lambda kwargs: func(**kwargs)
+    else:
+        internal_func = func
+
+    try:
+        with enable_x64(), jax.default_device(jax.devices("cpu")[0]):
+            stacked = jax.tree_util.tree_map(
+                lambda *leaves: jnp.stack([jnp.asarray(leaf) for leaf in leaves]),
+                *arguments,
+            )
+            evaluations = jax.jit(jax.vmap(internal_func))(stacked)
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except Exception:
+        warnings.warn(
+            "func could not be vectorized with jax.vmap. Falling back to the "
+            "joblib_batch_evaluator."
+        )
+        return joblib_batch_evaluator(
+            func=func,
+            arguments=arguments,
+            n_cores=n_cores,
+            error_handling=error_handling,
+            unpack_symbol=unpack_symbol,
+        )
+
+    # scalar outputs are returned as python floats, like in the other batch evaluators
+    leaves, treedef = jax.tree_util.tree_flatten(evaluations)
+    leaves = [np.asarray(leaf) for leaf in leaves]
+    res = [
+        jax.tree_util.tree_unflatten(
+            treedef, [leaf[i].item() if leaf.ndim == 1 else leaf[i] for leaf in leaves]
+        )
+        for i in range(len(arguments))
+    ]
+    return res
+
+
 def _check_inputs(func, arguments, n_cores, error_handling, unpack_symbol):
     if not callable(func):
         raise TypeError("func must be callable.")
@@ -166,10 +270,12 @@ def process_batch_evaluator(batch_evaluator="joblib"):
             out = joblib_batch_evaluator
         elif batch_evaluator == "pathos":
             out = pathos_mp_batch_evaluator
+        elif batch_evaluator == "jax":
+            out = jax_batch_evaluator
         else:
             raise ValueError(
-                "Invalid batch evaluator requested. Currently only 'pathos' and "
-                "'joblib' are supported."
+                "Invalid batch evaluator requested. Currently only 'pathos', 'joblib' "
+                "and 'jax' are supported."
             )
     else:
         raise TypeError("batch_evaluator must be a callable or string.")
@@ -1,7 +1,6 @@
 import functools
 import itertools
 import re
-from itertools import product
 from typing import NamedTuple
 
 import numpy as np
@@ -12,13 +11,26 @@ from pybaum import tree_just_flatten as tree_leaves
 from estimagic import batch_evaluators
 from estimagic.config import DEFAULT_N_CORES
 from estimagic.differentiation import finite_differences
-from estimagic.differentiation.generate_steps import generate_steps
+from estimagic.differentiation.generate_steps import Steps, generate_steps
+from estimagic.differentiation.jax_backend import get_jax_derivative_func
 from estimagic.differentiation.richardson_extrapolation import richardson_extrapolation
+from estimagic.differentiation.sparsity import get_column_coloring
 from estimagic.parameters.block_trees import hessian_to_block_tree, matrix_to_block_tree
 from estimagic.parameters.parameter_bounds import get_bounds
 from estimagic.parameters.tree_registry import get_registry
 
 
+# indices of the step directions (0 for pos and 1 for neg) that finite difference
+# formulae of first and second derivatives need
+_DIRECTIONS = {
+    "central": [0, 1],
+    "forward": [0],
+    "backward": [1],
+    "central_average": [0, 1],
+    "central_cross": [0, 1],
+}
+
+
 class Evals(NamedTuple):
     pos: np.ndarray
     neg: np.ndarray
@@ -44,6 +56,12 @@ def first_derivative(
     return_func_value=False,
     return_info=False,
     key=None,
+    sparsity=None,
+    richardson_tolerance=None,
+    chunk_size=None,
+    out=None,
+    staged=False,
+    backend="numpy",
 ):
     """Evaluate first derivative of func at params according to method and step options.
 
@@ -62,7 +80,13 @@ def first_derivative(
         func (callable): Function of which the derivative is calculated.
         params (pytree): A pytree. See :ref:`params`.
         func_kwargs (dict): Additional keyword arguments for func, optional.
-        method (str): One of ["central", "forward", "backward"], default "central".
+        method (str): One of ["central", "forward", "backward", "complex_step"],
+            default "central". "complex_step" evaluates func at complex parameters
+            x + ih e_j and uses Im(f(x + ih e_j)) / h, which is accurate up to machine
+            precision but requires that func propagates complex numbers. For parameters
+            where an evaluation fails or returns no complex output, central
+            differences are used instead. Functions that silently drop imaginary parts
+            (e.g. via np.abs or casts to float) lead to wrong results.
         n_steps (int): Number of steps needed. For central methods, this is
             the number of steps per direction. It is 1 if no Richardson extrapolation
             is used.
@@ -107,6 +131,42 @@ def first_derivative(
             returned if n_steps > 1. Default False.
         key (str): If func returns a dictionary, take the derivative of
             func(params)[key].
+        sparsity (numpy.ndarray, optional): Boolean array of shape (dim_f, dim_x) that
+            is True where the Jacobian of the flattened function output with respect to
+            the flattened params can be nonzero. If provided, structurally orthogonal
+            columns are perturbed together, which can drastically reduce the number of
+            function evaluations. Entries that are False are set to zero.
+        richardson_tolerance (float, optional): If provided and n_steps > 2, Richardson
+            extrapolation is done adaptively. All parameters start with two steps and
+            further steps are only evaluated for parameters where the estimated error
+            of some derivative entry exceeds richardson_tolerance * max(1, abs(entry)).
+            In this case no derivative candidates are returned.
+        chunk_size (int, optional): If provided, the Jacobian is calculated in a
+            memory-bounded streaming mode. At most chunk_size function evaluations
+            are done (and held in memory) at once and each chunk is reduced to its
+            columns of the Jacobian before the next chunk is evaluated. This is useful
+            for functions with very long outputs, e.g. likelihood contributions of many
+            observations. Only available for n_steps=1, without sparsity and complex
+            steps and with return_info=False.
+        out (numpy.ndarray, optional): Preallocated array of shape (dim_f, dim_x) into
+            which the Jacobian of the flattened function output is written in the
+            streaming mode. It can for example be a np.memmap or have dtype np.float32.
+            If out is provided and chunk_size is not, chunk_size defaults to
+            2 * n_cores.
+        staged (bool): If True, the function evaluations are done in stages. First,
+            only the first step of the directions needed by method is evaluated.
+            Points for one-sided fallback formulas are only evaluated for parameters
+            where the preferred formula failed, and further Richardson steps only in
+            directions in which the first step succeeded. For forward and backward
+            differences, mirrored steps are used as fallback. This avoids wasted
+            function evaluations in regions where many evaluations fail, e.g. close to
+            bounds, at the cost of fewer evaluations per batch. Not available with
+            sparsity, complex steps, streaming or adaptive Richardson extrapolation.
+        backend (str): "numpy" (default) to calculate the derivative with finite
+            differences or "jax" to use automatic differentiation in JAX. The jax
+            backend requires a JAX traceable func and params that are pytrees of
+            arrays and floats. It runs on the CPU in double precision and ignores all
+            options that only concern finite differences.
 
     Returns:
         result (dict): Result dictionary with keys:
@@ -130,6 +190,19 @@ def first_derivative(
                 1.
 
     """
+    if backend == "jax":
+        return _jax_derivative(
+            func=func,
+            params=params,
+            order=1,
+            key=key,
+            func_kwargs=func_kwargs,
+            return_func_value=return_func_value,
+            return_info=return_info,
+        )
+    elif backend != "numpy":
+        raise ValueError(f"backend must be 'numpy' or 'jax', not {backend}.")
+
     _is_fast_params = isinstance(params, np.ndarray) and params.ndim == 1
     registry = get_registry(extended=True)
 
@@ -149,6 +222,34 @@ def first_derivative(
     if np.isnan(x).any():
         raise ValueError("The parameter vector must not contain NaNs.")
 
+    if method == "complex_step" and n_steps > 1:
+        raise ValueError(
+            "Richardson extrapolation is not implemented for complex steps. The "
+            "complex step derivative is accurate up to machine precision anyways."
+        )
+
+    is_streaming = chunk_size is not None or out is not None
+    if is_streaming and (
+        n_steps > 1 or method == "complex_step" or sparsity is not None or return_info
+    ):
+        raise ValueError(
+            "chunk_size and out are only supported for n_steps=1, without sparsity "
+            "and complex steps and with return_info=False."
+        )
+    if is_streaming and chunk_size is None:
+        chunk_size = 2 * n_cores
+
+    if staged and (
+        sparsity is not None
+        or method == "complex_step"
+        or is_streaming
+        or richardson_tolerance is not None
+    ):
+        raise ValueError(
+            "staged evaluation is not available with sparsity, complex steps, "
+            "chunk_size, out or richardson_tolerance."
+        )
+
     # generate the step array
     steps = generate_steps(
         x=x,
@@ -162,41 +263,60 @@ def first_derivative(
         step_ratio=step_ratio,
         min_steps=min_steps,
     )
+    if staged:
+        steps = _add_mirrored_steps(steps, x, lower_bounds, upper_bounds)
 
-    # generate parameter vectors at which func has to be evaluated as numpy arrays
-    evaluation_points = []
-    for step_arr in steps:
-        for i, j in product(range(n_steps), range(len(x))):
-            if np.isnan(step_arr[i, j]):
-                evaluation_points.append(np.nan)
-            else:
-                point = x.copy()
-                point[j] += step_arr[i, j]
-                evaluation_points.append(point)
-
-    # convert the numpy arrays to whatever is needed by func
-    if not _is_fast_params:
-        evaluation_points = [
-            # entries are either a numpy.ndarray or np.nan
-            _unflatten_if_not_nan(p, params_treedef, registry)
-            for p in evaluation_points
-        ]
-
-    # we always evaluate f0, so we can fall back to one-sided derivatives if
-    # two-sided derivatives fail. The extra cost is negligible in most cases.
-    if f0 is None:
-        evaluation_points.append(params)
+    # preference order of one-step derivative estimates, given the method
+    orders = {
+        "central": ["central", "forward", "backward"],
+        "forward": ["forward", "backward"],
+        "backward": ["backward", "forward"],
+    }
 
-    # do the function evaluations, including error handling
-    batch_error_handling = "raise" if error_handling == "raise_strict" else "continue"
-    raw_evals = _nan_skipping_batch_evaluator(
+    if sparsity is not None:
+        sparsity = _process_sparsity(sparsity, shape=(None, len(x)))
+        colors = get_column_coloring(sparsity)
+    else:
+        colors = None
+
+    # complex steps move along the imaginary axis
+    is_complex_step = method == "complex_step"
+    evaluation_steps = Steps(*(1j * s for s in steps)) if is_complex_step else steps
+
+    # in the adaptive mode, only the first two steps are evaluated up front
+    is_adaptive = richardson_tolerance is not None and n_steps > 2
+    is_requested = np.full((n_steps, len(x)), True)
+    if is_adaptive:
+        is_requested[2:] = False
+    # in the streaming mode, only f0 is evaluated up front
+    if is_streaming:
+        is_requested[:] = False
+    # in the staged mode, only the first step of the preferred formula is evaluated
+    if staged:
+        is_requested = np.full((2, n_steps, len(x)), False)
+        is_requested[_DIRECTIONS[method], 0] = True
+
+    evaluate = functools.partial(
+        _evaluate_one_step_points,
+        x=x,
+        colors=colors,
+        params_treedef=None if _is_fast_params else params_treedef,
+        registry=registry,
         func=partialed_func,
-        arguments=evaluation_points,
         n_cores=n_cores,
-        error_handling=batch_error_handling,
+        error_handling="raise" if error_handling == "raise_strict" else "continue",
         batch_evaluator=batch_evaluator,
     )
 
+    # do the function evaluations, including error handling. We always evaluate f0, so
+    # we can fall back to one-sided derivatives if two-sided derivatives fail. The
+    # extra cost is negligible in most cases.
+    raw_evals = evaluate(
+        steps=_mask_steps(evaluation_steps, is_requested),
+        extra_arguments=[params] if f0 is None else [],
+        **({"error_handling": "continue"} if is_complex_step else {}),
+    )
+
     # extract information on exceptions that occurred during function evaluations
     exc_info = "\n\n".join([val for val in raw_evals if isinstance(val, str)])
     raw_evals = [val if not isinstance(val, str) else np.nan for val in raw_evals]
@@ -221,40 +341,159 @@ def first_derivative(
         f0 = tree_leaves(f0_tree, registry=registry)
         f0 = np.array(f0, dtype=np.float64)
 
-    # convert the raw evaluations to numpy arrays
-    raw_evals = _convert_evals_to_numpy(
-        raw_evals=raw_evals,
+    # functions that do not propagate complex numbers cannot be differentiated with
+    # complex steps. Their evaluations are treated like failed evaluations.
+    if is_complex_step:
+        raw_evals = [
+            val if _is_complex_output(val, key, registry) else np.nan
+            for val in raw_evals
+        ]
+
+    # convert the raw evaluations to a numpy array of shape (2, n_steps, dim_f, dim_x)
+    to_array = functools.partial(
+        _one_step_evals_to_array,
+        steps=steps,
         key=key,
         registry=registry,
         is_scalar_out=scalar_out,
         is_vector_out=vector_out,
+        colors=colors,
+        sparsity=sparsity,
+        f0=f0,
     )
+    if not is_streaming:
+        evals = to_array(
+            raw_evals,
+            is_requested=is_requested,
+            dtype=complex if is_complex_step else float,
+        )
 
-    # apply finite difference formulae
-    evals = np.array(raw_evals).reshape(2, n_steps, len(x), -1)
-    evals = np.transpose(evals, axes=(0, 1, 3, 2))
-    evals = Evals(pos=evals[0], neg=evals[1])
+    if staged:
+        evals, staged_exc_info = _evaluate_staged_one_step_points(
+            evals=evals,
+            is_evaluated=is_requested,
+            evaluate=evaluate,
+            to_array=to_array,
+            steps=steps,
+            preference_order=orders[method],
+        )
+        exc_info = "\n\n".join([exc_info, staged_exc_info]).strip()
+
+    if is_streaming:
+        if out is None:
+            out = np.empty((len(f0), len(x)))
+        elif out.shape != (len(f0), len(x)):
+            raise ValueError(
+                f"out must have shape {(len(f0), len(x))} but has shape {out.shape}."
+            )
 
-    jac_candidates = {}
-    for m in ["forward", "backward", "central"]:
-        jac_candidates[m] = finite_differences.jacobian(evals, steps, f0, m)
+        jac, streaming_exc_info = _stream_one_step_jacobian(
+            evaluate=evaluate,
+            to_numpy=functools.partial(
+                _convert_evals_to_numpy,
+                key=key,
+                registry=registry,
+                is_scalar_out=scalar_out,
+                is_vector_out=vector_out,
+            ),
+            steps=steps,
+            f0=f0,
+            preference_order=orders[method],
+            chunk_size=chunk_size,
+            out=out,
+        )
+        exc_info = "\n\n".join([exc_info, streaming_exc_info]).strip()
+        updated_candidates = None
+    elif is_adaptive:
+        # evaluate further steps only for parameters whose error estimate is too large
+        n_evaluated = 2
+        jac = np.full((len(f0), len(x)), np.nan)
+        active = np.arange(len(x))
+        while True:
+            jac[:, active], error = _extrapolate_columns(
+                evals, steps, f0, n_evaluated, active
+            )
+            tolerance = richardson_tolerance * np.maximum(np.abs(jac[:, active]), 1)
+            active = active[~(error <= tolerance).all(axis=0)]
+            if len(active) == 0 or n_evaluated == n_steps:
+                break
+
+            is_requested = np.full((n_steps, len(x)), False)
+            is_requested[n_evaluated, active] = True
+            raw_evals = evaluate(steps=_mask_steps(steps, is_requested))
+            exc_info = "\n\n".join(
+                [exc_info] + [val for val in raw_evals if isinstance(val, str)]
+            ).strip()
+            raw_evals = [
+                val if not isinstance(val, str) else np.nan for val in raw_evals
+            ]
+            new_evals = to_array(raw_evals, is_requested=is_requested)
+            evals = np.where(is_requested[:, np.newaxis], new_evals, evals)
+            n_evaluated += 1
+
+        evals = Evals(pos=evals[0], neg=evals[1])
+        updated_candidates = None
+    elif is_complex_step:
+        evals = Evals(pos=evals[0], neg=evals[1])
+        jac = finite_differences.jacobian(evals, steps, f0, "complex_step")[0]
+        updated_candidates = None
 
-    # get the best derivative estimate out of all derivative estimates that could be
-    # calculated, given the function evaluations.
-    orders = {
-        "central": ["central", "forward", "backward"],
-        "forward": ["forward", "backward"],
-        "backward": ["backward", "forward"],
-    }
+        # fall back to central differences for parameters without a complex step
+        # derivative estimate
+        needs_fallback = np.isnan(jac).any(axis=0)
+        if needs_fallback.any():
+            fallback_steps = generate_steps(
+                x=x,
+                method="central",
+                n_steps=1,
+                target="first_derivative",
+                base_steps=None,
+                scaling_factor=scaling_factor,
+                lower_bounds=lower_bounds,
+                upper_bounds=upper_bounds,
+                step_ratio=step_ratio,
+                min_steps=None,
+            )
+            is_requested = needs_fallback.reshape(1, -1)
+            raw_evals = evaluate(steps=_mask_steps(fallback_steps, is_requested))
+            exc_info = "\n\n".join(
+                [exc_info] + [val for val in raw_evals if isinstance(val, str)]
+            ).strip()
+            raw_evals = [
+                val if not isinstance(val, str) else np.nan for val in raw_evals
+            ]
+            fallback_evals = to_array(
+                raw_evals, steps=fallback_steps, is_requested=is_requested
+            )
+            fallback_evals = Evals(pos=fallback_evals[0], neg=fallback_evals[1])
+            fallback_candidates = {
+                m: finite_differences.jacobian(fallback_evals, fallback_steps, f0, m)
+                for m in ["central", "forward", "backward"]
+            }
+            fallback_jac = _consolidate_one_step_derivatives(
+                fallback_candidates, ["central", "forward", "backward"]
+            )
+            jac[:, needs_fallback] = fallback_jac[:, needs_fallback]
 
-    if n_steps == 1:
-        jac = _consolidate_one_step_derivatives(jac_candidates, orders[method])
-        updated_candidates = None
+        # only the imaginary parts of the evaluations carry derivative information
+        evals = Evals(pos=evals.pos.imag, neg=evals.neg.imag)
     else:
-        richardson_candidates = _compute_richardson_candidates(
-            jac_candidates, steps, n_steps
-        )
-        jac, updated_candidates = _consolidate_extrapolated(richardson_candidates)
+        # apply finite difference formulae
+        evals = Evals(pos=evals[0], neg=evals[1])
+        jac_candidates = {}
+        for m in ["forward", "backward", "central"]:
+            jac_candidates[m] = finite_differences.jacobian(evals, steps, f0, m)
+
+        # get the best derivative estimate out of all derivative estimates that could
+        # be calculated, given the function evaluations.
+        if n_steps == 1:
+            jac = _consolidate_one_step_derivatives(jac_candidates, orders[method])
+            updated_candidates = None
+        else:
+            richardson_candidates = _compute_richardson_candidates(
+                jac_candidates, steps, n_steps
+            )
+            jac, updated_candidates = _consolidate_extrapolated(richardson_candidates)
 
     # raise error if necessary
     if error_handling in ("raise", "raise_strict") and np.isnan(jac).any():
@@ -299,6 +538,9 @@ def second_derivative(
     return_func_value=False,
     return_info=False,
     key=None,
+    sparsity=None,
+    staged=False,
+    backend="numpy",
 ):
     """Evaluate second derivative of func at params according to method and step
     options.
@@ -375,6 +617,22 @@ def second_derivative(
             returned if n_steps > 1. Default False.
         key (str): If func returns a dictionary, take the derivative of
             func(params)[key].
+        sparsity (numpy.ndarray, optional): Boolean array of shape (dim_x, dim_x) that
+            is True where the Hessian with respect to the flattened params can be
+            nonzero. If provided, evaluations that are only needed for structurally
+            zero entries are skipped and those entries are set to zero.
+        staged (bool): If True, the function evaluations are done in stages. First,
+            only the points needed by method are evaluated. Points for fallback
+            formulas are only evaluated for entries where all preferred formulas
+            failed and that do not depend on evaluations that already failed. For
+            forward and backward differences, mirrored steps are used as fallback.
+            This avoids wasted function evaluations in regions where many evaluations
+            fail, e.g. close to bounds.
+        backend (str): "numpy" (default) to calculate the derivative with finite
+            differences or "jax" to use automatic differentiation in JAX. The jax
+            backend requires a JAX traceable func and params that are pytrees of
+            arrays and floats. It runs on the CPU in double precision and ignores all
+            options that only concern finite differences.
 
     Returns:
         result (dict): Result dictionary with keys:
@@ -407,6 +665,20 @@ def second_derivative(
                 returned if return_info is True.
 
     """
+    if backend == "jax":
+        return _jax_derivative(
+            func=func,
+            params=params,
+            order=2,
+            key=key,
+            func_kwargs=func_kwargs,
+            return_func_value=return_func_value,
+            return_info=return_info,
+        )
+    elif backend != "numpy":
+        raise ValueError(f"backend must be 'numpy' or 'jax', not {backend}.")
+
+    _is_fast_params = isinstance(params, np.ndarray) and params.ndim == 1
     lower_bounds, upper_bounds = get_bounds(params, lower_bounds, upper_bounds)
 
     # handle keyword arguments
@@ -415,8 +687,11 @@ def second_derivative(
 
     # convert params to numpy
     registry = get_registry(extended=True)
-    x, params_treedef = tree_flatten(params, registry=registry)
-    x = np.atleast_1d(x).astype(np.float64)
+    if not _is_fast_params:
+        x, params_treedef = tree_flatten(params, registry=registry)
+        x = np.atleast_1d(x).astype(np.float64)
+    else:
+        x = params.astype(float)
 
     if np.isnan(x).any():
         raise ValueError("The parameter vector must not contain NaNs.")
@@ -425,6 +700,9 @@ def second_derivative(
     if method not in implemented_methods:
         raise ValueError(f"Method has to be in {implemented_methods}.")
 
+    if sparsity is not None:
+        sparsity = _process_sparsity(sparsity, shape=(len(x), len(x)))
+
     # generate the step array
     steps = generate_steps(
         x=x,
@@ -439,94 +717,94 @@ def second_derivative(
         min_steps=min_steps,
     )
 
-    # generate parameter vectors at which func has to be evaluated as numpy arrays
-    evaluation_points = {"one_step": [], "two_step": [], "cross_step": []}
-    for step_arr in steps:
-        # single direction steps
-        for i, j in product(range(n_steps), range(len(x))):
-            if np.isnan(step_arr[i, j]):
-                evaluation_points["one_step"].append(np.nan)
-            else:
-                point = x.copy()
-                point[j] += step_arr[i, j]
-                evaluation_points["one_step"].append(point)
-        # two and cross direction steps
-        for i, j, k in product(range(n_steps), range(len(x)), range(len(x))):
-            if j > k or np.isnan(step_arr[i, j]) or np.isnan(step_arr[i, k]):
-                evaluation_points["two_step"].append(np.nan)
-                evaluation_points["cross_step"].append(np.nan)
-            else:
-                point = x.copy()
-                point[j] += step_arr[i, j]
-                point[k] += step_arr[i, k]
-                evaluation_points["two_step"].append(point)
-                if j == k:
-                    evaluation_points["cross_step"].append(np.nan)
-                else:
-                    point = x.copy()
-                    point[j] += step_arr[i, j]
-                    point[k] -= step_arr[i, k]
-                    evaluation_points["cross_step"].append(point)
-
-    # convert the numpy arrays to whatever is needed by func
-    evaluation_points = {
-        # entries are either a numpy.ndarray or np.nan, we unflatten only
-        step_type: [_unflatten_if_not_nan(p, params_treedef, registry) for p in points]
-        for step_type, points in evaluation_points.items()
-    }
+    if staged:
+        steps = _add_mirrored_steps(steps, x, lower_bounds, upper_bounds)
 
-    # we always evaluate f0, so we can fall back to one-sided derivatives if
-    # two-sided derivatives fail. The extra cost is negligible in most cases.
-    if f0 is None:
-        evaluation_points["one_step"].append(params)
+    # preference order of hessian estimates, given the method
+    orders = {
+        "central_cross": ["central_cross", "central_average", "forward", "backward"],
+        "central_average": ["central_average", "central_cross", "forward", "backward"],
+        "forward": ["forward", "backward", "central_average", "central_cross"],
+        "backward": ["backward", "forward", "central_average", "central_cross"],
+    }
 
-    # do the function evaluations for one and two step, including error handling
+    # generate parameter vectors at which func has to be evaluated as numpy arrays and
+    # convert them to whatever is needed by func. Points that belong to NaN steps or to
+    # the redundant lower triangle are represented by np.nan and are not unflattened.
     batch_error_handling = "raise" if error_handling == "raise_strict" else "continue"
-    raw_evals = _nan_skipping_batch_evaluator(
+    evaluate = functools.partial(
+        _evaluate_two_step_points,
+        x=x,
+        steps=steps,
+        sparsity=sparsity,
+        params_treedef=None if _is_fast_params else params_treedef,
+        registry=registry,
         func=partialed_func,
-        arguments=list(itertools.chain.from_iterable(evaluation_points.values())),
         n_cores=n_cores,
         error_handling=batch_error_handling,
         batch_evaluator=batch_evaluator,
     )
 
-    # extract information on exceptions that occurred during function evaluations
-    exc_info = "\n\n".join([val for val in raw_evals if isinstance(val, str)])
-    raw_evals = [val if not isinstance(val, str) else np.nan for val in raw_evals]
+    # in the staged mode, only the points of the preferred formula are evaluated first
+    if staged:
+        entries = np.triu(np.full((len(x), len(x)), True))
+        if sparsity is not None:
+            entries &= sparsity | sparsity.T
+        masks = _get_hessian_masks(orders[method][0], entries, n_steps)
+    else:
+        masks = None
+
+    # do the function evaluations for one and two step, including error handling. We
+    # always evaluate f0, so we can fall back to one-sided derivatives if two-sided
+    # derivatives fail. The extra cost is negligible in most cases.
+    raw_evals, extra_evals = evaluate(
+        masks=masks, extra_arguments=[params] if f0 is None else []
+    )
 
-    n_one_step, n_two_step, n_cross_step = map(len, evaluation_points.values())
+    # extract information on exceptions that occurred during function evaluations
+    all_evals = itertools.chain(*raw_evals.values(), extra_evals)
+    exc_info = "\n\n".join([val for val in all_evals if isinstance(val, str)])
     raw_evals = {
-        "one_step": raw_evals[:n_one_step],
-        "two_step": raw_evals[n_one_step : n_two_step + n_one_step],
-        "cross_step": raw_evals[n_two_step + n_one_step :],
+        step_type: [val if not isinstance(val, str) else np.nan for val in evals]
+        for step_type, evals in raw_evals.items()
     }
 
     # store full function value at params as func_value and a processed version of it
     # that we need to calculate derivatives as f0
     if f0 is None:
-        f0 = raw_evals["one_step"][-1]
-        raw_evals["one_step"] = raw_evals["one_step"][:-1]
+        f0 = extra_evals[0] if not isinstance(extra_evals[0], str) else np.nan
     func_value = f0
 
     f0_tree = f0[key] if key is not None and isinstance(f0, dict) else f0
     f0 = tree_leaves(f0_tree, registry=registry)
     f0 = np.array(f0, dtype=np.float64)
 
-    # convert the raw evaluations to numpy arrays
-    raw_evals = {
-        step_type: _convert_evals_to_numpy(evals, key, registry)
-        for step_type, evals in raw_evals.items()
-    }
-
-    # reshape arrays into dimension (n_steps, dim_f, dim_x) or (n_steps, dim_f, dim_x,
-    # dim_x) for finite differences
-    evals = {}
-    evals["one_step"] = _reshape_one_step_evals(raw_evals["one_step"], n_steps, len(x))
-    evals["two_step"] = _reshape_two_step_evals(raw_evals["two_step"], n_steps, len(x))
-    evals["cross_step"] = _reshape_cross_step_evals(
-        raw_evals["cross_step"], n_steps, len(x), f0
+    # convert the raw evaluations to numpy arrays of dimension (n_steps, dim_f, dim_x)
+    # or (n_steps, dim_f, dim_x, dim_x) for finite differences
+    to_evals = functools.partial(
+        _two_step_evals_to_arrays,
+        key=key,
+        registry=registry,
+        n_steps=n_steps,
+        dim_x=len(x),
+        f0=f0,
     )
 
+    if staged:
+        raw_evals, staged_exc_info = _evaluate_staged_two_step_points(
+            raw_evals=raw_evals,
+            is_evaluated=masks,
+            evaluate=evaluate,
+            to_evals=to_evals,
+            steps=steps,
+            f0=f0,
+            preference_order=orders[method],
+            entries=entries,
+        )
+        exc_info = "\n\n".join([exc_info, staged_exc_info]).strip()
+
+    evals = to_evals(raw_evals)
+
     # apply finite difference formulae
     hess_candidates = {}
     for m in ["forward", "backward", "central_average", "central_cross"]:
@@ -534,15 +812,10 @@ def second_derivative(
 
     # get the best derivative estimate out of all derivative estimates that could be
     # calculated, given the function evaluations.
-    orders = {
-        "central_cross": ["central_cross", "central_average", "forward", "backward"],
-        "central_average": ["central_average", "central_cross", "forward", "backward"],
-        "forward": ["forward", "backward", "central_average", "central_cross"],
-        "backward": ["backward", "forward", "central_average", "central_cross"],
-    }
-
     if n_steps == 1:
         hess = _consolidate_one_step_derivatives(hess_candidates, orders[method])
+        if sparsity is not None:
+            hess = np.where(sparsity, hess, 0.0)
         updated_candidates = None
     else:
         raise ValueError(
@@ -721,13 +994,13 @@ def _convert_richardson_candidates_to_frame(jac, err):
 
 
 def _convert_evals_to_numpy(
-    raw_evals, key, registry, is_scalar_out=False, is_vector_out=False
+    raw_evals, key, registry, is_scalar_out=False, is_vector_out=False, dtype=float
 ):
     """Harmonize the output of the function evaluations.
 
     The raw_evals might contain dictionaries of which we only need one entry, scalar
     np.nan where we need arrays filled with np.nan or pandas objects. The processed
-    evals only contain numpy arrays.
+    evals only contain numpy arrays of the requested dtype.
 
     """
     # get rid of dictionaries
@@ -739,16 +1012,16 @@ def _convert_evals_to_numpy(
     # convert pytrees to arrays
     if is_scalar_out:
         evals = [
-            np.array([val], dtype=float) if not _is_scalar_nan(val) else val
+            np.array([val], dtype=dtype) if not _is_scalar_nan(val) else val
             for val in evals
         ]
 
     elif is_vector_out:
-        evals = [val.astype(float) if not _is_scalar_nan(val) else val for val in evals]
+        evals = [val.astype(dtype) if not _is_scalar_nan(val) else val for val in evals]
     else:
         evals = [
             (
-                np.array(tree_leaves(val, registry=registry), dtype=np.float64)
+                np.array(tree_leaves(val, registry=registry), dtype=dtype)
                 if not _is_scalar_nan(val)
                 else val
             )
@@ -902,10 +1175,12 @@ def _select_minimizer_along_axis(derivative, errors):
         jac_minimal = np.squeeze(derivative, axis=0)
         error_minimal = np.squeeze(errors, axis=0)
     else:
-        minimizer = np.nanargmin(errors, axis=0)
+        # entries without any valid error estimate stay NaN
+        minimizer = np.argmin(np.where(np.isnan(errors), np.inf, errors), axis=0)
         jac_minimal = np.take_along_axis(derivative, minimizer[np.newaxis, :], axis=0)
         jac_minimal = np.squeeze(jac_minimal, axis=0)
-        error_minimal = np.nanmin(errors, axis=0)
+        error_minimal = np.take_along_axis(errors, minimizer[np.newaxis, :], axis=0)
+        error_minimal = np.squeeze(error_minimal, axis=0)
 
     return jac_minimal, error_minimal
 
@@ -1001,13 +1276,739 @@ def _collect_additional_info(steps, evals, updated_candidates, target):
     return info
 
 
+def _is_complex_output(value, key, registry):
+    """Check whether an evaluation has complex entries."""
+    if _is_scalar_nan(value):
+        return True
+    if isinstance(value, dict) and key is not None:
+        value = value[key]
+    leaves = tree_leaves(value, registry=registry)
+    return any(np.iscomplexobj(leaf) for leaf in leaves)
+
+
 def _is_scalar_nan(value):
     return isinstance(value, float) and np.isnan(value)
 
 
-def _unflatten_if_not_nan(leaves, treedef, registry):
-    if isinstance(leaves, np.ndarray):
-        out = tree_unflatten(treedef, leaves, registry=registry)
+def _get_one_step_points(x, steps):
+    """Generate the evaluation points that differ from x in one dimension.
+
+    Args:
+        x (np.ndarray): 1d array with parameters.
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (n_steps, len(x)).
+
+    Returns:
+        points (np.ndarray): 2d array where each row is a parameter vector
+            x + steps[sign][i, j] e_j. Only points with non-NaN steps are included.
+        positions (np.ndarray): 1d array with the flat position of each point in an
+            array of shape (2, n_steps, len(x)).
+
+    """
+    step_arr = np.stack(steps)
+    positions = np.flatnonzero(~np.isnan(step_arr))
+    *_, j = np.unravel_index(positions, step_arr.shape)
+
+    points = np.tile(x.astype(np.result_type(x, step_arr)), (len(positions), 1))
+    points[np.arange(len(positions)), j] += step_arr.ravel()[positions]
+    return points, positions
+
+
+def _get_two_step_points(x, steps, cross, sparsity=None, mask=None):
+    """Generate the evaluation points that differ from x in two dimensions.
+
+    Only points with j <= k (j < k for cross steps) are generated because the other
+    evaluations follow from symmetry. If a sparsity pattern is provided, points that
+    are only needed for structurally zero entries of the Hessian are skipped. If a mask
+    is provided, only points where the mask is True are generated.
+
+    Args:
+        x (np.ndarray): 1d array with parameters.
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (n_steps, len(x)).
+        cross (bool): If True, the step in dimension k is subtracted instead of added.
+        sparsity (np.ndarray, optional): Boolean array of shape (len(x), len(x)) that
+            is True where the Hessian can be nonzero.
+        mask (np.ndarray, optional): Boolean array of shape (2, n_steps, len(x), len(x))
+            that is True for the points that are generated.
+
+    Returns:
+        points (np.ndarray): 2d array where each row is a parameter vector
+            x + steps[sign][i, j] e_j +/- steps[sign][i, k] e_k. Only points with
+            non-NaN steps are included.
+        positions (np.ndarray): 1d array with the flat position of each point in an
+            array of shape (2, n_steps, len(x), len(x)).
+
+    """
+    step_arr = np.stack(steps)
+    dim_x = len(x)
+    j, k = np.triu_indices(dim_x, k=1 if cross else 0)
+    if sparsity is not None:
+        is_structural_nonzero = sparsity[j, k] | sparsity[k, j]
+        j, k = j[is_structural_nonzero], k[is_structural_nonzero]
+    is_valid = ~np.isnan(step_arr[..., j]) & ~np.isnan(step_arr[..., k])
+    if mask is not None:
+        is_valid &= mask[..., j, k]
+    sign_idx, step_idx, pair_idx = np.nonzero(is_valid)
+    j, k = j[pair_idx], k[pair_idx]
+
+    points = np.tile(x, (len(pair_idx), 1))
+    rows = np.arange(len(pair_idx))
+    points[rows, j] += step_arr[sign_idx, step_idx, j]
+    if cross:
+        points[rows, k] -= step_arr[sign_idx, step_idx, k]
+    else:
+        points[rows, k] += step_arr[sign_idx, step_idx, k]
+
+    positions = np.ravel_multi_index(
+        (sign_idx, step_idx, j, k), step_arr.shape + (dim_x,)
+    )
+    return points, positions
+
+
+def _mask_steps(steps, mask):
+    """Set all steps where mask is False to NaN.
+
+    The mask is broadcast against an array of shape (2, n_steps, dim_x), i.e. it can
+    either be the same for both directions or differ between them.
+
+    """
+    return Steps(*np.where(mask, np.stack(steps), np.nan))
+
+
+def _add_mirrored_steps(steps, x, lower_bounds, upper_bounds):
+    """Fill the missing direction of one-sided steps with mirrored steps.
+
+    Mirrored steps that would violate the bounds are NaN.
+
+    """
+    if np.isnan(steps.neg).all():
+        neg = np.where(x - steps.pos >= lower_bounds, -steps.pos, np.nan)
+        steps = Steps(pos=steps.pos, neg=neg)
+    elif np.isnan(steps.pos).all():
+        pos = np.where(x - steps.neg <= upper_bounds, -steps.neg, np.nan)
+        steps = Steps(pos=pos, neg=steps.neg)
+    return steps
+
+
+def _evaluate_one_step_points(
+    steps,
+    x,
+    colors,
+    params_treedef,
+    registry,
+    func,
+    n_cores,
+    error_handling,
+    batch_evaluator,
+    extra_arguments=(),
+):
+    """Evaluate func at all points that belong to a non-NaN step.
+
+    Args:
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (n_steps, len(x)).
+        x (np.ndarray): 1d array with parameters.
+        colors (np.ndarray or None): 1d integer array with the color of each parameter
+            or None if all parameters are perturbed separately.
+        params_treedef: Treedef of the user provided params or None if func is
+            evaluated at flat parameter vectors.
+        registry (dict): pybaum registry.
+        func (callable): The function to evaluate.
+        n_cores (int): Number of processes.
+        error_handling (str): Error handling of the batch evaluator.
+        batch_evaluator (str or callable): The batch evaluator.
+        extra_arguments (list): Additional arguments at which func is evaluated.
+
+    Returns:
+        list: Evaluations in the order (2, n_steps, len(x)) or (2, n_steps, n_colors)
+            with np.nan for points that were not evaluated, followed by the evaluations
+            at extra_arguments.
+
+    """
+    n_steps = steps.pos.shape[0]
+    if colors is None:
+        points, positions = _get_one_step_points(x, steps)
+        n_points = 2 * n_steps * len(x)
+    else:
+        points, positions = _get_colored_points(x, steps, colors)
+        n_points = 2 * n_steps * (colors.max(initial=-1) + 1)
+
+    evaluation_points = _place_evaluation_points(
+        points=points,
+        positions=positions,
+        n_points=n_points,
+        params_treedef=params_treedef,
+        registry=registry,
+    )
+
+    raw_evals = _nan_skipping_batch_evaluator(
+        func=func,
+        arguments=evaluation_points + list(extra_arguments),
+        n_cores=n_cores,
+        error_handling=error_handling,
+        batch_evaluator=batch_evaluator,
+    )
+    return raw_evals
+
+
+def _one_step_evals_to_array(
+    raw_evals,
+    steps,
+    key,
+    registry,
+    is_scalar_out,
+    is_vector_out,
+    colors,
+    sparsity,
+    f0,
+    is_requested,
+    dtype=float,
+):
+    """Convert raw one-step evaluations to an array of shape (2, n_steps, dim_f, dim_x).
+
+    Entries that belong to steps which were not requested are NaN.
+
+    """
+    evals = _convert_evals_to_numpy(
+        raw_evals=raw_evals,
+        key=key,
+        registry=registry,
+        is_scalar_out=is_scalar_out,
+        is_vector_out=is_vector_out,
+        dtype=dtype,
+    )
+    # if all evaluations failed, their shape could not be inferred from them
+    evals = [
+        val if val.shape == f0.shape else np.full(f0.shape, np.nan) for val in evals
+    ]
+    n_steps, dim_x = steps.pos.shape
+    if colors is None:
+        evals = np.array(evals).reshape(2, n_steps, dim_x, -1)
+        evals = np.transpose(evals, axes=(0, 1, 3, 2))
+    else:
+        masked_steps = _mask_steps(steps, is_requested)
+        evals = _decompress_colored_evals(evals, masked_steps, colors, sparsity, f0)
+    return evals
+
+
+def _jax_derivative(
+    func, params, order, key, func_kwargs, return_func_value, return_info
+):
+    """Calculate a first or second derivative with the jax backend."""
+    if return_info:
+        raise ValueError("return_info is not supported with the jax backend.")
+
+    derivative_and_func_value = get_jax_derivative_func(
+        func, params, order=order, key=key, func_kwargs=func_kwargs
+    )
+    derivative, func_value = derivative_and_func_value(params)
+
+    result = {"derivative": derivative}
+    if return_func_value:
+        result["func_value"] = func_value
+    return result
+
+
+def _evaluate_staged_one_step_points(
+    evals, is_evaluated, evaluate, to_array, steps, preference_order
+):
+    """Evaluate fallback points and further Richardson steps where they are useful.
+
+    Args:
+        evals (np.ndarray): Array of shape (2, n_steps, dim_f, dim_x) with the
+            evaluations of the first stage.
+        is_evaluated (np.ndarray): Boolean array of shape (2, n_steps, dim_x) that is
+            True for the steps that were evaluated in the first stage.
+        evaluate (callable): Function that evaluates func at all points that belong to
+            non-NaN steps and returns a list in the order (2, n_steps, dim_x).
+        to_array (callable): Function that converts a list of raw evaluations to an
+            array of shape (2, n_steps, dim_f, dim_x).
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (n_steps, dim_x).
+        preference_order (list): Order of finite difference methods. Earlier entries
+            are preferred.
+
+    Returns:
+        evals (np.ndarray): Array of shape (2, n_steps, dim_f, dim_x) with all
+            evaluations.
+        exc_info (str): Information on exceptions that occurred during function
+            evaluations.
+
+    """
+    is_evaluated = is_evaluated.copy()
+    has_step = ~np.isnan(np.stack(steps))
+    exc_info = []
+
+    def evaluate_and_merge(evals, is_requested):
+        raw_evals = evaluate(steps=_mask_steps(steps, is_requested))
+        exc_info.extend([val for val in raw_evals if isinstance(val, str)])
+        raw_evals = [val if not isinstance(val, str) else np.nan for val in raw_evals]
+        new_evals = to_array(raw_evals, is_requested=is_requested)
+        return np.where(is_requested[:, :, np.newaxis], new_evals, evals)
+
+    # evaluate the first step of fallback formulas where all preferred formulas failed
+    for i, method in enumerate(preference_order[1:], start=1):
+        directions = _DIRECTIONS[method]
+        succeeded = is_evaluated[:, 0] & ~np.isnan(evals[:, 0]).any(axis=1)
+        is_solved = np.zeros(len(has_step[0, 0]), dtype=bool)
+        for earlier in preference_order[:i]:
+            is_solved |= succeeded[_DIRECTIONS[earlier]].all(axis=0)
+
+        has_failed = is_evaluated[directions, 0] & ~succeeded[directions]
+        is_feasible = (has_step[directions, 0] & ~has_failed).all(axis=0)
+
+        is_requested = np.full_like(is_evaluated, False)
+        is_requested[directions, 0] = ~is_solved & is_feasible
+        is_requested &= ~is_evaluated
+        if is_requested.any():
+            evals = evaluate_and_merge(evals, is_requested)
+            is_evaluated |= is_requested
+
+    # evaluate further steps only in directions in which the first step succeeded
+    if is_evaluated.shape[1] > 1:
+        succeeded = is_evaluated[:, 0] & ~np.isnan(evals[:, 0]).any(axis=1)
+        is_requested = np.full_like(is_evaluated, False)
+        is_requested[:, 1:] = succeeded[:, np.newaxis] & has_step[:, 1:]
+        if is_requested.any():
+            evals = evaluate_and_merge(evals, is_requested)
+
+    return evals, "\n\n".join(exc_info)
+
+
+def _evaluate_two_step_points(
+    masks,
+    x,
+    steps,
+    sparsity,
+    params_treedef,
+    registry,
+    func,
+    n_cores,
+    error_handling,
+    batch_evaluator,
+    extra_arguments=(),
+):
+    """Evaluate func at the one, two and cross step points of a second derivative.
+
+    Args:
+        masks (dict or None): Dictionary with the keys "one_step", "two_step" and
+            "cross_step" and boolean arrays of shape (2, n_steps, dim_x) or
+            (2, n_steps, dim_x, dim_x) that are True for the points that are evaluated.
+            If None, all points that belong to non-NaN steps are evaluated.
+        x (np.ndarray): 1d array with parameters.
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (n_steps, dim_x).
+        sparsity (np.ndarray or None): Boolean array of shape (dim_x, dim_x) that is
+            True where the Hessian can be nonzero.
+        params_treedef: Treedef of the user provided params or None if func is
+            evaluated at flat parameter vectors.
+        registry (dict): pybaum registry.
+        func (callable): The function to evaluate.
+        n_cores (int): Number of processes.
+        error_handling (str): Error handling of the batch evaluator.
+        batch_evaluator (str or callable): The batch evaluator.
+        extra_arguments (list): Additional arguments at which func is evaluated.
+
+    Returns:
+        raw_evals (dict): Dictionary with the keys "one_step", "two_step" and
+            "cross_step" and lists of evaluations in the order of the flattened masks
+            with np.nan for points that were not evaluated.
+        extra_evals (list): The evaluations at extra_arguments.
+
+    """
+    masks = {} if masks is None else masks
+    n_steps, dim_x = steps.pos.shape
+
+    one_step_steps = (
+        steps if "one_step" not in masks else _mask_steps(steps, masks["one_step"])
+    )
+    n_points = {
+        "one_step": 2 * n_steps * dim_x,
+        "two_step": 2 * n_steps * dim_x**2,
+        "cross_step": 2 * n_steps * dim_x**2,
+    }
+    raw_points = {
+        "one_step": _get_one_step_points(x, one_step_steps),
+        "two_step": _get_two_step_points(
+            x, steps, cross=False, sparsity=sparsity, mask=masks.get("two_step")
+        ),
+        "cross_step": _get_two_step_points(
+            x, steps, cross=True, sparsity=sparsity, mask=masks.get("cross_step")
+        ),
+    }
+    evaluation_points = {
+        step_type: _place_evaluation_points(
+            points=points,
+            positions=positions,
+            n_points=n_points[step_type],
+            params_treedef=params_treedef,
+            registry=registry,
+        )
+        for step_type, (points, positions) in raw_points.items()
+    }
+
+    evals = _nan_skipping_batch_evaluator(
+        func=func,
+        arguments=list(itertools.chain(*evaluation_points.values(), extra_arguments)),
+        n_cores=n_cores,
+        error_handling=error_handling,
+        batch_evaluator=batch_evaluator,
+    )
+
+    raw_evals = {}
+    start = 0
+    for step_type, n in n_points.items():
+        raw_evals[step_type] = evals[start : start + n]
+        start += n
+    return raw_evals, evals[start:]
+
+
+def _two_step_evals_to_arrays(raw_evals, key, registry, n_steps, dim_x, f0):
+    """Convert raw evaluations of a second derivative to arrays.
+
+    Returns:
+        dict: Dictionary with the keys "one_step", "two_step" and "cross_step". Each
+            entry is a namedtuple with the fields pos and neg, containing arrays of
+            shape (n_steps, dim_f, dim_x) or (n_steps, dim_f, dim_x, dim_x).
+
+    """
+    arrays = {}
+    for step_type, step_type_evals in raw_evals.items():
+        converted = _convert_evals_to_numpy(step_type_evals, key, registry)
+        # if no evaluation succeeded, the output shape could not be inferred
+        arrays[step_type] = [
+            val if val.shape == f0.shape else np.full(f0.shape, np.nan)
+            for val in converted
+        ]
+
+    evals = {}
+    evals["one_step"] = _reshape_one_step_evals(arrays["one_step"], n_steps, dim_x)
+    evals["two_step"] = _reshape_two_step_evals(arrays["two_step"], n_steps, dim_x)
+    evals["cross_step"] = _reshape_cross_step_evals(
+        arrays["cross_step"], n_steps, dim_x, f0
+    )
+    return evals
+
+
+def _get_hessian_masks(method, entries, n_steps):
+    """Get the points a Hessian formula needs for the first step and given entries.
+
+    Args:
+        method (str): One of {"forward", "backward", "central_average",
+            "central_cross"}.
+        entries (np.ndarray): Upper triangular boolean array of shape (dim_x, dim_x)
+            that is True for the requested entries of the Hessian.
+        n_steps (int): Number of steps.
+
+    Returns:
+        dict: Dictionary with the keys "one_step", "two_step" and "cross_step" and
+            boolean arrays of shape (2, n_steps, dim_x) or (2, n_steps, dim_x, dim_x).
+
+    """
+    dim_x = len(entries)
+    masks = {
+        "one_step": np.full((2, n_steps, dim_x), False),
+        "two_step": np.full((2, n_steps, dim_x, dim_x), False),
+        "cross_step": np.full((2, n_steps, dim_x, dim_x), False),
+    }
+    for direction in _DIRECTIONS[method]:
+        masks["two_step"][direction, 0] = entries
+        if method == "central_cross":
+            masks["cross_step"][direction, 0] = np.triu(entries, k=1)
+        else:
+            masks["one_step"][direction, 0] = entries.any(axis=0) | entries.any(axis=1)
+    return masks
+
+
+def _evaluate_staged_two_step_points(
+    raw_evals, is_evaluated, evaluate, to_evals, steps, f0, preference_order, entries
+):
+    """Evaluate points of fallback Hessian formulas where they are useful.
+
+    For each fallback formula, points are only evaluated for entries of the Hessian
+    that could not be calculated with any of the preferred formulas and for which
+    the fallback formula does not depend on evaluations that already failed.
+
+    Args:
+        raw_evals (dict): Dictionary with lists of raw evaluations of the first stage.
+            See :func:`_evaluate_two_step_points`.
+        is_evaluated (dict): Dictionary with boolean arrays that are True for the
+            points that were evaluated in the first stage.
+        evaluate (callable): Function that evaluates func at the points given by masks.
+        to_evals (callable): Function that converts raw evaluations to arrays.
+        steps (namedtuple): Namedtuple with the field names pos and neg.
+        f0 (np.ndarray): 1d array with the function value at x.
+        preference_order (list): Order of Hessian formulas. Earlier entries are
+            preferred.
+        entries (np.ndarray): Upper triangular boolean array of shape (dim_x, dim_x)
+            that is True for the entries of the Hessian that are calculated.
+
+    Returns:
+        raw_evals (dict): Dictionary with lists of all raw evaluations.
+        exc_info (str): Information on exceptions that occurred during function
+            evaluations.
+
+    """
+    is_evaluated = {k: v.copy() for k, v in is_evaluated.items()}
+    has_step = ~np.isnan(np.stack(steps))[:, 0]
+    is_upper = np.triu(np.full(entries.shape, True), k=1)
+    exc_info = []
+
+    for method in preference_order[1:]:
+        evals = to_evals(raw_evals)
+        candidates = {
+            m: finite_differences.hessian(evals, steps, f0, m) for m in preference_order
+        }
+        hess = _consolidate_one_step_derivatives(candidates, preference_order)
+        is_needed = entries & np.isnan(hess).any(axis=0)
+        if not is_needed.any():
+            break
+
+        has_failed = {
+            step_type: is_evaluated[step_type]
+            & np.isnan(np.stack(evals[step_type])).any(axis=2)
+            for step_type in evals
+        }
+
+        is_infeasible = np.full(entries.shape, False)
+        for direction in _DIRECTIONS[method]:
+            is_bad = ~has_step[direction]
+            if method != "central_cross":
+                is_bad = is_bad | has_failed["one_step"][direction, 0]
+            is_infeasible |= is_bad[:, np.newaxis] | is_bad[np.newaxis, :]
+            is_infeasible |= has_failed["two_step"][direction, 0]
+            if method == "central_cross":
+                is_infeasible |= has_failed["cross_step"][direction, 0] & is_upper
+
+        masks = _get_hessian_masks(
+            method, is_needed & ~is_infeasible, n_steps=len(steps.pos)
+        )
+        masks = {k: mask & ~is_evaluated[k] for k, mask in masks.items()}
+        if not any(mask.any() for mask in masks.values()):
+            continue
+
+        new_evals, _ = evaluate(masks=masks)
+        for step_type, mask in masks.items():
+            new = new_evals[step_type]
+            exc_info += [val for val in new if isinstance(val, str)]
+            new = [val if not isinstance(val, str) else np.nan for val in new]
+            raw_evals[step_type] = [
+                new_val if is_new else old_val
+                for old_val, new_val, is_new in zip(
+                    raw_evals[step_type], new, mask.ravel()
+                )
+            ]
+            is_evaluated[step_type] |= mask
+
+    return raw_evals, "\n\n".join(exc_info)
+
+
+def _stream_one_step_jacobian(
+    evaluate, to_numpy, steps, f0, preference_order, chunk_size, out
+):
+    """Calculate a one-step Jacobian chunk by chunk and write it into out.
+
+    The parameters are processed in chunks such that at most chunk_size function
+    evaluations are held in memory at once. Evaluations of a chunk are discarded as soon
+    as the corresponding columns of the Jacobian are calculated.
+
+    Args:
+        evaluate (callable): Function that evaluates func at all points that belong to
+            non-NaN steps and returns a list in the order (2, n_steps, dim_x).
+        to_numpy (callable): Function that converts a list of raw evaluations to a list
+            of 1d numpy arrays.
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (1, dim_x).
+        f0 (np.ndarray): 1d array with the function value at x.
+        preference_order (list): Order of finite difference methods. Earlier entries
+            are preferred.
+        chunk_size (int): Maximal number of function evaluations per chunk.
+        out (np.ndarray): Array of shape (dim_f, dim_x) into which the Jacobian is
+            written.
+
+    Returns:
+        out (np.ndarray): The Jacobian.
+        exc_info (str): Information on exceptions that occurred during function
+            evaluations.
+
+    """
+    dim_x = steps.pos.shape[1]
+    n_directions = sum(int((~np.isnan(step_arr)).any()) for step_arr in steps)
+    params_per_chunk = max(1, chunk_size // max(n_directions, 1))
+
+    exc_info = []
+    for start in range(0, dim_x, params_per_chunk):
+        columns = np.arange(start, min(start + params_per_chunk, dim_x))
+        is_requested = np.full((1, dim_x), False)
+        is_requested[0, columns] = True
+
+        raw_evals = evaluate(steps=_mask_steps(steps, is_requested))
+        raw_evals = [raw_evals[i] for i in np.concatenate([columns, dim_x + columns])]
+        exc_info += [val for val in raw_evals if isinstance(val, str)]
+        raw_evals = [val if not isinstance(val, str) else np.nan for val in raw_evals]
+
+        evals = to_numpy(raw_evals)
+        del raw_evals
+        evals = [
+            val if val.shape == f0.shape else np.full(f0.shape, np.nan) for val in evals
+        ]
+        # differences are taken in double precision, even if out has lower precision
+        evals = np.array(evals, dtype=np.float64).reshape(2, 1, len(columns), -1)
+        evals = np.transpose(evals, axes=(0, 1, 3, 2))
+        evals = Evals(pos=evals[0], neg=evals[1])
+
+        chunk_steps = Steps(*(step_arr[:, columns] for step_arr in steps))
+        candidates = {
+            m: finite_differences.jacobian(evals, chunk_steps, f0, m)
+            for m in preference_order
+        }
+        out[:, columns] = _consolidate_one_step_derivatives(
+            candidates, preference_order
+        )
+
+    return out, "\n\n".join(exc_info)
+
+
+def _extrapolate_columns(evals, steps, f0, n_steps, columns):
+    """Richardson extrapolated derivative estimates for a subset of parameters.
+
+    Args:
+        evals (np.ndarray): Array of shape (2, n_steps_total, dim_f, dim_x) with
+            evaluations.
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (n_steps_total, dim_x).
+        f0 (np.ndarray): 1d array with the function value at x.
+        n_steps (int): Number of steps that are used, counted from the smallest one.
+        columns (np.ndarray): Indices of the parameters for which the derivative is
+            estimated.
+
+    Returns:
+        jac (np.ndarray): Array of shape (dim_f, len(columns)) with the best derivative
+            estimates.
+        error (np.ndarray): Array of the same shape with the estimated errors.
+
+    """
+    first_steps = Steps(pos=steps.pos[:n_steps], neg=steps.neg[:n_steps])
+    column_steps = Steps(*(step_arr[:, columns] for step_arr in first_steps))
+    column_evals = Evals(*(arr[:n_steps][..., columns] for arr in evals))
+
+    jac_candidates = {}
+    for m in ["forward", "backward", "central"]:
+        jac_candidates[m] = finite_differences.jacobian(
+            column_evals, column_steps, f0, m
+        )
+
+    # the extrapolation only uses the steps to determine the step ratio
+    richardson_candidates = _compute_richardson_candidates(
+        jac_candidates, first_steps, n_steps
+    )
+    _, (candidate_der, candidate_err) = _consolidate_extrapolated(richardson_candidates)
+    jac, error = _select_minimizer_along_axis(
+        np.stack(list(candidate_der.values())), np.stack(list(candidate_err.values()))
+    )
+    return jac, error
+
+
+def _get_colored_points(x, steps, colors):
+    """Generate evaluation points that perturb all columns of one color together.
+
+    Args:
+        x (np.ndarray): 1d array with parameters.
+        steps (namedtuple): Namedtuple with the field names pos and neg. Each field
+            contains a numpy array of shape (n_steps, len(x)).
+        colors (np.ndarray): 1d integer array with the color of each parameter.
+
+    Returns:
+        points (np.ndarray): 2d array where each row is a parameter vector
+            x + sum_{j in color c} steps[sign][i, j] e_j. NaN steps are not applied and
+            points without any non-NaN step are not included.
+        positions (np.ndarray): 1d array with the flat position of each point in an
+            array of shape (2, n_steps, n_colors).
+
+    """
+    step_arr = np.stack(steps)
+    n_colors = colors.max(initial=-1) + 1
+    membership = colors == np.arange(n_colors).reshape(-1, 1)
+
+    has_step = ~np.isnan(step_arr)
+    is_valid = (has_step[..., np.newaxis, :] & membership).any(axis=-1)
+    positions = np.flatnonzero(is_valid)
+
+    perturbations = np.where(has_step, step_arr, 0.0)[..., np.newaxis, :] * membership
+    points = x + perturbations.reshape(-1, len(x))[positions]
+    return points, positions
+
+
+def _decompress_colored_evals(raw_evals, steps, colors, sparsity, f0):
+    """Recover one-step evaluations from evaluations at colored points.
+
+    For each parameter j and each entry r of the function output that depends on j,
+    the evaluation at the point of j's color equals the evaluation where only j is
+    perturbed. Structurally zero entries are set to f0 such that all finite difference
+    formulae yield exactly zero for them.
+
+    Args:
+        raw_evals (list): List of 1d numpy arrays with the evaluations at the colored
+            points, ordered as (2, n_steps, n_colors).
+        steps (namedtuple): Namedtuple with the field names pos and neg.
+        colors (np.ndarray): 1d integer array with the color of each parameter.
+        sparsity (np.ndarray): Boolean array of shape (dim_f, dim_x).
+        f0 (np.ndarray): 1d array with the function value at x.
+
+    Returns:
+        np.ndarray: Array of shape (2, n_steps, dim_f, dim_x).
+
+    """
+    step_arr = np.stack(steps)
+    n_steps, dim_x = step_arr.shape[1:]
+    if sparsity.shape[0] != len(f0):
+        raise ValueError(
+            f"sparsity has {sparsity.shape[0]} rows but the function output has "
+            f"{len(f0)} entries."
+        )
+    compressed = np.array(raw_evals).reshape(2, n_steps, -1, len(f0))
+    evals = compressed[:, :, colors, :].swapaxes(2, 3)
+    evals = np.where(sparsity, evals, f0.reshape(-1, 1))
+    evals = np.where(np.isnan(step_arr)[:, :, np.newaxis, :], np.nan, evals)
+    return evals
+
+
+def _process_sparsity(sparsity, shape):
+    """Convert sparsity to a boolean array and check its shape."""
+    sparsity = np.atleast_2d(np.asarray(sparsity, dtype=bool))
+    expected = tuple(s if s is not None else sparsity.shape[0] for s in shape)
+    if sparsity.shape != expected:
+        raise ValueError(
+            f"sparsity must have shape {expected} but has shape {sparsity.shape}."
+        )
+    return sparsity
+
+
+def _place_evaluation_points(points, positions, n_points, params_treedef, registry):
+    """Place evaluation points in a list where all other entries are np.nan.
+
+    Args:
+        points (np.ndarray): 2d array with flat parameter vectors.
+        positions (np.ndarray): 1d array with the list position of each point.
+        n_points (int): Length of the resulting list.
+        params_treedef: Treedef of the user provided params. If None, the flat
+            parameter vectors are used directly.
+        registry (dict): pybaum registry.
+
+    Returns:
+        list: List of length n_points with parameters at positions and np.nan
+            everywhere else.
+
+    """
+    if params_treedef is None:
+        converted = list(points)
     else:
-        out = leaves
-    return out
+        converted = [
+            tree_unflatten(params_treedef, p, registry=registry) for p in points
+        ]
+
+    evaluation_points = [np.nan] * n_points
+    for pos, point in zip(positions.tolist(), converted):
+        evaluation_points[pos] = point
+    return evaluation_points
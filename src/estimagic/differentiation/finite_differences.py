@@ -35,7 +35,9 @@ def jacobian(evals, steps, f0, method):
             that steps.neg[i, j] = - steps.pos[i, j] unless one of them is NaN.
         f0 (numpy.ndarray): Numpy array of length dim_f with the output of the function
             at the user supplied parameters.
-        method (str): One of ["forward", "backward", "central"]
+        method (str): One of ["forward", "backward", "central", "complex_step"]. For
+            "complex_step", evals.pos has to contain the complex evaluations at
+            x0 + i * steps.pos.
 
     Returns:
         jac (numpy.ndarray): Numpy array of shape (n_steps, dim_f, dim_x) with estimated
@@ -53,8 +55,14 @@ def jacobian(evals, steps, f0, method):
         diffs = evals.pos - evals.neg
         deltas = steps.pos - steps.neg
         jac = diffs / deltas.reshape(n_steps, 1, dim_x)
+    elif method == "complex_step":
+        # failed evaluations are NaN in the real part, which np.imag would drop
+        imag = np.where(np.isnan(evals.pos), np.nan, np.imag(evals.pos))
+        jac = imag / steps.pos.reshape(n_steps, 1, dim_x)
     else:
-        raise ValueError("Method has to be 'forward', 'backward' or 'central'.")
+        raise ValueError(
+            "Method has to be 'forward', 'backward', 'central' or 'complex_step'."
+        )
     return jac
 
 
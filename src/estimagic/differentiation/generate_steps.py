@@ -32,8 +32,10 @@ def generate_steps(
     The rule of thumb for the generation of base_steps is:
     - first_derivative: `np.finfo(float).eps ** (1 / 2) * np.maximum(np.abs(x), 0.1)`
     - second_derivative: `np.finfo(float).eps ** (1 / 3) * np.maximum(np.abs(x), 0.1)`
-    Where `np.finfo(float).eps` is machine accuracy. This rule of thumb
-    is also used in statsmodels and scipy.
+    - complex_step: `np.finfo(float).eps * np.maximum(np.abs(x), 0.1)`
+    Where `np.finfo(float).eps` is machine accuracy. The first two rules of thumb
+    are also used in statsmodels and scipy. Complex steps do not suffer from
+    cancellation errors and can thus be much smaller.
 
     The step generation is bound aware and will try to find a good solution if
     any step would violate a bound. For this, we use the following rules until
@@ -52,7 +54,9 @@ def generate_steps(
 
     Args:
         x (numpy.ndarray): 1d array at which the derivative is calculated.
-        method (str): One of ["central", "forward", "backward"]
+        method (str): One of ["central", "forward", "backward", "complex_step"]. For
+            "complex_step", only positive steps are returned and bounds are ignored
+            because the steps are applied to the imaginary part of x.
         n_steps (int): Number of steps needed. For central methods, this is
             the number of steps per direction. It is 1 if no Richardson extrapolation
             is used.
@@ -86,9 +90,18 @@ def generate_steps(
             that steps.neg[i, j] = - steps.pos[i, j] unless one of them is NaN.
 
     """
+    if method == "complex_step" and base_steps is None:
+        base_steps = np.finfo(float).eps * np.maximum(np.abs(x), 0.1)
+
     base_steps = _calculate_or_validate_base_steps(
         base_steps, x, target, min_steps, scaling_factor
     )
+
+    if method == "complex_step":
+        # complex steps do not change the real part of x and thus never violate bounds
+        pos = step_ratio ** np.arange(n_steps) * base_steps.reshape(-1, 1)
+        return Steps(pos=pos.T, neg=np.full_like(pos.T, np.nan))
+
     min_steps = base_steps if min_steps is None else min_steps
 
     assert (
@@ -0,0 +1,107 @@
+"""Derivatives calculated with automatic differentiation in JAX.
+
+The functions in this module are used if ``backend="jax"`` is requested in
+:func:`~estimagic.differentiation.derivatives.first_derivative`,
+:func:`~estimagic.differentiation.derivatives.second_derivative` or the
+``numdiff_options`` of an optimization. All calculations run on the CPU and in double
+precision.
+
+"""
+
+import contextlib
+import functools
+
+import numpy as np
+
+from estimagic.config import IS_JAX_INSTALLED
+from estimagic.exceptions import NotInstalledError
+
+if IS_JAX_INSTALLED:
+    import jax
+    import jax.numpy as jnp
+    from jax.experimental import enable_x64
+
+
+def get_jax_derivative_func(func, params, *, order=1, key=None, func_kwargs=None):
+    """Get a jit compiled function that calculates func and its derivative.
+
+    Args:
+        func (callable): JAX traceable function of params. It can return a scalar, an
+            array, a pytree or a dictionary from which key is selected.
+        params (pytree): A pytree of numpy or jax arrays and floats. The structure of
+            params is used to decide between forward and reverse mode. pandas objects
+            are not supported because they cannot hold JAX tracers.
+        order (int): 1 for the first derivative and 2 for the second derivative.
+        key (str): If func returns a dictionary, take the derivative of
+            func(params)[key].
+        func_kwargs (dict): Additional keyword arguments for func, optional.
+
+    Returns:
+        callable: Function that maps params to a tuple with the derivative and the
+            function value. Both are pytrees of numpy arrays. The derivative has the
+            block tree format used by estimagic.
+
+    """
+    if not IS_JAX_INSTALLED:
+        raise NotInstalledError(
+            "The jax backend requires jax. Install it with pip install jax."
+        )
+    _check_params(params)
+
+    func_kwargs = {} if func_kwargs is None else func_kwargs
+    partialed_func = functools.partial(func, **func_kwargs)
+
+    def func_with_aux(p):
+        value = partialed_func(p)
+        selected = value[key] if isinstance(value, dict) and key is not None else value
+        return selected, value
+
+    with _jax_context():
+        jax_params = _to_jax(params)
+        if order == 1:
+            out_shape = jax.eval_shape(lambda p: func_with_aux(p)[0], jax_params)
+            dim_f = sum(leaf.size for leaf in jax.tree_util.tree_leaves(out_shape))
+            dim_x = sum(leaf.size for leaf in jax.tree_util.tree_leaves(jax_params))
+            transform = jax.jacrev if dim_f < dim_x else jax.jacfwd
+            derivative_func = transform(func_with_aux, has_aux=True)
+        elif order == 2:
+            derivative_func = jax.jacfwd(
+                jax.jacrev(func_with_aux, has_aux=True), has_aux=True
+            )
+        else:
+            raise ValueError(f"order must be 1 or 2, not {order}.")
+        jitted = jax.jit(derivative_func)
+
+    def derivative_and_func_value(params):
+        with _jax_context():
+            derivative, func_value = jitted(_to_jax(params))
+        return _to_numpy(derivative), _to_numpy(func_value)
+
+    return derivative_and_func_value
+
+
+def _check_params(params):
+    leaves = jax.tree_util.tree_leaves(params)
+    is_supported = [
+        isinstance(leaf, (float, int, np.ndarray, np.number, jax.Array))
+        for leaf in leaves
+    ]
+    if not all(is_supported):
+        raise ValueError(
+            "The jax backend requires params that are pytrees of numpy arrays, jax "
+            "arrays and floats. Use the default backend for params with pandas objects."
+        )
+
+
+def _to_jax(tree):
+    return jax.tree_util.tree_map(lambda leaf: jnp.asarray(leaf, dtype=float), tree)
+
+
+def _to_numpy(tree):
+    return jax.tree_util.tree_map(np.asarray, tree)
+
+
+@contextlib.contextmanager
+def _jax_context():
+    with enable_x64(), jax.default_device(jax.devices("cpu")[0]):
+        yield
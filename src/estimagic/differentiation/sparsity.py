@@ -0,0 +1,82 @@
+"""Functions to exploit known sparsity patterns of Jacobians and Hessians."""
+
+import numpy as np
+
+
+def get_column_coloring(sparsity):
+    """Partition the columns of a Jacobian into structurally orthogonal groups.
+
+    Two columns are structurally orthogonal if they have no nonzero entry in the same
+    row. All columns of one group (color) can be perturbed in one function evaluation
+    and the Jacobian can be recovered from the compressed evaluations (Curtis, Powell
+    and Reid, 1974). The groups are determined by a greedy largest first heuristic.
+
+    Args:
+        sparsity (np.ndarray): Boolean array of shape (dim_f, dim_x) that is True where
+            the Jacobian can be nonzero.
+
+    Returns:
+        np.ndarray: 1d integer array of length dim_x with the color of each column.
+            Colors are numbered consecutively starting at zero.
+
+    """
+    sparsity = np.asarray(sparsity, dtype=bool)
+    dim_f, dim_x = sparsity.shape
+
+    colors = np.full(dim_x, -1)
+    used_rows = np.zeros((0, dim_f), dtype=bool)
+    for j in np.argsort(-sparsity.sum(axis=0), kind="stable"):
+        fits = ~(used_rows & sparsity[:, j]).any(axis=1)
+        if fits.any():
+            color = np.argmax(fits)
+        else:
+            color = len(used_rows)
+            used_rows = np.vstack([used_rows, np.zeros(dim_f, dtype=bool)])
+        used_rows[color] |= sparsity[:, j]
+        colors[j] = color
+
+    return colors
+
+
+def jacobian_to_hessian_sparsity(sparsity):
+    """Get the sparsity pattern of the Hessian of a sum of functions.
+
+    The Hessian of the sum of the entries of a function can only be nonzero at (j, k)
+    if at least one entry of the function depends on parameter j and parameter k.
+
+    Args:
+        sparsity (np.ndarray): Boolean array of shape (dim_f, dim_x) that is True where
+            the Jacobian can be nonzero.
+
+    Returns:
+        np.ndarray: Boolean array of shape (dim_x, dim_x).
+
+    """
+    sparsity = np.asarray(sparsity, dtype=float)
+    return sparsity.T @ sparsity > 0
+
+
+def sparsity_to_internal(sparsity, converter, x):
+    """Convert a sparsity pattern with respect to external parameters to internal ones.
+
+    Without transforming constraints, the Jacobian of the mapping from internal to
+    flat external parameters only has non-negative entries. Thus, converting the
+    pattern like a derivative yields the exact structural pattern.
+
+    Args:
+        sparsity (np.ndarray): Boolean array of shape (dim_f, n_params) where n_params
+            is the length of the flattened external parameters.
+        converter (Converter): The converter between internal and external parameters.
+        x (np.ndarray): Internal parameter vector.
+
+    Returns:
+        np.ndarray: Boolean array of shape (dim_f, len(x)).
+
+    """
+    if converter.has_transforming_constraints:
+        raise NotImplementedError(
+            "Sparsity patterns are not yet compatible with transforming constraints."
+        )
+    sparsity = np.atleast_2d(np.asarray(sparsity, dtype=float))
+    internal = converter.derivative_to_internal(sparsity, x, jac_is_flat=True)
+    return np.atleast_2d(internal) != 0
@@ -6,7 +6,12 @@ from typing import Any, Dict, Union
 import numpy as np
 import pandas as pd
 
+from estimagic.batch_evaluators import process_batch_evaluator
 from estimagic.differentiation.derivatives import first_derivative, second_derivative
+from estimagic.differentiation.sparsity import (
+    jacobian_to_hessian_sparsity,
+    sparsity_to_internal,
+)
 from estimagic.exceptions import InvalidFunctionError, NotAvailableError
 from estimagic.inference.ml_covs import (
     cov_cluster_robust,
@@ -110,7 +115,9 @@ def estimate_ml(
         loglike_kwargs (dict): Additional keyword arguments for loglike.
         numdiff_options (dict): Keyword arguments for the calculation of numerical
             derivatives for the calculation of standard errors. See
-            :ref:`first_derivative` for details.
+            :ref:`first_derivative` for details. A "sparsity" entry is the sparsity
+            pattern of the Jacobian of loglike["contributions"] with respect to the
+            flattened params. The sparsity pattern of the Hessian is derived from it.
         jacobian (callable or None): A function that takes ``params`` and potentially
             other keyword arguments and returns the jacobian of loglike["contributions"]
             with respect to the params. Note that you only need to pass a Jacobian
@@ -122,7 +129,9 @@ def estimate_ml(
             loglike["value"] with respect to the params.  If you pass None, a numerical
             Hessian will be calculated. If you pass ``False``, you signal that no
             Hessian should be calculated. Thus, no result that requires the Hessian will
-            be calculated.
+            be calculated. If you pass ``"from_jacobian"``, the Hessian is calculated
+            as the symmetrized numerical Jacobian of the gradient implied by the closed
+            form ``jacobian``. This needs O(n) instead of O(n²) evaluations.
         hessian_kwargs (dict): Additional keyword arguments for the Hessian function.
         design_info (pandas.DataFrame): DataFrame with one row per observation that
             contains some or all of the variables "psu" (primary sampling unit),
@@ -151,6 +160,9 @@ def estimate_ml(
     jac_case = get_derivative_case(jacobian)
     hess_case = get_derivative_case(hessian)
 
+    if hess_case == "from-jacobian" and jac_case != "closed-form":
+        raise ValueError("hessian='from_jacobian' requires a closed form jacobian.")
+
     check_numdiff_options(numdiff_options, "estimate_ml")
     numdiff_options = {} if numdiff_options in (None, False) else numdiff_options
     loglike_kwargs = {} if loglike_kwargs is None else loglike_kwargs
@@ -229,6 +241,62 @@ def estimate_ml(
         derivative_eval=jacobian_eval,
     )
 
+    jac_numdiff_options, hess_numdiff_options = numdiff_options, numdiff_options
+    if numdiff_options.get("sparsity") is not None:
+        jac_sparsity = sparsity_to_internal(
+            numdiff_options["sparsity"], converter, internal_estimates.values
+        )
+        jac_numdiff_options = {**numdiff_options, "sparsity": jac_sparsity}
+        hess_numdiff_options = {
+            **numdiff_options,
+            "sparsity": jacobian_to_hessian_sparsity(jac_sparsity),
+        }
+
+    # a preallocated output array is only meaningful for the jacobian
+    hess_numdiff_options = {k: v for k, v in hess_numdiff_options.items() if k != "out"}
+
+    # ==================================================================================
+    # Share function evaluations between numerical jacobian and hessian
+    # ==================================================================================
+
+    def shared_func(x):
+        p = converter.params_from_internal(x)
+        loglike_eval = loglike(p, **loglike_kwargs)
+        out = {
+            "contributions": converter.func_to_internal(loglike_eval["contributions"]),
+            "value": converter.func_to_internal(loglike_eval["value"]),
+        }
+        return out
+
+    def value_func(x):
+        p = converter.params_from_internal(x)
+        loglike_eval = loglike(p, **loglike_kwargs)
+        return {"value": converter.func_to_internal(loglike_eval["value"])}
+
+    # the evaluation at the estimates is passed as f0 to both derivatives, such that
+    # the center point is not evaluated again. Only the "value" of the jacobian points
+    # is cached because the hessian re-uses them as one-step points.
+    center_eval = {
+        "contributions": converter.func_to_internal(loglike_eval["contributions"]),
+        "value": converter.func_to_internal(loglike_eval["value"]),
+    }
+    jac_n_steps = jac_numdiff_options.get("n_steps", 1)
+    caching_batch_evaluator = _get_caching_batch_evaluator(
+        batch_evaluator=numdiff_options.get("batch_evaluator", "joblib"),
+        cache={},
+        maxsize=2 * jac_n_steps * len(internal_estimates.values),
+    )
+
+    # in the streaming mode, the jacobian evaluations are dropped chunk by chunk and
+    # therefore bypass the cache
+    is_streaming = any(
+        jac_numdiff_options.get(option) is not None for option in ["chunk_size", "out"]
+    )
+    if is_streaming:
+        jac_batch_evaluator = numdiff_options.get("batch_evaluator", "joblib")
+    else:
+        jac_batch_evaluator = caching_batch_evaluator
+
     # ==================================================================================
     # Calculate internal jacobian
     # ==================================================================================
@@ -238,19 +306,15 @@ def estimate_ml(
             jacobian_eval, internal_estimates.values
         )
     elif jac_case == "numerical":
-
-        def func(x):
-            p = converter.params_from_internal(x)
-            loglike_eval = loglike(p, **loglike_kwargs)["contributions"]
-            out = converter.func_to_internal(loglike_eval)
-            return out
-
         jac_res = first_derivative(
-            func=func,
+            func=shared_func,
             params=internal_estimates.values,
             lower_bounds=internal_estimates.lower_bounds,
             upper_bounds=internal_estimates.upper_bounds,
-            **numdiff_options,
+            key="contributions",
+            f0=center_eval,
+            batch_evaluator=jac_batch_evaluator,
+            **_drop_batch_evaluator(jac_numdiff_options),
         )
 
         int_jac = jac_res["derivative"]
@@ -281,21 +345,44 @@ def estimate_ml(
     if hess_case == "skip":
         int_hess = None
     elif hess_case == "numerical":
+        # adaptive richardson extrapolation and streaming are only available for
+        # first derivatives
+        first_derivative_only = {"richardson_tolerance", "chunk_size"}
+        second_derivative_options = {
+            k: v
+            for k, v in hess_numdiff_options.items()
+            if k not in first_derivative_only
+        }
+        hess_res = second_derivative(
+            func=value_func,
+            params=internal_estimates.values,
+            lower_bounds=internal_estimates.lower_bounds,
+            upper_bounds=internal_estimates.upper_bounds,
+            key="value",
+            f0=center_eval,
+            batch_evaluator=caching_batch_evaluator,
+            **_drop_batch_evaluator(second_derivative_options),
+        )
+        int_hess = hess_res["derivative"]
+    elif hess_case == "from-jacobian":
 
         def func(x):
             p = converter.params_from_internal(x)
-            loglike_eval = loglike(p, **loglike_kwargs)["value"]
-            out = converter.func_to_internal(loglike_eval)
+            jacobian_eval = jacobian(p, **jacobian_kwargs)
+            # with one observation the internal jacobian can be 1d
+            int_jac = converter.derivative_to_internal(jacobian_eval, x)
+            out = int_jac.reshape(-1, len(x)).sum(axis=0)
             return out
 
-        hess_res = second_derivative(
+        hess_res = first_derivative(
             func=func,
             params=internal_estimates.values,
             lower_bounds=internal_estimates.lower_bounds,
             upper_bounds=internal_estimates.upper_bounds,
-            **numdiff_options,
+            **hess_numdiff_options,
         )
         int_hess = hess_res["derivative"]
+        int_hess = (int_hess + int_hess.T) / 2
     elif hess_case == "closed-form" and constraints:
         raise NotImplementedError(
             "Closed-form Hessians are not yet compatible with constraints."
@@ -752,6 +839,61 @@ class LikelihoodResult:
         to_pickle(self, path=path)
 
 
+def _get_caching_batch_evaluator(batch_evaluator, cache, maxsize):
+    """Wrap a batch evaluator such that each distinct argument is evaluated only once.
+
+    Arguments are internal parameter vectors. To keep the memory footprint small, only
+    the "value" entry of each result is stored in cache, which can be shared between
+    several calls of numerical derivative functions that evaluate the same function.
+    Within one call, the full results are returned.
+
+    Args:
+        batch_evaluator (str or callable): The batch evaluator that is wrapped.
+        cache (dict): Dictionary that maps cache keys of arguments to results.
+        maxsize (int): Maximum number of results that are stored in cache.
+
+    Returns:
+        callable: The caching batch evaluator.
+
+    """
+    batch_evaluator = process_batch_evaluator(batch_evaluator)
+
+    def caching_batch_evaluator(func, arguments, **kwargs):
+        keys = [_get_cache_key(arg) for arg in arguments]
+
+        new = {}
+        for key, arg in zip(keys, arguments):
+            if key not in cache and key not in new:
+                new[key] = arg
+
+        results = {}
+        if new:
+            evaluations = batch_evaluator(
+                func=func, arguments=list(new.values()), **kwargs
+            )
+            results = dict(zip(new, evaluations))
+            for key in list(results)[: max(maxsize - len(cache), 0)]:
+                cache[key] = _select_value(results[key])
+
+        return [results[key] if key in results else cache[key] for key in keys]
+
+    return caching_batch_evaluator
+
+
+def _select_value(result):
+    """Reduce a result to its "value" entry; error messages are kept as they are."""
+    return {"value": result["value"]} if isinstance(result, dict) else result
+
+
+def _get_cache_key(x):
+    x = np.asarray(x)
+    return (x.dtype.str, x.tobytes())
+
+
+def _drop_batch_evaluator(numdiff_options):
+    return {k: v for k, v in numdiff_options.items() if k != "batch_evaluator"}
+
+
 def _calculate_free_cov_ml(
     method,
     internal_estimates,
@@ -12,6 +12,7 @@ import pandas as pd
 from pybaum import leaf_names, tree_just_flatten
 
 from estimagic.differentiation.derivatives import first_derivative
+from estimagic.differentiation.sparsity import sparsity_to_internal
 from estimagic.estimation.msm_weighting import get_weighting_matrix
 from estimagic.exceptions import InvalidFunctionError
 from estimagic.inference.msm_covs import cov_optimal, cov_robust
@@ -137,6 +138,8 @@ def estimate_msm(
             :ref:`first_derivative` for details. Note that by default we increase the
             step_size by a factor of 2 compared to the rule of thumb for optimal
             step sizes. This is because many msm criterion functions are slightly noisy.
+            A "sparsity" entry is the sparsity pattern of the Jacobian of the simulated
+            moments with respect to the flattened params.
         jacobian (callable): A function that take ``params`` and
             potentially other keyword arguments and returns the jacobian of
             simulate_moments with respect to the params.
@@ -278,6 +281,11 @@ def estimate_msm(
         derivative_eval=jacobian_eval,
     )
 
+    if numdiff_options.get("sparsity") is not None:
+        numdiff_options["sparsity"] = sparsity_to_internal(
+            numdiff_options["sparsity"], converter, internal_estimates.values
+        )
+
     # ==================================================================================
     # Calculate internal jacobian
     # ==================================================================================
@@ -52,7 +52,7 @@ def transform_covariance(
 
     """
     if converter.has_transforming_constraints:
-        _from_internal = converter.params_from_internal
+        _from_internal = converter.params_from_internal_batch
 
         is_free = internal_params.free_mask
         lower_bounds = internal_params.lower_bounds
@@ -63,21 +63,16 @@ def transform_covariance(
             cov=internal_cov,
             size=n_samples,
         )
-        transformed_free = []
-        for params in sample:
-            if bounds_handling == "clip":
-                x = np.clip(params, a_min=lower_bounds, a_max=upper_bounds)
-            elif bounds_handling == "raise":
-                if (params < lower_bounds).any() or (params > upper_bounds).any():
-                    raise ValueError()
-            else:
-                x = params
+        if bounds_handling == "clip":
+            sample = np.clip(sample, a_min=lower_bounds, a_max=upper_bounds)
+        elif bounds_handling == "raise":
+            if (sample < lower_bounds).any() or (sample > upper_bounds).any():
+                raise ValueError()
 
-            transformed = _from_internal(x=x, return_type="flat")
-            transformed_free.append(transformed[is_free])
+        transformed = _from_internal(x=sample, return_type="flat")
 
         free_cov = np.cov(
-            np.array(transformed_free),
+            transformed[:, is_free],
             rowvar=False,
         )
 
@@ -293,6 +288,8 @@ def get_derivative_case(derivative):
         case = "closed-form"
     elif derivative is False:
         case = "skip"
+    elif isinstance(derivative, str) and derivative == "from_jacobian":
+        case = "from-jacobian"
     else:
         case = "numerical"
     return case
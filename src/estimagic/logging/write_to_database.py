@@ -25,12 +25,36 @@ def append_row(data, table_name, database):
     _execute_write_statement(stmt, database)
 
 
-def _execute_write_statement(statement, database):
+def append_rows(data, table_name, database):
+    """Append several rows to a database table in one transaction.
+
+    Args:
+        data (list): List of dictionaries. The keys correspond to columns in the
+            database table. Columns that are missing in some of the dictionaries are
+            set to None in the corresponding rows.
+        table_name (str): Name of the database table to which the rows are added.
+        database (DataBase): The database to which the rows are added.
+
+    """
+    if not data:
+        return
+
+    columns = list(dict.fromkeys(key for row in data for key in row))
+    rows = [{col: row.get(col) for col in columns} for row in data]
+    stmt = database.metadata.tables[table_name].insert()
+
+    _execute_write_statement(stmt, database, parameters=rows)
+
+
+def _execute_write_statement(statement, database, parameters=None):
     try:
         # this will automatically roll back the transaction if any exception is raised
         # and then raise the exception
         with database.engine.begin() as connection:
-            connection.execute(statement)
+            if parameters is None:
+                connection.execute(statement)
+            else:
+                connection.execute(statement, parameters)
     except (KeyboardInterrupt, SystemExit):
         raise
     except Exception:
@@ -0,0 +1,163 @@
+"""Enforce a global budget of wall time, criterion evaluations and core seconds."""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from estimagic.exceptions import InvalidKwargsError, StopOptimizationError
+
+BUDGET_KEYS = ("max_seconds", "max_criterion_evaluations", "max_core_seconds")
+
+# positions in the shared state array; the best parameters follow after _BEST_VALUE
+_N_EVALUATIONS = 0
+_CORE_SECONDS = 1
+_BEST_VALUE = 2
+
+
+def get_budget_tracker(budget, x, criterion_value):
+    """Create a tracker that enforces the budget of an optimization.
+
+    Args:
+        budget (dict or None): Dictionary with the optional entries "max_seconds",
+            "max_criterion_evaluations" and "max_core_seconds".
+        x (np.ndarray): Internal start parameters.
+        criterion_value (float): Scalar criterion value at the start parameters, as
+            seen by the optimizer, i.e. with switched sign for maximizations.
+
+    Returns:
+        BudgetTracker or None: None if no budget is given.
+
+    """
+    if budget is None:
+        return None
+
+    invalid = [key for key in budget if key not in BUDGET_KEYS]
+    if invalid:
+        raise InvalidKwargsError(
+            f"The following budget entries are not allowed:\n\n{invalid}\n\n"
+            f"Allowed entries are: {list(BUDGET_KEYS)}."
+        )
+
+    max_seconds = budget.get("max_seconds")
+    deadline = None if max_seconds is None else time.time() + max_seconds
+
+    return BudgetTracker(
+        deadline=deadline,
+        max_criterion_evaluations=budget.get("max_criterion_evaluations"),
+        max_core_seconds=budget.get("max_core_seconds"),
+        x=x,
+        criterion_value=criterion_value,
+    )
+
+
+class BudgetTracker:
+    """Track the resources that are used by an optimization.
+
+    The number of criterion evaluations, the used core seconds and the best point
+    found so far are stored in a small memory mapped file. Since the tracker is
+    partialled into the internal criterion function, evaluations in worker processes
+    of batch evaluators update the same state as evaluations in the main process.
+    Updates are not synchronized between processes, i.e. with many parallel workers
+    the counts can be slightly too low.
+
+    """
+
+    def __init__(
+        self, deadline, max_criterion_evaluations, max_core_seconds, x, criterion_value
+    ):
+        self.deadline = deadline
+        self.max_criterion_evaluations = max_criterion_evaluations
+        self.max_core_seconds = max_core_seconds
+
+        self._directory = tempfile.mkdtemp(prefix="estimagic_budget_")
+        self._path = Path(self._directory) / "state.dat"
+        self._shape = (_BEST_VALUE + 1 + len(x),)
+        self._state = np.memmap(self._path, dtype=float, mode="w+", shape=self._shape)
+        self._state[_BEST_VALUE] = criterion_value
+        self._state[_BEST_VALUE + 1 :] = x
+        self._state.flush()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_state"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._state = np.memmap(self._path, dtype=float, mode="r+", shape=self._shape)
+
+    @property
+    def n_criterion_evaluations(self):
+        return int(self._state[_N_EVALUATIONS])
+
+    @property
+    def core_seconds(self):
+        return float(self._state[_CORE_SECONDS])
+
+    def update(self, n_criterion_evaluations, core_seconds, x=None, value=None):
+        """Add used resources and update the best point found so far.
+
+        Args:
+            n_criterion_evaluations (int): Number of new criterion evaluations.
+            core_seconds (float): Used core seconds.
+            x (np.ndarray or None): Internal parameters of a new evaluation.
+            value (float or None): Scalar criterion value at x as seen by the
+                optimizer, i.e. with switched sign for maximizations.
+
+        """
+        self._state[_N_EVALUATIONS] += n_criterion_evaluations
+        self._state[_CORE_SECONDS] += core_seconds
+        if value is not None and value < self._state[_BEST_VALUE]:
+            self._state[_BEST_VALUE] = value
+            self._state[_BEST_VALUE + 1 :] = x
+
+    def get_exhaustion_message(self):
+        """Describe which part of the budget is exhausted.
+
+        Returns:
+            str or None: None if the budget is not exhausted.
+
+        """
+        if self.deadline is not None and time.time() >= self.deadline:
+            msg = "the wall time budget"
+        elif (
+            self.max_criterion_evaluations is not None
+            and self.n_criterion_evaluations >= self.max_criterion_evaluations
+        ):
+            msg = (
+                f"the budget of {self.max_criterion_evaluations} criterion evaluations"
+            )
+        elif (
+            self.max_core_seconds is not None
+            and self.core_seconds >= self.max_core_seconds
+        ):
+            msg = f"the budget of {self.max_core_seconds} core seconds"
+        else:
+            return None
+        return f"Optimization stopped because {msg} was exhausted."
+
+    def get_current_status(self, message):
+        """Get a result dictionary with the best point found so far."""
+        return {
+            "solution_x": np.array(self._state[_BEST_VALUE + 1 :]),
+            "solution_criterion": float(self._state[_BEST_VALUE]),
+            "n_criterion_evaluations": self.n_criterion_evaluations,
+            "success": False,
+            "message": message,
+        }
+
+    def stop_if_exhausted(self):
+        """Raise a StopOptimizationError with the best point if the budget is used."""
+        message = self.get_exhaustion_message()
+        if message is not None:
+            raise StopOptimizationError(
+                message, current_status=self.get_current_status(message)
+            )
+
+    def close(self):
+        """Remove the file that stores the shared state."""
+        self._state = None
+        shutil.rmtree(self._directory, ignore_errors=True)
@@ -0,0 +1,213 @@
+"""Minimal problem functions for cheap criterion functions.
+
+In fast mode, the internal optimizers call thin closures around the user provided
+functions instead of the internal_criterion_and_derivative_template. This removes the
+overhead of parameter conversions, error handling, logging and history collection,
+which can dominate the runtime for criterion functions that take only microseconds.
+
+"""
+
+import numpy as np
+
+from estimagic.differentiation.derivatives import first_derivative
+
+
+def check_fast_mode_compatibility(
+    params,
+    constraints,
+    func_eval,
+    primary_key,
+    logging,
+    error_handling,
+    scaling,
+    multistart,
+    budget,
+):
+    """Raise a ValueError if the optimization problem is not compatible with fast mode.
+
+    Args:
+        params (pytree): The user provided parameters.
+        constraints (list): All user provided constraints, including nonlinear ones.
+        func_eval (float, np.ndarray or dict): The criterion value at params.
+        primary_key (str): The primary criterion entry of the algorithm.
+        logging (pathlib.Path, str or False): Path to the log file or False.
+        error_handling (str): "raise" or "continue".
+        scaling (bool): Whether scaling is used.
+        multistart (bool): Whether a multistart optimization is done.
+        budget (dict or None): The global budget.
+
+    """
+    problems = get_fast_mode_incompatibilities(
+        params=params,
+        constraints=constraints,
+        func_eval=func_eval,
+        primary_key=primary_key,
+    )
+    if logging:
+        problems.append("logging is not supported")
+    if error_handling != "raise":
+        problems.append('error_handling has to be "raise"')
+    if scaling:
+        problems.append("scaling is not supported")
+    if multistart:
+        problems.append("multistart optimizations are not supported")
+    if budget is not None:
+        problems.append("budgets are not supported")
+
+    if problems:
+        msg = "fast_mode cannot be used because " + "; ".join(problems) + "."
+        raise ValueError(msg)
+
+
+def get_fast_mode_incompatibilities(params, constraints, func_eval, primary_key):
+    """Describe why params, constraints or the criterion output prevent fast mode.
+
+    Args:
+        params (pytree): The user provided parameters.
+        constraints (list): All user provided constraints, including nonlinear ones.
+        func_eval (float, np.ndarray or dict): The criterion value at params.
+        primary_key (str): The primary criterion entry of the algorithm.
+
+    Returns:
+        list: List of strings. Empty if fast mode can be used.
+
+    """
+    problems = []
+    if not (isinstance(params, np.ndarray) and params.ndim == 1):
+        problems.append("params have to be a 1d numpy array")
+    if constraints:
+        problems.append("constraints are not supported")
+
+    entry = func_eval.get(primary_key) if isinstance(func_eval, dict) else func_eval
+    if entry is None:
+        problems.append(f'the criterion has to return a "{primary_key}" entry')
+    elif primary_key == "value" and not np.isscalar(entry):
+        problems.append("the criterion value has to be a scalar")
+    elif primary_key != "value" and not (
+        isinstance(entry, np.ndarray) and entry.ndim == 1
+    ):
+        problems.append(f"the {primary_key} have to be a 1d numpy array")
+
+    return problems
+
+
+def get_fast_problem_functions(
+    criterion,
+    derivative,
+    criterion_and_derivative,
+    func_eval,
+    derivative_eval,
+    criterion_and_derivative_eval,
+    primary_key,
+    direction,
+    numdiff_options,
+    tasks,
+):
+    """Get minimal criterion and derivative functions of internal parameters.
+
+    Args:
+        criterion (callable): The user provided criterion with partialled kwargs.
+        derivative (callable or None): The user provided derivative with partialled
+            kwargs.
+        criterion_and_derivative (callable or None): The user provided
+            criterion_and_derivative with partialled kwargs.
+        func_eval (float, np.ndarray or dict): The criterion value at start params.
+        derivative_eval (np.ndarray, dict or None): The output of derivative at start
+            params.
+        criterion_and_derivative_eval (tuple or None): The output of
+            criterion_and_derivative at start params.
+        primary_key (str): The primary criterion entry of the algorithm.
+        direction (str): "minimize" or "maximize".
+        numdiff_options (dict): Options for numerical derivatives, with defaults
+            filled in.
+        tasks (set): Subset of {"criterion", "derivative", "criterion_and_derivative"}
+            with the functions the algorithm needs.
+
+    Returns:
+        dict: Dictionary with an entry for each task.
+
+    """
+    sign = 1 if direction == "minimize" else -1
+
+    criterion = _select_entry(criterion, func_eval, primary_key)
+    if derivative is not None:
+        derivative = _select_entry(derivative, derivative_eval, primary_key)
+    if criterion_and_derivative is not None:
+        criterion_and_derivative = _select_entries(
+            criterion_and_derivative, *criterion_and_derivative_eval, primary_key
+        )
+
+    if sign == 1:
+        fast_criterion = criterion
+    else:
+
+        def fast_criterion(x):
+            return -criterion(x)
+
+    if derivative is not None:
+        fast_derivative = derivative if sign == 1 else lambda x: -derivative(x)
+    elif criterion_and_derivative is not None:
+
+        def fast_derivative(x):
+            return sign * criterion_and_derivative(x)[1]
+
+    else:
+
+        def fast_derivative(x):
+            return first_derivative(fast_criterion, x, **numdiff_options)["derivative"]
+
+    if criterion_and_derivative is not None:
+        if sign == 1:
+            fast_criterion_and_derivative = criterion_and_derivative
+        else:
+
+            def fast_criterion_and_derivative(x):
+                crit, deriv = criterion_and_derivative(x)
+                return -crit, -deriv
+
+    elif derivative is not None:
+
+        def fast_criterion_and_derivative(x):
+            return fast_criterion(x), fast_derivative(x)
+
+    else:
+
+        def fast_criterion_and_derivative(x):
+            res = first_derivative(
+                fast_criterion, x, return_func_value=True, **numdiff_options
+            )
+            return res["func_value"], res["derivative"]
+
+    candidates = {
+        "criterion": fast_criterion,
+        "derivative": fast_derivative,
+        "criterion_and_derivative": fast_criterion_and_derivative,
+    }
+    return {task: func for task, func in candidates.items() if task in tasks}
+
+
+def _select_entry(func, example, key):
+    if isinstance(example, dict):
+
+        def out(x):
+            return func(x)[key]
+
+    else:
+        out = func
+    return out
+
+
+def _select_entries(criterion_and_derivative, func_eval, derivative_eval, key):
+    crit_is_dict = isinstance(func_eval, dict)
+    deriv_is_dict = isinstance(derivative_eval, dict)
+    if not (crit_is_dict or deriv_is_dict):
+        return criterion_and_derivative
+
+    def out(x):
+        crit, deriv = criterion_and_derivative(x)
+        return (
+            crit[key] if crit_is_dict else crit,
+            deriv[key] if deriv_is_dict else deriv,
+        )
+
+    return out
@@ -57,6 +57,7 @@ def get_final_algorithm(
     logging,
     database,
     collect_history,
+    fast_mode=False,
 ):
     """Get algorithm-function with partialled options.
 
@@ -80,6 +81,9 @@ def get_final_algorithm(
             warning.
         logging (bool): Whether the algorithm should do logging.
         database (DataBase): Database to which the logging should be written.
+        collect_history (bool): Whether the history should be collected.
+        fast_mode (bool): If True, neither logging nor history collection is added and
+            the algorithm does not take a ``step_id``.
 
     Returns:
         callable: The algorithm.
@@ -98,6 +102,9 @@ def get_final_algorithm(
 
     algorithm = partial(raw_algorithm, **internal_options)
 
+    if fast_mode:
+        return algorithm
+
     algorithm = _add_logging(
         algorithm,
         logging=logging,
@@ -1,8 +1,15 @@
 import time
 import warnings
 
+import numpy as np
+
+from estimagic.batch_evaluators import process_batch_evaluator
 from estimagic.differentiation.derivatives import first_derivative
-from estimagic.exceptions import UserFunctionRuntimeError, get_traceback
+from estimagic.exceptions import (
+    StopOptimizationError,
+    UserFunctionRuntimeError,
+    get_traceback,
+)
 from estimagic.logging.write_to_database import append_row
 from estimagic.parameters.conversion import aggregate_func_output_to_value
 
@@ -25,6 +32,9 @@ def internal_criterion_and_derivative_template(
     fixed_log_data,
     history_container=None,
     return_history_entry=False,
+    return_log_entry=False,
+    known_optima=None,
+    budget_tracker=None,
 ):
     """Template for the internal criterion and derivative function.
 
@@ -81,6 +91,20 @@ def internal_criterion_and_derivative_template(
             derivative histories are appended. Should be set to None if an algorithm
             parallelizes over criterion or derivative evaluations.
         return_history_entry (bool): Whether the history container should be returned.
+        return_log_entry (bool): If True, new evaluations are not written to the
+            database but the data that would be written is returned as additional
+            output. This allows to write the evaluations of a batch to the database
+            at once. The log entry is None if logging is False.
+        known_optima (dict or None): Dictionary with the entries "x" (2d numpy array
+            with internal parameters of known local optima), "results" (list with the
+            corresponding optimization results) and "xtol" (float). If ``x`` is within
+            a relative distance of "xtol" of a known local optimum, a
+            StopOptimizationError is raised whose ``current_status`` is the result of
+            that optimum. Used to stop local optimizations in a multistart
+            optimization early.
+        budget_tracker (BudgetTracker or None): Tracker of the global budget of the
+            optimization. If the budget is exhausted, a StopOptimizationError is raised
+            whose ``current_status`` contains the best parameters found so far.
 
     Returns:
         float, np.ndarray or tuple: If task=="criterion" it returns the output of
@@ -89,6 +113,12 @@ def internal_criterion_and_derivative_template(
             If task=="criterion_and_derivative" it returns both as a tuple.
 
     """
+    if known_optima is not None:
+        _stop_if_close_to_known_optimum(x, known_optima)
+
+    if budget_tracker is not None:
+        budget_tracker.stop_if_exhausted()
+
     now = time.perf_counter()
     to_dos = _determine_to_dos(task, derivative, criterion_and_derivative)
 
@@ -113,6 +143,11 @@ def internal_criterion_and_derivative_template(
         options = numdiff_options.copy()
         options["key"] = "relevant"
         options["return_func_value"] = True
+        numdiff_batch_sizes = []
+        if budget_tracker is not None:
+            options["batch_evaluator"] = _get_counting_batch_evaluator(
+                options.get("batch_evaluator", "joblib"), numdiff_batch_sizes
+            )
 
         try:
             derivative_dict = first_derivative(func, x, **options)
@@ -222,17 +257,39 @@ def internal_criterion_and_derivative_template(
     else:
         scalar_critval = None
 
+    if budget_tracker is not None:
+        if "numerical_criterion_and_derivative" in to_dos:
+            n_evaluations = sum(numdiff_batch_sizes)
+            n_cores = numdiff_options.get("n_cores", 1)
+        else:
+            n_evaluations = int(
+                bool({"criterion", "criterion_and_derivative"} & set(to_dos))
+            )
+            n_cores = 1
+        if scalar_critval is not None and not caught_exceptions:
+            value = scalar_critval if direction == "minimize" else -scalar_critval
+        else:
+            value = None
+        budget_tracker.update(
+            n_criterion_evaluations=n_evaluations,
+            core_seconds=(time.perf_counter() - now) * n_cores,
+            x=x,
+            value=value,
+        )
+
+    log_entry = None
     if (new_criterion is not None or new_derivative is not None) and logging:
-        _log_new_evaluations(
+        log_entry = _get_log_entry(
             new_criterion=new_external_criterion,
             new_derivative=new_derivative,
             external_x=external_x,
             caught_exceptions=caught_exceptions,
-            database=database,
             fixed_log_data=fixed_log_data,
             scalar_value=scalar_critval,
             now=now,
         )
+        if not return_log_entry:
+            append_row(log_entry, "optimization_iterations", database=database)
 
     res = _get_output_for_optimizer(
         new_criterion=new_criterion,
@@ -263,9 +320,42 @@ def internal_criterion_and_derivative_template(
     if return_history_entry:
         res = (res, hist_entry)
 
+    if return_log_entry:
+        res = (res, log_entry)
+
     return res
 
 
+def _stop_if_close_to_known_optimum(x, known_optima):
+    optima = known_optima["x"]
+    relative_diffs = (optima - x) / np.clip(optima, 0.1, np.inf)
+    distances = np.linalg.norm(relative_diffs, axis=1)
+    closest = np.argmin(distances)
+    if distances[closest] <= known_optima["xtol"]:
+        result = known_optima["results"][closest]
+        message = (
+            "Stopped early because the parameters came close to a local optimum that "
+            "was found before."
+        )
+        current_status = {
+            "solution_x": result["solution_x"],
+            "solution_criterion": result["solution_criterion"],
+            "message": message,
+        }
+        raise StopOptimizationError(message, current_status=current_status)
+
+
+def _get_counting_batch_evaluator(batch_evaluator, batch_sizes):
+    """Wrap a batch evaluator such that the number of evaluations is recorded."""
+    batch_evaluator = process_batch_evaluator(batch_evaluator)
+
+    def counting_batch_evaluator(func, arguments, **kwargs):
+        batch_sizes.append(len(arguments))
+        return batch_evaluator(func=func, arguments=arguments, **kwargs)
+
+    return counting_batch_evaluator
+
+
 def _determine_to_dos(task, derivative, criterion_and_derivative):
     """Determine which functions have to be evaluated at the new parameters.
 
@@ -309,17 +399,16 @@ def _determine_to_dos(task, derivative, criterion_and_derivative):
     return to_dos
 
 
-def _log_new_evaluations(
+def _get_log_entry(
     new_criterion,
     new_derivative,
     external_x,
     caught_exceptions,
-    database,
     fixed_log_data,
     scalar_value,
     now,
 ):
-    """Write the new evaluations and additional information into the database.
+    """Collect the new evaluations and additional information for the database.
 
     Note: There are some seemingly unnecessary type conversions because sqlalchemy
     can fail silently when called with numpy dtypes instead of the equivalent python
@@ -343,9 +432,7 @@ def _log_new_evaluations(
         data["exceptions"] = separator.join(caught_exceptions)
         data["valid"] = False
 
-    name = "optimization_iterations"
-
-    append_row(data, name, database=database)
+    return data
 
 
 def _get_output_for_optimizer(
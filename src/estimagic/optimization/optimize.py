@@ -1,9 +1,20 @@
 import functools
+import inspect
 import warnings
 from pathlib import Path
 
+import numpy as np
+from pybaum import leaf_names
+
 from estimagic.batch_evaluators import process_batch_evaluator
-from estimagic.exceptions import InvalidFunctionError, InvalidKwargsError
+from estimagic.differentiation.jax_backend import get_jax_derivative_func
+from estimagic.differentiation.sparsity import sparsity_to_internal
+from estimagic.exceptions import (
+    InvalidFunctionError,
+    InvalidKwargsError,
+    StopOptimizationError,
+    get_traceback,
+)
 from estimagic.logging.create_tables import (
     make_optimization_iteration_table,
     make_optimization_problem_table,
@@ -11,8 +22,14 @@ from estimagic.logging.create_tables import (
 )
 from estimagic.logging.load_database import load_database
 from estimagic.logging.write_to_database import append_row
+from estimagic.optimization.budget import get_budget_tracker
 from estimagic.optimization.check_arguments import check_optimize_kwargs
 from estimagic.optimization.error_penalty import get_error_penalty_function
+from estimagic.optimization.fast_mode import (
+    check_fast_mode_compatibility,
+    get_fast_mode_incompatibilities,
+    get_fast_problem_functions,
+)
 from estimagic.optimization.get_algorithm import (
     get_final_algorithm,
     process_user_algorithm,
@@ -22,13 +39,16 @@ from estimagic.optimization.internal_criterion_template import (
 )
 from estimagic.optimization.optimization_logging import log_scheduled_steps_and_get_ids
 from estimagic.optimization.process_multistart_sample import process_multistart_sample
+from estimagic.optimization.optimize_result import ManyOptimizeResult
 from estimagic.optimization.process_results import process_internal_optimizer_result
 from estimagic.optimization.tiktak import WEIGHT_FUNCTIONS, run_multistart_optimization
+from estimagic.optimization.shared_criterion import get_shared_criterion
 from estimagic.parameters.conversion import (
     aggregate_func_output_to_value,
     get_converter,
 )
 from estimagic.parameters.nonlinear_constraints import process_nonlinear_constraints
+from estimagic.parameters.tree_registry import get_registry
 from estimagic.process_user_function import process_func_of_params
 
 
@@ -59,6 +79,8 @@ def maximize(
     multistart_options=None,
     collect_history=True,
     skip_checks=False,
+    budget=None,
+    fast_mode=False,
 ):
     """Maximize criterion using algorithm subject to constraints.
 
@@ -107,6 +129,11 @@ def maximize(
         numdiff_options (dict): Keyword arguments for the calculation of numerical
             derivatives. See :ref:`first_derivative` for details. Note that the default
             method is changed to "forward" for speed reasons.
+            A "sparsity" entry is the sparsity pattern of the Jacobian of the
+            criterion contributions with respect to the flattened params.
+            With {"backend": "jax"}, criterion and derivative are calculated with
+            automatic differentiation in JAX if no derivative is provided. This
+            requires a JAX traceable criterion and params without pandas objects.
         logging (pathlib.Path, str or False): Path to sqlite3 file (which typically has
             the file extension ``.db``. If the file does not exist, it will be created.
             When doing parallel optimizations and logging is provided, you have to
@@ -180,7 +207,9 @@ def maximize(
             parallel during exploration stages and number of parallel local
             optimization in optimization stages. Default 1.
             - batch_evaluator (str or callable): See :ref:`batch_evaluators` for
-            details. Default "joblib".
+            details. Default "joblib". The exploration evaluates estimagic's internal
+            criterion function, which cannot be traced by JAX. Thus, "jax" falls back
+            to "joblib" with a warning.
             - batch_size (int): If n_cores is larger than one, several starting points
             for local optimizations are created with the same weight and from the same
             currently best point. The ``batch_size`` argument is a way to reproduce
@@ -193,11 +222,41 @@ def maximize(
             discarded from the sample.
             - optimization_error_handling (str): One of "raise" or "continue". Default
             is continue, which means that failed optimizations are simply discarded.
+            - exploration_chunk_size (int): If not None, the exploration sample is
+            drawn and evaluated in chunks of this size and only the best points are
+            kept in memory. Then, the exploration sample and results in the
+            ``multistart_info`` only contain those points. Default None.
+            - clustering_critical_distance (float or str): If not None, points of the
+            exploration sample that have a better point within this distance are not
+            used as start points, as in multi level single linkage. Distances are
+            measured after scaling the sampling bounds to the unit hypercube. "mlsl"
+            uses the critical distance of Rinnooy Kan and Timmer (1987). Default None.
+            - racing (bool): If True, local optimizations are stopped as soon as their
+            parameters are within ``convergence.relative_params_tolerance`` of a local
+            optimum that was found before. The stopped optimization then counts as
+            another discovery of that optimum. Default False.
         collect_history (bool): Whether the history of parameters and criterion values
             should be collected and returned as part of the result. Default True.
         skip_checks (bool): Whether checks on the inputs are skipped. This makes the
             optimization faster, especially for very fast criterion functions. Default
             False.
+        budget (dict or None): Global budget for the whole optimization, including
+            multistart exploration, all local optimizations and numerical derivatives.
+            The dictionary can have the entries "max_seconds" (wall time),
+            "max_criterion_evaluations" and "max_core_seconds" (time spent in the
+            criterion function, multiplied by the number of cores used for numerical
+            derivatives). If the budget is exhausted, the optimization is stopped and
+            the best parameters found so far are returned. The ``message`` of the
+            result states which part of the budget was exhausted. Default None.
+        fast_mode (bool): If True, the optimizer calls thin wrappers around the user
+            provided functions instead of estimagic's internal criterion function. This
+            reduces the overhead per criterion evaluation to about a microsecond, which
+            matters for criterion functions that only take a few microseconds. It
+            requires params that are a 1d numpy array and is not compatible with
+            constraints, scaling, logging, multistart, budgets and
+            ``error_handling="continue"``. No history is collected and errors in user
+            provided functions are raised without additional information. Default
+            False.
 
     Returns:
         OptimizeResult: The optmization result.
@@ -230,6 +289,8 @@ def maximize(
         multistart_options=multistart_options,
         collect_history=collect_history,
         skip_checks=skip_checks,
+        budget=budget,
+        fast_mode=fast_mode,
     )
 
 
@@ -260,6 +321,8 @@ def minimize(
     multistart_options=None,
     collect_history=True,
     skip_checks=False,
+    budget=None,
+    fast_mode=False,
 ):
     """Minimize criterion using algorithm subject to constraints.
 
@@ -308,6 +371,11 @@ def minimize(
         numdiff_options (dict): Keyword arguments for the calculation of numerical
             derivatives. See :ref:`first_derivative` for details. Note that the default
             method is changed to "forward" for speed reasons.
+            A "sparsity" entry is the sparsity pattern of the Jacobian of the
+            criterion contributions with respect to the flattened params.
+            With {"backend": "jax"}, criterion and derivative are calculated with
+            automatic differentiation in JAX if no derivative is provided. This
+            requires a JAX traceable criterion and params without pandas objects.
         logging (pathlib.Path, str or False): Path to sqlite3 file (which typically has
             the file extension ``.db``. If the file does not exist, it will be created.
             When doing parallel optimizations and logging is provided, you have to
@@ -381,7 +449,9 @@ def minimize(
             parallel during exploration stages and number of parallel local
             optimization in optimization stages. Default 1.
             - batch_evaluator (str or callable): See :ref:`batch_evaluators` for
-            details. Default "joblib".
+            details. Default "joblib". The exploration evaluates estimagic's internal
+            criterion function, which cannot be traced by JAX. Thus, "jax" falls back
+            to "joblib" with a warning.
             - batch_size (int): If n_cores is larger than one, several starting points
             for local optimizations are created with the same weight and from the same
             currently best point. The ``batch_size`` argument is a way to reproduce
@@ -394,11 +464,41 @@ def minimize(
             discarded from the sample.
             - optimization_error_handling (str): One of "raise" or "continue". Default
             is continue, which means that failed optimizations are simply discarded.
+            - exploration_chunk_size (int): If not None, the exploration sample is
+            drawn and evaluated in chunks of this size and only the best points are
+            kept in memory. Then, the exploration sample and results in the
+            ``multistart_info`` only contain those points. Default None.
+            - clustering_critical_distance (float or str): If not None, points of the
+            exploration sample that have a better point within this distance are not
+            used as start points, as in multi level single linkage. Distances are
+            measured after scaling the sampling bounds to the unit hypercube. "mlsl"
+            uses the critical distance of Rinnooy Kan and Timmer (1987). Default None.
+            - racing (bool): If True, local optimizations are stopped as soon as their
+            parameters are within ``convergence.relative_params_tolerance`` of a local
+            optimum that was found before. The stopped optimization then counts as
+            another discovery of that optimum. Default False.
         collect_history (bool): Whether the history of parameters and criterion values
             should be collected and returned as part of the result. Default True.
         skip_checks (bool): Whether checks on the inputs are skipped. This makes the
             optimization faster, especially for very fast criterion functions. Default
             False.
+        budget (dict or None): Global budget for the whole optimization, including
+            multistart exploration, all local optimizations and numerical derivatives.
+            The dictionary can have the entries "max_seconds" (wall time),
+            "max_criterion_evaluations" and "max_core_seconds" (time spent in the
+            criterion function, multiplied by the number of cores used for numerical
+            derivatives). If the budget is exhausted, the optimization is stopped and
+            the best parameters found so far are returned. The ``message`` of the
+            result states which part of the budget was exhausted. Default None.
+        fast_mode (bool): If True, the optimizer calls thin wrappers around the user
+            provided functions instead of estimagic's internal criterion function. This
+            reduces the overhead per criterion evaluation to about a microsecond, which
+            matters for criterion functions that only take a few microseconds. It
+            requires params that are a 1d numpy array and is not compatible with
+            constraints, scaling, logging, multistart, budgets and
+            ``error_handling="continue"``. No history is collected and errors in user
+            provided functions are raised without additional information. Default
+            False.
 
     Returns:
         OptimizeResult: The optmization result.
@@ -431,8 +531,378 @@ def minimize(
         multistart_options=multistart_options,
         collect_history=collect_history,
         skip_checks=skip_checks,
+        budget=budget,
+        fast_mode=fast_mode,
+    )
+
+
+def minimize_many(
+    criterion,
+    params_list,
+    algorithm,
+    *,
+    lower_bounds=None,
+    upper_bounds=None,
+    criterion_kwargs=None,
+    problem_kwargs=None,
+    constraints=None,
+    algo_options=None,
+    derivative=None,
+    derivative_kwargs=None,
+    criterion_and_derivative=None,
+    criterion_and_derivative_kwargs=None,
+    numdiff_options=None,
+    error_handling="raise",
+    n_cores=1,
+    batch_evaluator="joblib",
+    chunk_size=None,
+):
+    """Minimize many independent problems that only differ in start params and data.
+
+    The problems have to be structurally identical, i.e. all params have the same
+    structure and the criterion outputs have the same structure. The processing of
+    the user functions, the converter for params, constraints and bounds and the
+    algorithm are set up once, based on the first problem, and then reused for all
+    problems. The problems are distributed over a pool of workers in chunks.
+
+    Args:
+        criterion (callable): See :func:`minimize`.
+        params_list (list): List of start parameters, one per problem.
+        algorithm (str or callable): See :func:`minimize`.
+        lower_bounds (pytree): Lower bounds that apply to all problems.
+        upper_bounds (pytree): Upper bounds that apply to all problems.
+        criterion_kwargs (dict): Keyword arguments for criterion that are the same for
+            all problems.
+        problem_kwargs (list or None): One dictionary per problem with keyword
+            arguments that differ between problems, e.g. the data of one individual.
+            Each of criterion, derivative and criterion_and_derivative receives the
+            entries that are arguments of it.
+        constraints (list, dict): Constraints that apply to all problems. Nonlinear
+            constraints are not supported. Fixed parameters are fixed at their values
+            in the first element of params_list.
+        algo_options (dict): See :func:`minimize`.
+        derivative (callable): See :func:`minimize`.
+        derivative_kwargs (dict): Keyword arguments for derivative that are the same
+            for all problems.
+        criterion_and_derivative (callable): See :func:`minimize`.
+        criterion_and_derivative_kwargs (dict): Keyword arguments for
+            criterion_and_derivative that are the same for all problems.
+        numdiff_options (dict): See :func:`minimize`.
+        error_handling (str): Either "raise" or "continue". With "continue", the
+            traceback of a failed optimization is stored as its message and the other
+            problems are still solved. Default "raise".
+        n_cores (int): Number of cores over which the problems are distributed.
+            Default 1.
+        batch_evaluator (str or callable): See :ref:`batch_evaluators`.
+        chunk_size (int or None): Number of problems that are solved by one task of
+            the batch evaluator. By default, there are about four chunks per core.
+
+    Returns:
+        ManyOptimizeResult: The results of all optimizations.
+
+    """
+    # ==================================================================================
+    # Set default values and check options
+    # ==================================================================================
+    params_list = list(params_list)
+    n_problems = len(params_list)
+    if n_problems == 0:
+        raise ValueError("params_list must not be empty.")
+
+    if problem_kwargs is None:
+        problem_kwargs = [{}] * n_problems
+    problem_kwargs = list(problem_kwargs)
+    if len(problem_kwargs) != n_problems:
+        raise ValueError(
+            "problem_kwargs must have one entry per element of params_list."
+        )
+
+    if error_handling not in ("raise", "continue"):
+        raise ValueError(
+            f"error_handling must be 'raise' or 'continue', not {error_handling}"
+        )
+
+    constraints = _setdefault(constraints, [])
+    if isinstance(constraints, dict):
+        constraints = [constraints]
+    if any(c["type"] == "nonlinear" for c in constraints):
+        raise NotImplementedError(
+            "minimize_many does not support nonlinear constraints."
+        )
+
+    raw_algo, algo_info = process_user_algorithm(algorithm)
+    algo_kwargs = set(algo_info.arguments)
+    primary_key = algo_info.primary_criterion_entry
+
+    if isinstance(derivative, dict):
+        derivative = derivative.get(primary_key)
+    if isinstance(criterion_and_derivative, dict):
+        criterion_and_derivative = criterion_and_derivative.get(primary_key)
+
+    user_functions = {
+        "criterion": (criterion, _setdefault(criterion_kwargs, {})),
+        "derivative": (derivative, _setdefault(derivative_kwargs, {})),
+        "criterion_and_derivative": (
+            criterion_and_derivative,
+            _setdefault(criterion_and_derivative_kwargs, {}),
+        ),
+    }
+
+    # ==================================================================================
+    # Check the user functions and evaluate them for the first problem
+    # ==================================================================================
+    used_problem_kwargs = set()
+    first_evaluations = {}
+    for name, (func, kwargs) in user_functions.items():
+        if func is None:
+            first_evaluations[name] = None
+            continue
+        relevant = _get_relevant_problem_kwargs(func, problem_kwargs[0])
+        used_problem_kwargs.update(relevant)
+        processed = process_func_of_params(
+            func, kwargs={**kwargs, **relevant}, name=name
+        )
+        try:
+            first_evaluations[name] = processed(params_list[0])
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as e:
+            msg = f"Error while evaluating {name} at the first start params."
+            raise InvalidFunctionError(msg) from e
+
+    unused = set(problem_kwargs[0]) - used_problem_kwargs
+    if unused:
+        raise InvalidKwargsError(
+            "The following problem_kwargs are not arguments of criterion, derivative "
+            f"or criterion_and_derivative:\n\n{sorted(unused)}"
+        )
+
+    if derivative is not None:
+        used_deriv = first_evaluations["derivative"]
+    elif criterion_and_derivative is not None:
+        used_deriv = first_evaluations["criterion_and_derivative"][1]
+    else:
+        used_deriv = None
+
+    # ==================================================================================
+    # Set up the converter and the algorithm once
+    # ==================================================================================
+    converter, internal_params = get_converter(
+        params=params_list[0],
+        constraints=constraints,
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds,
+        func_eval=first_evaluations["criterion"],
+        primary_key=primary_key,
+        scaling=False,
+        scaling_options=None,
+        derivative_eval=used_deriv,
+    )
+
+    numdiff_options = _fill_numdiff_options_with_defaults(
+        numdiff_options=_setdefault(numdiff_options, {}),
+        lower_bounds=internal_params.lower_bounds,
+        upper_bounds=internal_params.upper_bounds,
+    )
+
+    internal_algorithm = get_final_algorithm(
+        raw_algorithm=raw_algo,
+        algo_info=algo_info,
+        valid_kwargs=algo_kwargs,
+        lower_bounds=internal_params.lower_bounds,
+        upper_bounds=internal_params.upper_bounds,
+        nonlinear_constraints=[],
+        algo_options=_setdefault(algo_options, {}),
+        logging=False,
+        database=None,
+        collect_history=False,
+        fast_mode=True,
+    )
+
+    use_fast_functions = not get_fast_mode_incompatibilities(
+        params=params_list[0],
+        constraints=constraints,
+        func_eval=first_evaluations["criterion"],
+        primary_key=primary_key,
+    )
+
+    # ==================================================================================
+    # Solve the problems in chunks
+    # ==================================================================================
+    solve_chunk = functools.partial(
+        _minimize_chunk,
+        user_functions=user_functions,
+        internal_algorithm=internal_algorithm,
+        converter=converter,
+        algo_info=algo_info,
+        numdiff_options=numdiff_options,
+        first_evaluations=first_evaluations,
+        use_fast_functions=use_fast_functions,
+        error_handling=error_handling,
     )
 
+    if chunk_size is None:
+        chunk_size = int(np.ceil(n_problems / (4 * max(n_cores, 1))))
+    problems = list(zip(params_list, problem_kwargs))
+    chunks = [problems[i : i + chunk_size] for i in range(0, n_problems, chunk_size)]
+
+    batch_evaluator = process_batch_evaluator(batch_evaluator)
+    raw_results = batch_evaluator(
+        func=solve_chunk,
+        arguments=chunks,
+        n_cores=n_cores,
+        error_handling="raise",
+    )
+    raw_results = [res for chunk in raw_results for res in chunk]
+
+    # ==================================================================================
+    # Collect the results in arrays
+    # ==================================================================================
+    registry = get_registry(extended=True)
+    param_names = leaf_names(params_list[0], registry=registry)
+
+    params = np.full((n_problems, len(param_names)), np.nan)
+    for i, res in enumerate(raw_results):
+        if "params" in res:
+            params[i] = res["params"]
+
+    def _collect(key):
+        values = [res.get(key) for res in raw_results]
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+    out = ManyOptimizeResult(
+        params=params,
+        criterion=_collect("criterion"),
+        success=np.array([bool(res.get("success")) for res in raw_results]),
+        messages=[res.get("message") for res in raw_results],
+        n_criterion_evaluations=_collect("n_criterion_evaluations"),
+        n_iterations=_collect("n_iterations"),
+        param_names=param_names,
+        algorithm=algo_info.name,
+        _params_template=params_list[0],
+    )
+
+    return out
+
+
+def _minimize_chunk(
+    chunk,
+    *,
+    user_functions,
+    internal_algorithm,
+    converter,
+    algo_info,
+    numdiff_options,
+    first_evaluations,
+    use_fast_functions,
+    error_handling,
+):
+    """Minimize each problem in a chunk of (params, problem_kwargs) tuples."""
+    out = []
+    for params, problem_kwargs in chunk:
+        try:
+            res = _minimize_one(
+                params=params,
+                problem_kwargs=problem_kwargs,
+                user_functions=user_functions,
+                internal_algorithm=internal_algorithm,
+                converter=converter,
+                algo_info=algo_info,
+                numdiff_options=numdiff_options,
+                first_evaluations=first_evaluations,
+                use_fast_functions=use_fast_functions,
+            )
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            if error_handling == "raise":
+                raise
+            res = {"success": False, "message": get_traceback()}
+        out.append(res)
+    return out
+
+
+def _minimize_one(
+    params,
+    problem_kwargs,
+    *,
+    user_functions,
+    internal_algorithm,
+    converter,
+    algo_info,
+    numdiff_options,
+    first_evaluations,
+    use_fast_functions,
+):
+    funcs = {}
+    for name, (func, kwargs) in user_functions.items():
+        if func is None:
+            funcs[name] = None
+        else:
+            relevant = _get_relevant_problem_kwargs(func, problem_kwargs)
+            funcs[name] = functools.partial(func, **kwargs, **relevant)
+
+    tasks = {"criterion", "derivative", "criterion_and_derivative"} & set(
+        algo_info.arguments
+    )
+
+    if use_fast_functions:
+        problem_functions = get_fast_problem_functions(
+            **funcs,
+            func_eval=first_evaluations["criterion"],
+            derivative_eval=first_evaluations["derivative"],
+            criterion_and_derivative_eval=first_evaluations["criterion_and_derivative"],
+            primary_key=algo_info.primary_criterion_entry,
+            direction="minimize",
+            numdiff_options=numdiff_options,
+            tasks=tasks,
+        )
+    else:
+        problem_functions = {
+            task: functools.partial(
+                internal_criterion_and_derivative_template,
+                task=task,
+                direction="minimize",
+                converter=converter,
+                numdiff_options=numdiff_options,
+                logging=False,
+                database=None,
+                algo_info=algo_info,
+                error_handling="raise",
+                error_penalty_func=None,
+                fixed_log_data={},
+                **funcs,
+            )
+            for task in tasks
+        }
+
+    x = converter.params_to_internal(params)
+    raw_res = internal_algorithm(**problem_functions, x=x)
+
+    criterion = raw_res["solution_criterion"]
+    if not np.isscalar(criterion):
+        criterion = aggregate_func_output_to_value(
+            criterion, algo_info.primary_criterion_entry
+        )
+
+    out = {
+        "params": converter.params_from_internal(
+            raw_res["solution_x"], return_type="flat"
+        ),
+        "criterion": float(criterion),
+        "success": raw_res.get("success"),
+        "message": raw_res.get("message"),
+        "n_criterion_evaluations": raw_res.get("n_criterion_evaluations"),
+        "n_iterations": raw_res.get("n_iterations"),
+    }
+    return out
+
+
+def _get_relevant_problem_kwargs(func, problem_kwargs):
+    """Select the problem specific kwargs that are arguments of func."""
+    arguments = inspect.signature(func).parameters
+    return {key: val for key, val in problem_kwargs.items() if key in arguments}
+
 
 def _optimize(
     direction,
@@ -462,6 +932,8 @@ def _optimize(
     multistart_options,
     collect_history,
     skip_checks,
+    budget=None,
+    fast_mode=False,
 ):
     """Minimize or maximize criterion using algorithm subject to constraints.
 
@@ -594,6 +1066,19 @@ def _optimize(
             skip_checks=skip_checks,
         )
 
+    # with the jax backend, criterion and derivative are calculated by one jit compiled
+    # function that uses automatic differentiation instead of finite differences
+    numdiff_backend = numdiff_options.get("backend", "numpy")
+    numdiff_options = {k: v for k, v in numdiff_options.items() if k != "backend"}
+    if (
+        numdiff_backend == "jax"
+        and derivative is None
+        and criterion_and_derivative is None
+    ):
+        criterion_and_derivative = _get_jax_criterion_and_derivative(
+            criterion, params, key=algo_info.primary_criterion_entry
+        )
+
     # ==================================================================================
     # Do first evaluation of user provided functions
     # ==================================================================================
@@ -631,6 +1116,19 @@ def _optimize(
     else:
         used_deriv = None
 
+    if fast_mode:
+        check_fast_mode_compatibility(
+            params=params,
+            constraints=constraints + nonlinear_constraints,
+            func_eval=first_crit_eval,
+            primary_key=algo_info.primary_criterion_entry,
+            logging=logging,
+            error_handling=error_handling,
+            scaling=scaling,
+            multistart=multistart,
+            budget=budget,
+        )
+
     # ==================================================================================
     # Get the converter (for tree flattening, constraints and scaling)
     # ==================================================================================
@@ -674,6 +1172,14 @@ def _optimize(
         upper_bounds=internal_params.upper_bounds,
     )
 
+    if numdiff_options.get("sparsity") is not None:
+        sparsity = sparsity_to_internal(
+            numdiff_options["sparsity"], converter, internal_params.values
+        )
+        if algo_info.primary_criterion_entry == "value":
+            sparsity = sparsity.any(axis=0, keepdims=True)
+        numdiff_options["sparsity"] = sparsity
+
     # get error penalty function
     error_penalty_func = get_error_penalty_function(
         error_handling=error_handling,
@@ -684,6 +1190,24 @@ def _optimize(
         direction=direction,
     )
 
+    # share criterion evaluations with constraints that are derived from its output
+    if any(c.get("from_criterion", False) for c in nonlinear_constraints):
+        n_points = numdiff_options.get("n_steps", 1) * (len(internal_params.values) + 1)
+        shared_criterion = get_shared_criterion(
+            criterion=criterion,
+            converter=converter,
+            batch_evaluator=numdiff_options.get("batch_evaluator", "joblib"),
+            max_cache_size=4 * n_points,
+        )
+        criterion = shared_criterion.criterion
+        criterion_numdiff_options = {
+            **numdiff_options,
+            "batch_evaluator": shared_criterion.batch_evaluator,
+        }
+    else:
+        shared_criterion = None
+        criterion_numdiff_options = numdiff_options
+
     # process nonlinear constraints:
     internal_constraints = process_nonlinear_constraints(
         nonlinear_constraints=nonlinear_constraints,
@@ -691,6 +1215,7 @@ def _optimize(
         converter=converter,
         numdiff_options=numdiff_options,
         skip_checks=skip_checks,
+        shared_criterion=shared_criterion,
     )
 
     x = internal_params.values
@@ -708,6 +1233,21 @@ def _optimize(
         logging=logging,
         database=database,
         collect_history=collect_history,
+        fast_mode=fast_mode,
+    )
+    # ==================================================================================
+    # create the tracker of the global budget
+    # ==================================================================================
+    _start_criterion = aggregate_func_output_to_value(
+        converter.func_to_internal(first_crit_eval),
+        algo_info.primary_criterion_entry,
+    )
+    budget_tracker = get_budget_tracker(
+        budget=budget,
+        x=x,
+        criterion_value=(
+            _start_criterion if direction == "minimize" else -_start_criterion
+        ),
     )
     # ==================================================================================
     # partial arguments into the internal_criterion_and_derivative_template
@@ -718,12 +1258,13 @@ def _optimize(
         "converter": converter,
         "derivative": derivative,
         "criterion_and_derivative": criterion_and_derivative,
-        "numdiff_options": numdiff_options,
+        "numdiff_options": criterion_numdiff_options,
         "logging": logging,
         "database": database,
         "algo_info": algo_info,
         "error_handling": error_handling,
         "error_penalty_func": error_penalty_func,
+        "budget_tracker": budget_tracker,
     }
 
     internal_criterion_and_derivative = functools.partial(
@@ -739,51 +1280,73 @@ def _optimize(
                 task=task,
             )
 
+    if fast_mode:
+        problem_functions = get_fast_problem_functions(
+            criterion=criterion,
+            derivative=derivative,
+            criterion_and_derivative=criterion_and_derivative,
+            func_eval=first_crit_eval,
+            derivative_eval=first_deriv_eval if derivative is not None else None,
+            criterion_and_derivative_eval=(
+                first_crit_and_deriv_eval
+                if criterion_and_derivative is not None
+                else None
+            ),
+            primary_key=algo_info.primary_criterion_entry,
+            direction=direction,
+            numdiff_options=numdiff_options,
+            tasks=set(problem_functions),
+        )
+
     # ==================================================================================
     # Do actual optimization
     # ==================================================================================
-    if not multistart:
-        steps = [{"type": "optimization", "name": "optimization"}]
-
-        step_ids = log_scheduled_steps_and_get_ids(
-            steps=steps,
-            logging=logging,
-            database=database,
-        )
+    try:
+        if fast_mode:
+            raw_res = internal_algorithm(**problem_functions, x=x)
+        elif not multistart:
+            steps = [{"type": "optimization", "name": "optimization"}]
+
+            step_ids = log_scheduled_steps_and_get_ids(
+                steps=steps,
+                logging=logging,
+                database=database,
+            )
 
-        raw_res = internal_algorithm(**problem_functions, x=x, step_id=step_ids[0])
-    else:
-        multistart_options = _fill_multistart_options_with_defaults(
-            options=multistart_options,
-            params=params,
-            x=x,
-            params_to_internal=converter.params_to_internal,
-        )
+            raw_res = internal_algorithm(**problem_functions, x=x, step_id=step_ids[0])
+        else:
+            multistart_options = _fill_multistart_options_with_defaults(
+                options=multistart_options,
+                params=params,
+                x=x,
+                params_to_internal_batch=converter.params_to_internal_batch,
+            )
 
-        raw_res = run_multistart_optimization(
-            local_algorithm=internal_algorithm,
-            primary_key=algo_info.primary_criterion_entry,
-            problem_functions=problem_functions,
-            x=x,
-            lower_sampling_bounds=internal_params.soft_lower_bounds,
-            upper_sampling_bounds=internal_params.soft_upper_bounds,
-            options=multistart_options,
-            logging=logging,
-            database=database,
-            error_handling=error_handling,
-        )
+            raw_res = run_multistart_optimization(
+                local_algorithm=internal_algorithm,
+                primary_key=algo_info.primary_criterion_entry,
+                problem_functions=problem_functions,
+                x=x,
+                lower_sampling_bounds=internal_params.soft_lower_bounds,
+                upper_sampling_bounds=internal_params.soft_upper_bounds,
+                options=multistart_options,
+                logging=logging,
+                database=database,
+                error_handling=error_handling,
+                budget_tracker=budget_tracker,
+            )
+    except StopOptimizationError as e:
+        raw_res = e.current_status
+    finally:
+        if budget_tracker is not None:
+            budget_tracker.close()
 
     # ==================================================================================
     # Process the result
     # ==================================================================================
 
-    _scalar_start_criterion = aggregate_func_output_to_value(
-        converter.func_to_internal(first_crit_eval),
-        algo_info.primary_criterion_entry,
-    )
-
     fixed_result_kwargs = {
-        "start_criterion": _scalar_start_criterion,
+        "start_criterion": _start_criterion,
         "start_params": params,
         "algorithm": algo_info.name,
         "direction": direction,
@@ -852,6 +1415,17 @@ def _create_and_initialize_database(logging, log_options, problem_data):
     return database
 
 
+def _get_jax_criterion_and_derivative(criterion, params, key):
+    """Get a criterion_and_derivative function that uses automatic differentiation."""
+    derivative_and_func_value = get_jax_derivative_func(criterion, params, key=key)
+
+    def criterion_and_derivative(params):
+        derivative, func_value = derivative_and_func_value(params)
+        return func_value, derivative
+
+    return criterion_and_derivative
+
+
 def _fill_numdiff_options_with_defaults(numdiff_options, lower_bounds, upper_bounds):
     """Fill options for numerical derivatives during optimization with defaults."""
     method = numdiff_options.get("method", "forward")
@@ -869,6 +1443,9 @@ def _fill_numdiff_options_with_defaults(numdiff_options, lower_bounds, upper_bou
         "n_cores",
         "error_handling",
         "batch_evaluator",
+        "sparsity",
+        "richardson_tolerance",
+        "staged",
     }
 
     ignored = [option for option in numdiff_options if option not in relevant]
@@ -900,7 +1477,9 @@ def _setdefault(candidate, default):
     return out
 
 
-def _fill_multistart_options_with_defaults(options, params, x, params_to_internal):
+def _fill_multistart_options_with_defaults(
+    options, params, x, params_to_internal_batch
+):
     """Fill options for multistart optimization with defaults."""
     defaults = {
         "sample": None,
@@ -917,6 +1496,9 @@ def _fill_multistart_options_with_defaults(options, params, x, params_to_interna
         "seed": None,
         "exploration_error_handling": "continue",
         "optimization_error_handling": "continue",
+        "exploration_chunk_size": None,
+        "clustering_critical_distance": None,
+        "racing": False,
     }
 
     options = {k.replace(".", "_"): v for k, v in options.items()}
@@ -935,7 +1517,7 @@ def _fill_multistart_options_with_defaults(options, params, x, params_to_interna
 
     if out["sample"] is not None:
         out["sample"] = process_multistart_sample(
-            out["sample"], params, params_to_internal
+            out["sample"], params, params_to_internal_batch
         )
         out["n_samples"] = len(out["sample"])
 
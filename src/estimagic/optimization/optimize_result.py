@@ -4,8 +4,11 @@ from typing import Any, Dict, Union
 import numpy as np
 import pandas as pd
 
+from pybaum import tree_unflatten
+
 from estimagic.utilities import to_pickle
 from estimagic.compat import pd_df_map
+from estimagic.parameters.tree_registry import get_registry
 
 
 @dataclass
@@ -125,6 +128,86 @@ class OptimizeResult:
         to_pickle(self, path=path)
 
 
+@dataclass
+class ManyOptimizeResult:
+    """Results of many independent optimizations, stored in arrays.
+
+    **Attributes**
+
+    Attributes:
+        params (np.ndarray): 2d array with the flattened optimal parameters. Each row
+            corresponds to one problem.
+        criterion (np.ndarray): 1d array with the optimal criterion values.
+        success (np.ndarray): 1d boolean array. False if an optimization failed or the
+            algorithm did not report success.
+        messages (list): Messages returned by the underlying algorithm or the
+            tracebacks of failed optimizations.
+        n_criterion_evaluations (np.ndarray): 1d array with the number of criterion
+            evaluations. NaN if the algorithm does not report it.
+        n_iterations (np.ndarray): 1d array with the number of iterations. NaN if the
+            algorithm does not report it.
+        param_names (list): Names of the flattened parameters.
+        algorithm (str): The algorithm used for the optimizations.
+
+    """
+
+    params: np.ndarray
+    criterion: np.ndarray
+    success: np.ndarray
+    messages: list
+    n_criterion_evaluations: np.ndarray
+    n_iterations: np.ndarray
+    param_names: list
+    algorithm: str
+    _params_template: Any = field(default=None, repr=False)
+
+    def __len__(self):
+        return len(self.criterion)
+
+    def __repr__(self):
+        return (
+            f"Minimize {len(self)} problems with {self.algorithm}: "
+            f"{self.success.sum()} terminated successfully."
+        )
+
+    def get_params(self, index):
+        """Get the optimal parameters of one problem in the format of the params.
+
+        Args:
+            index (int): Position of the problem in params_list.
+
+        Returns:
+            pytree: The optimal parameters.
+
+        """
+        return tree_unflatten(
+            self._params_template,
+            list(self.params[index]),
+            registry=get_registry(extended=True),
+        )
+
+    def to_frame(self):
+        """Collect parameters, criterion values and success in a DataFrame.
+
+        Returns:
+            pandas.DataFrame: One row per problem.
+
+        """
+        out = pd.DataFrame(self.params, columns=self.param_names)
+        out["criterion"] = self.criterion
+        out["success"] = self.success
+        return out
+
+    def to_pickle(self, path):
+        """Save the ManyOptimizeResult object to pickle.
+
+        Args:
+            path (str, pathlib.Path): A str or pathlib.path ending in .pkl or .pickle.
+
+        """
+        to_pickle(self, path=path)
+
+
 def _format_convergence_report(report, algorithm):
     report = pd.DataFrame.from_dict(report)
     columns = ["one_step", "five_steps"]
@@ -11,6 +11,7 @@ from estimagic.optimization.pounders_history import LeastSquaresHistory
 from estimagic.optimization.pounders_auxiliary import (
     add_accepted_point_to_residual_model,
     add_geomtery_points_to_make_main_model_fully_linear,
+    add_speculative_candidates_to_history,
     create_initial_residual_model,
     create_main_from_residual_model,
     evaluate_residual_model,
@@ -19,6 +20,7 @@ from estimagic.optimization.pounders_auxiliary import (
     get_feature_matrices_residual_model,
     get_last_model_indices_and_check_for_repeated_model,
     solve_subproblem,
+    solve_subproblem_for_several_radii,
     update_main_model_with_new_accepted_x,
     update_residual_model,
     update_residual_model_with_new_accepted_x,
@@ -55,6 +57,7 @@ def pounders(
     c2=10,
     trustregion_subproblem_solver="bntr",
     trustregion_subsolver_options=None,
+    trustregion_n_speculative_candidates=1,
     batch_evaluator="joblib",
     n_cores=DEFAULT_N_CORES,
 ):
@@ -130,6 +133,7 @@ def pounders(
         k_hard_sub=trustregion_subsolver_options["k_hard"],
         batch_evaluator=batch_evaluator,
         n_cores=n_cores,
+        n_speculative_candidates=trustregion_n_speculative_candidates,
     )
 
     return result
@@ -169,6 +173,7 @@ def internal_solve_pounders(
     k_hard_sub,
     batch_evaluator,
     n_cores,
+    n_speculative_candidates=1,
 ):
     """Find the local minimum to a non-linear least-squares problem using POUNDERS.
 
@@ -246,6 +251,13 @@ def internal_solve_pounders(
             as the estimagic batch_evaluators.
         n_cores (int): Number of processes used to parallelize the function
             evaluations. Default is 1.
+        n_speculative_candidates (int): Number of trust-region candidates that are
+            evaluated in one batch per iteration. If larger than 1, the subproblem is
+            also solved for the shrunken radii that would be tried after
+            unsuccessful iterations and the candidate with the lowest criterion value
+            is used as the step. Geometry points are not evaluated speculatively
+            because they depend on whether the step is accepted. Default is 1, i.e. no
+            speculative evaluations.
 
     Returns:
         (dict) Result dictionary containing:
@@ -301,29 +313,56 @@ def internal_solve_pounders(
     converged = False
     convergence_reason = "Continue iterating."
 
+    subsolver_options = {
+        "conjugate_gradient_method": conjugate_gradient_method_sub,
+        "maxiter": maxiter_sub,
+        "maxiter_gradient_descent": maxiter_gradient_descent_sub,
+        "gtol_abs": gtol_abs_sub,
+        "gtol_rel": gtol_rel_sub,
+        "gtol_scaled": gtol_scaled_sub,
+        "gtol_abs_conjugate_gradient": gtol_abs_conjugate_gradient_sub,
+        "gtol_rel_conjugate_gradient": gtol_rel_conjugate_gradient_sub,
+        "k_easy": k_easy_sub,
+        "k_hard": k_hard_sub,
+    }
+
     for niter in range(maxiter + 1):
-        result_sub = solve_subproblem(
-            x_accepted=x_accepted,
-            main_model=main_model,
-            lower_bounds=lower_bounds,
-            upper_bounds=upper_bounds,
-            delta=delta,
-            solver=solver_sub,
-            conjugate_gradient_method=conjugate_gradient_method_sub,
-            maxiter=maxiter_sub,
-            maxiter_gradient_descent=maxiter_gradient_descent_sub,
-            gtol_abs=gtol_abs_sub,
-            gtol_rel=gtol_rel_sub,
-            gtol_scaled=gtol_scaled_sub,
-            gtol_abs_conjugate_gradient=gtol_abs_conjugate_gradient_sub,
-            gtol_rel_conjugate_gradient=gtol_rel_conjugate_gradient_sub,
-            k_easy=k_easy_sub,
-            k_hard=k_hard_sub,
-        )
+        if n_speculative_candidates == 1:
+            result_sub = solve_subproblem(
+                x_accepted=x_accepted,
+                main_model=main_model,
+                lower_bounds=lower_bounds,
+                upper_bounds=upper_bounds,
+                delta=delta,
+                solver=solver_sub,
+                **subsolver_options,
+            )
 
-        x_candidate = x_accepted + result_sub["x"] * delta
-        residuals_candidate = criterion(x_candidate)
-        history.add_entries(x_candidate, residuals_candidate)
+            x_candidate = x_accepted + result_sub["x"] * delta
+            residuals_candidate = criterion(x_candidate)
+            history.add_entries(x_candidate, residuals_candidate)
+        else:
+            results_sub = solve_subproblem_for_several_radii(
+                x_accepted=x_accepted,
+                main_model=main_model,
+                lower_bounds=lower_bounds,
+                upper_bounds=upper_bounds,
+                delta=delta,
+                gamma0=gamma0,
+                n_candidates=n_speculative_candidates,
+                solver=solver_sub,
+                **subsolver_options,
+            )
+            x_candidates = [x_accepted + res["x"] * delta for res in results_sub]
+            residuals = batch_evaluator(
+                criterion, arguments=x_candidates, n_cores=n_cores
+            )
+            history, result_sub = add_speculative_candidates_to_history(
+                history=history,
+                x_candidates=x_candidates,
+                residuals=residuals,
+                results=results_sub,
+            )
 
         predicted_reduction = history.get_critvals(
             accepted_index
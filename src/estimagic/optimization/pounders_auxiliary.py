@@ -3,7 +3,7 @@
 from typing import NamedTuple, Union
 
 import numpy as np
-from scipy.linalg import qr_multiply
+from scipy.linalg import qr_multiply, solve_triangular
 
 from estimagic.optimization.subsolvers.bntr import (
     bntr,
@@ -202,7 +202,7 @@ def solve_subproblem(
     gtol_abs_conjugate_gradient,
     gtol_rel_conjugate_gradient,
     k_easy,
-    k_hard
+    k_hard,
 ):
     """Solve the quadratic subproblem.
 
@@ -438,12 +438,60 @@ def add_geomtery_points_to_make_main_model_fully_linear(
 
     """
     n_params = len(x_accepted)
-
     current_history = history.get_n_fun()
 
-    x_candidate = np.zeros_like(x_accepted)
+    x_candidates_list = get_geometry_points(
+        main_model=main_model,
+        model_improving_points=model_improving_points,
+        x_accepted=x_accepted,
+        n_modelpoints=n_modelpoints,
+        delta=delta,
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds,
+    )
+    model_indices[n_modelpoints:n_params] = current_history + np.arange(
+        n_params - n_modelpoints
+    )
+
+    criterion_candidates_list = batch_evaluator(
+        criterion, arguments=x_candidates_list, n_cores=n_cores
+    )
+
+    history.add_entries(x_candidates_list, criterion_candidates_list)
+
+    return history, model_indices
+
+
+def get_geometry_points(
+    main_model,
+    model_improving_points,
+    x_accepted,
+    n_modelpoints,
+    delta,
+    lower_bounds,
+    upper_bounds,
+):
+    """Get the points that are needed to make the main model fully linear.
+
+    Args:
+        main_model (MainModel): Main model with the following parameters:
+             ``linear_terms`` and ``square terms``.
+        model_improving_points (np.ndarray): Array of shape (n_params, n_params)
+            including points to improve the main model.
+        x_accepted (np.ndarray): Accepted solution vector of the subproblem.
+            Shape (n_params,).
+        n_modelpoints (int): Current number of model points.
+        delta (float): Delta, current trust-region radius.
+        lower_bounds (np.ndarray): Lower bounds or None.
+        upper_bounds (np.ndarray): Upper bounds or None.
+
+    Returns:
+        list: List of n_params - n_modelpoints parameter vectors of shape
+            (n_params,).
+
+    """
+    n_params = len(x_accepted)
     x_candidates_list = []
-    criterion_candidates_list = []
 
     model_improving_points, _ = qr_multiply(model_improving_points, np.eye(n_params))
 
@@ -461,15 +509,112 @@ def add_geomtery_points_to_make_main_model_fully_linear(
                 np.stack([lower_bounds, x_candidate, upper_bounds]), axis=0
             )
         x_candidates_list.append(x_candidate)
-        model_indices[i] = current_history + i - n_modelpoints
 
-    criterion_candidates_list = batch_evaluator(
-        criterion, arguments=x_candidates_list, n_cores=n_cores
-    )
+    return x_candidates_list
 
-    history.add_entries(x_candidates_list, criterion_candidates_list)
 
-    return history, model_indices
+def solve_subproblem_for_several_radii(
+    x_accepted,
+    main_model,
+    lower_bounds,
+    upper_bounds,
+    delta,
+    gamma0,
+    n_candidates,
+    solver,
+    **subsolver_options,
+):
+    """Solve the quadratic subproblem for a sequence of shrinking trust-region radii.
+
+    The radii are delta, gamma0 * delta, gamma0 ** 2 * delta, and so on. These are the
+    radii pounders would try next if the candidates of the larger radii are rejected.
+    The sequence stops early if a solution also lies in the next smaller trust region
+    because all further subproblems would have the same solution.
+
+    Args:
+        x_accepted (np.ndarray): Currently accepted candidate vector of shape
+            (n_params,).
+        main_model (MainModel): Main model with the following parameters:
+             ``linear_terms`` and ``square terms``.
+        lower_bounds (np.ndarray): Lower bounds or None.
+        upper_bounds (np.ndarray): Upper bounds or None.
+        delta (float): Current trust-region radius.
+        gamma0 (float): Shrinking factor of the trust-region radius.
+        n_candidates (int): Maximum number of radii for which the subproblem is
+            solved.
+        solver (str): Trust-region subsolver to use. Either "bntr" or "gqtpar".
+        **subsolver_options: Keyword arguments passed to :func:`solve_subproblem`.
+
+    Returns:
+        list: List of result dictionaries of :func:`solve_subproblem`. The solutions
+            "x" are scaled to the current trust-region radius delta. The first entry
+            is the solution for the radius delta.
+
+    """
+    # bntr uses a box-shaped trust region, gqtpar a spherical one.
+    norm_order = np.inf if solver == "bntr" else 2
+
+    results = []
+    for k in range(n_candidates):
+        factor = gamma0**k
+        scaled_model = main_model._replace(
+            linear_terms=main_model.linear_terms * factor,
+            square_terms=main_model.square_terms * factor**2,
+        )
+        try:
+            result = solve_subproblem(
+                x_accepted=x_accepted,
+                main_model=scaled_model,
+                lower_bounds=lower_bounds,
+                upper_bounds=upper_bounds,
+                delta=delta * factor,
+                solver=solver,
+                **subsolver_options,
+            )
+        except ValueError:
+            # The solutions of "gqtpar" can slightly violate the trust region. This
+            # is only an error for the actual step, not for speculative candidates.
+            if k == 0:
+                raise
+            break
+        result = {**result, "x": result["x"] * factor}
+        results.append(result)
+
+        if np.linalg.norm(result["x"], ord=norm_order) < gamma0 * factor:
+            break
+
+    return results
+
+
+def add_speculative_candidates_to_history(history, x_candidates, residuals, results):
+    """Add the speculatively evaluated candidates to the history.
+
+    The candidate with the lowest criterion value is selected as the trust-region step
+    of the current iteration. It is added last, such that it has the index -1 in the
+    history, just as the single candidate in a non-speculative iteration.
+
+    Args:
+        history (LeastSquaresHistory): Class storing history of xs, residuals, and
+            critvals.
+        x_candidates (list): List of candidate vectors of shape (n_params,).
+        residuals (list): List of residual vectors of the candidates.
+        results (list): List of result dictionaries of the subproblems that
+            correspond to the candidates.
+
+    Returns:
+        Tuple:
+        - history (LeastSquaresHistory): Class storing history of xs, residuals, and
+            critvals.
+        - result_subproblem (dict): Result dictionary of the selected candidate.
+
+    """
+    critvals = [np.sum(np.asarray(res) ** 2) for res in residuals]
+    selected = int(np.argmin(critvals))
+    order = [i for i in range(len(x_candidates)) if i != selected] + [selected]
+
+    history.add_entries([x_candidates[i] for i in order], [residuals[i] for i in order])
+
+    return history, results[selected]
 
 
 def evaluate_residual_model(
@@ -500,21 +645,20 @@ def evaluate_residual_model(
             has shape (n_modelpoints, n_residuals).
 
     """
-    n_residuals = centered_residuals.shape[1]
     n_modelpoints = centered_xs.shape[0]
-    y_residuals = np.empty((n_modelpoints, n_residuals), dtype=np.float64)
 
-    for j in range(n_residuals):
-        x_dot_square_terms = centered_xs @ residual_model.square_terms[j, :, :]
+    linear = centered_xs @ residual_model.linear_terms
+    square = np.einsum(
+        "ik,jkl,il->ij",
+        centered_xs,
+        residual_model.square_terms,
+        centered_xs,
+        optimize=True,
+    )
 
-        for i in range(n_modelpoints):
-            y_residuals[i, j] = (
-                centered_residuals[i, j]
-                - residual_model.linear_terms[:, j] @ centered_xs[i, :]
-                - 0.5 * (x_dot_square_terms[i, :] @ centered_xs[i, :])
-            )
+    y_residuals = centered_residuals[:n_modelpoints] - linear - 0.5 * square
 
-    return y_residuals
+    return y_residuals.astype(np.float64)
 
 
 def get_feature_matrices_residual_model(
@@ -561,8 +705,6 @@ def get_feature_matrices_residual_model(
 
     m_mat = np.zeros((n_maxinterp, n_params + 1))
     m_mat[:, 0] = 1
-    m_mat_pad = np.zeros((n_maxinterp, n_maxinterp))
-    m_mat_pad[:n_maxinterp, : n_params + 1] = m_mat
 
     n_mat = np.zeros((n_maxinterp, n_poly_features))
 
@@ -571,6 +713,10 @@ def get_feature_matrices_residual_model(
         m_mat[i, 1:] = history.get_centered_xs(center_info, index=model_indices[i])
         n_mat[i, :] = _get_monomial_basis(m_mat[i, 1:])
 
+    # Instead of refactorizing the interpolation system for each candidate point, we
+    # update it when a point is accepted. See _check_candidate_point for details.
+    system = _get_interpolation_system(m_mat[: n_params + 1], n_mat[: n_params + 1])
+
     point = history.get_n_fun() - 1
     n_modelpoints = n_params + 1
 
@@ -594,27 +740,34 @@ def get_feature_matrices_residual_model(
             point -= 1
             continue
 
-        m_mat[n_modelpoints, 1:] = history.get_centered_xs(center_info, index=point)
-        n_mat[n_modelpoints, :] = _get_monomial_basis(m_mat[n_modelpoints, 1:])
-
-        m_mat_pad = np.zeros((n_maxinterp, n_maxinterp))
-        m_mat_pad[:n_maxinterp, : n_params + 1] = m_mat
+        m_mat[n_modelpoints, 1:] = candidate_x
+        n_mat[n_modelpoints, :] = _get_monomial_basis(candidate_x)
 
-        _n_z_mat, _ = qr_multiply(
-            m_mat_pad[: n_modelpoints + 1, :],
-            n_mat.T[:n_poly_features, : n_modelpoints + 1],
-        )
-        beta = np.linalg.svd(_n_z_mat.T[n_params + 1 :], compute_uv=False)
+        accept, candidate_system = None, None
+        if system is not None:
+            accept, candidate_system = _check_candidate_point(
+                m_mat[n_modelpoints], n_mat[n_modelpoints], system, theta2
+            )
+        if accept is None:
+            accept = _check_candidate_point_from_scratch(
+                m_mat[: n_modelpoints + 1],
+                n_mat[: n_modelpoints + 1],
+                theta2,
+                n_maxinterp,
+            )
 
-        if beta[min(n_modelpoints - n_params, n_poly_features) - 1] > theta2:
-            # Accept point
+        if accept:
             model_indices[n_modelpoints] = point
-            n_z_mat = _n_z_mat
+            # if the factors cannot be updated, all further checks are from scratch
+            system = candidate_system
 
             n_modelpoints += 1
 
         point -= 1
 
+    m_mat_pad = np.zeros((n_maxinterp, n_maxinterp))
+    m_mat_pad[:, : n_params + 1] = m_mat
+
     z_mat, _ = qr_multiply(
         m_mat_pad[:n_modelpoints, :],
         np.eye(n_maxinterp)[:, :n_modelpoints],
@@ -624,6 +777,11 @@ def get_feature_matrices_residual_model(
     if n_modelpoints == (n_params + 1):
         n_z_mat = np.zeros((n_maxinterp, n_poly_features))
         n_z_mat[:n_params, :n_params] = np.eye(n_params)
+    else:
+        n_z_mat, _ = qr_multiply(
+            m_mat_pad[:n_modelpoints, :],
+            n_mat.T[:n_poly_features, :n_modelpoints],
+        )
 
     return (
         m_mat[: n_params + 1, : n_params + 1],
@@ -634,6 +792,186 @@ def get_feature_matrices_residual_model(
     )
 
 
+class _InterpolationSystem(NamedTuple):
+    r_mat: np.ndarray  # shape (n_params + 1, n_params + 1)
+    q_t_n: np.ndarray  # shape (n_params + 1, n_poly_features)
+    z_t_n_lower: np.ndarray  # shape (n_null, n_null)
+    z_t_n_basis: np.ndarray  # shape (n_null, n_poly_features)
+
+
+def _get_interpolation_system(m_mat, n_mat):
+    """Factorize the interpolation system of the first n_params + 1 model points.
+
+    Args:
+        m_mat (np.ndarray): Linear features of the model points.
+            Shape (n_params + 1, n_params + 1).
+        n_mat (np.ndarray): Quadratic features of the model points.
+            Shape (n_params + 1, n_poly_features).
+
+    Returns:
+        _InterpolationSystem or None: The factors of the interpolation system. None if
+            m_mat is too ill-conditioned for the factors to be updated reliably.
+
+    """
+    q_mat, r_mat = np.linalg.qr(m_mat)
+
+    if np.linalg.cond(r_mat) > _MAX_CONDITION_NUMBER:
+        system = None
+    else:
+        system = _InterpolationSystem(
+            r_mat=r_mat,
+            q_t_n=q_mat.T @ n_mat,
+            z_t_n_lower=np.zeros((0, 0)),
+            z_t_n_basis=np.zeros((0, n_mat.shape[1])),
+        )
+    return system
+
+
+_MAX_CONDITION_NUMBER = 1e6
+_RELATIVE_DECISION_TOLERANCE = 1e-6
+
+
+def _check_candidate_point(m_row, n_row, system, theta2):
+    """Check if a candidate point keeps the interpolation set well poised.
+
+    A point is accepted if the smallest singular value of Z.T @ N, where Z is an
+    orthonormal basis of the null space of M.T, is larger than theta2 after adding the
+    point. Here, M and N are the linear and quadratic feature matrices of the model
+    points.
+
+    Adding a row to M keeps the old null space vectors (padded with a zero) and adds
+    one new vector z. Thus, Z.T @ N only gets one new row z.T @ N. With the QR
+    decomposition M = Q @ R, it is (n_row - w @ Q.T @ N) / sqrt(1 + w @ w), where w
+    solves R.T @ w = m_row. The rows of Z.T @ N are kept as L @ B, where L is lower
+    triangular and B has orthonormal rows, so the new row only adds one row to both
+    factors and the singular values of Z.T @ N are the ones of the small matrix L.
+
+    If the smallest singular value is too close to theta2 to be decided reliably, or
+    if Z.T @ N has more rows than columns, None is returned and the caller has to
+    check the candidate from scratch.
+
+    Args:
+        m_row (np.ndarray): Linear features of the candidate. Shape (n_params + 1,).
+        n_row (np.ndarray): Quadratic features of the candidate.
+            Shape (n_poly_features,).
+        system (_InterpolationSystem): Factors of the current interpolation system.
+        theta2 (float): Threshold for adding the candidate to the model.
+
+    Returns:
+        Tuple:
+        - accept (bool or None): Whether the candidate is accepted.
+        - _InterpolationSystem or None: The factors including the candidate. None if
+            the candidate is rejected or the factors cannot be updated.
+
+    """
+    n_null, n_poly_features = system.z_t_n_basis.shape
+    if n_null + 1 > n_poly_features:
+        return None, None
+
+    w = solve_triangular(system.r_mat, m_row, trans="T")
+    z_t_n_row = (n_row - w @ system.q_t_n) / np.sqrt(1 + w @ w)
+
+    # Gram-Schmidt with one re-orthogonalization
+    coefficients = system.z_t_n_basis @ z_t_n_row
+    residual = z_t_n_row - coefficients @ system.z_t_n_basis
+    correction = system.z_t_n_basis @ residual
+    residual = residual - correction @ system.z_t_n_basis
+    coefficients = coefficients + correction
+    residual_norm = np.linalg.norm(residual)
+
+    lower = np.zeros((n_null + 1, n_null + 1))
+    lower[:n_null, :n_null] = system.z_t_n_lower
+    lower[n_null, :n_null] = coefficients
+    lower[n_null, n_null] = residual_norm
+
+    singular_values = np.linalg.svd(lower, compute_uv=False)
+    tolerance = _RELATIVE_DECISION_TOLERANCE * max(1, singular_values[0])
+
+    if abs(singular_values[-1] - theta2) <= tolerance or residual_norm == 0:
+        accept = None
+    else:
+        accept = bool(singular_values[-1] > theta2)
+
+    candidate_system = None
+    if accept is not False and residual_norm > 0:
+        r_mat, q_t_n = _append_row_to_qr(system.r_mat, system.q_t_n, m_row, n_row)
+        candidate_system = _InterpolationSystem(
+            r_mat=r_mat,
+            q_t_n=q_t_n,
+            z_t_n_lower=lower,
+            z_t_n_basis=np.vstack([system.z_t_n_basis, residual / residual_norm]),
+        )
+
+    return accept, candidate_system
+
+
+def _append_row_to_qr(r_mat, q_t_b, row, b_row):
+    """Update R and Q.T @ B when a row is appended to A = Q @ R and to B.
+
+    The appended row is eliminated with Givens rotations, which are also applied to
+    Q.T @ B.
+
+    Args:
+        r_mat (np.ndarray): Upper triangular R factor of A. Shape (n, n).
+        q_t_b (np.ndarray): Q.T @ B. Shape (n, m).
+        row (np.ndarray): Row that is appended to A. Shape (n,).
+        b_row (np.ndarray): Row that is appended to B. Shape (m,).
+
+    Returns:
+        Tuple:
+        - np.ndarray: The updated R factor.
+        - np.ndarray: The updated Q.T @ B.
+
+    """
+    r_mat = r_mat.copy()
+    q_t_b = q_t_b.copy()
+    row = np.array(row, dtype=float)
+    b_row = np.array(b_row, dtype=float)
+
+    for k in range(len(row)):
+        radius = np.hypot(r_mat[k, k], row[k])
+        if radius == 0:
+            continue
+        cos, sin = r_mat[k, k] / radius, row[k] / radius
+
+        r_mat[k, k:], row[k:] = (
+            cos * r_mat[k, k:] + sin * row[k:],
+            cos * row[k:] - sin * r_mat[k, k:],
+        )
+        q_t_b[k], b_row = cos * q_t_b[k] + sin * b_row, cos * b_row - sin * q_t_b[k]
+
+    return r_mat, q_t_b
+
+
+def _check_candidate_point_from_scratch(m_mat, n_mat, theta2, n_maxinterp):
+    """Check a candidate point with QR and singular value decompositions.
+
+    This is the reference implementation of :func:`_check_candidate_point`. It is
+    used when the updated factors cannot decide reliably.
+
+    Args:
+        m_mat (np.ndarray): Linear features of the model points, with the candidate
+            in the last row. Shape (n_modelpoints + 1, n_params + 1).
+        n_mat (np.ndarray): Quadratic features of the model points, with the candidate
+            in the last row. Shape (n_modelpoints + 1, n_poly_features).
+        theta2 (float): Threshold for adding the candidate to the model.
+        n_maxinterp (int): Maximum number of interpolation points.
+
+    Returns:
+        bool: Whether the candidate is accepted.
+
+    """
+    n_candidates, n_linear_features = m_mat.shape
+    m_mat_pad = np.zeros((n_candidates, n_maxinterp))
+    m_mat_pad[:, :n_linear_features] = m_mat
+
+    n_z_mat, _ = qr_multiply(m_mat_pad, n_mat.T)
+    beta = np.linalg.svd(n_z_mat.T[n_linear_features:], compute_uv=False)
+
+    n_null = n_candidates - n_linear_features
+    return bool(beta[min(n_null, n_mat.shape[1]) - 1] > theta2)
+
+
 def fit_residual_model(
     m_mat,
     n_mat,
@@ -675,41 +1013,28 @@ def fit_residual_model(
     n_poly_terms = n_params * (n_params + 1) // 2
     _is_just_identified = n_modelpoints == (n_params + 1)
 
-    coeffs_linear = np.empty((n_residuals, n_params))
-    coeffs_square = np.empty((n_residuals, n_params, n_params))
-
+    # all residuals are fitted at once; the columns of beta and alpha correspond to
+    # the residuals
     if _is_just_identified:
-        coeffs_first_stage = np.zeros(n_params)
-        beta = np.zeros(n_poly_terms)
+        beta = np.zeros((n_poly_terms, n_residuals))
     else:
-        n_z_mat_square = n_z_mat.T @ n_z_mat
-
-    for k in range(n_residuals):
-        if not _is_just_identified:
-            z_y_vec = np.dot(z_mat.T, y_residuals[:, k])
-            coeffs_first_stage = np.linalg.solve(
-                np.atleast_2d(n_z_mat_square),
-                np.atleast_1d(z_y_vec),
-            )
+        n_z_mat = np.atleast_2d(n_z_mat)
+        z_y_mat = z_mat.T @ y_residuals
+        coeffs_first_stage = np.linalg.solve(n_z_mat.T @ n_z_mat, z_y_mat)
+        beta = n_z_mat @ coeffs_first_stage
 
-            beta = np.atleast_2d(n_z_mat) @ coeffs_first_stage
+    rhs = y_residuals - n_mat @ beta
+    alpha = np.linalg.solve(m_mat, rhs[: n_params + 1])
 
-        rhs = y_residuals[:, k] - n_mat @ beta
+    rows, cols = np.triu_indices(n_params)
+    scaled_beta = beta.T * np.where(rows == cols, 1, 1 / np.sqrt(2))
 
-        alpha = np.linalg.solve(m_mat, rhs[: n_params + 1])
-        coeffs_linear[k, :] = alpha[1 : (n_params + 1)]
-
-        num = 0
-        for i in range(n_params):
-            coeffs_square[k, i, i] = beta[num]
-            num += 1
-            for j in range(i + 1, n_params):
-                coeffs_square[k, j, i] = beta[num] / np.sqrt(2)
-                coeffs_square[k, i, j] = beta[num] / np.sqrt(2)
-                num += 1
+    coeffs_square = np.empty((n_residuals, n_params, n_params))
+    coeffs_square[:, rows, cols] = scaled_beta
+    coeffs_square[:, cols, rows] = scaled_beta
 
     coef = {
-        "linear_terms": coeffs_linear.T,
+        "linear_terms": alpha[1 : (n_params + 1)],
         "square_terms": coeffs_square,
     }
 
@@ -781,16 +1106,8 @@ def _get_monomial_basis(x):
         np.ndarray: Monomial basis of x of shape (n_params * (n_params + 1) / 2,).
 
     """
-    n_params = len(x)
-    monomial_basis = np.zeros(int(n_params * (n_params + 1) / 2))
-
-    j = 0
-    for i in range(n_params):
-        monomial_basis[j] = 0.5 * x[i] ** 2
-        j += 1
-
-        for k in range(i + 1, n_params):
-            monomial_basis[j] = x[i] * x[k] / np.sqrt(2)
-            j += 1
+    rows, cols = np.triu_indices(len(x))
+    weights = np.where(rows == cols, 0.5, 1 / np.sqrt(2))
+    monomial_basis = x[rows] * x[cols] * weights
 
     return monomial_basis
@@ -2,15 +2,15 @@ import numpy as np
 import pandas as pd
 
 
-def process_multistart_sample(raw_sample, params, params_to_internal):
+def process_multistart_sample(raw_sample, params, params_to_internal_batch):
     """Process a user provided multistart sample.
 
     Args:
         raw_sample (list, pd.DataFrame or np.ndarray): A user provided sample of
             external start parameters.
         params (pytree): User provided start parameters.
-        params_to_internal (callable): A function that converts external parameters
-            to internal ones.
+        params_to_internal_batch (callable): A function that converts a batch of
+            external parameters to a 2d array of internal ones.
 
 
     Returns:
@@ -34,7 +34,8 @@ def process_multistart_sample(raw_sample, params, params_to_internal):
             )
             raise ValueError(msg)
 
-        list_sample = [params.assign(value=row) for _, row in raw_sample.iterrows()]
+        # the flat representation of a params DataFrame is its value column
+        external_sample = raw_sample.to_numpy()
 
     elif isinstance(raw_sample, np.ndarray):
         if not is_np_params:
@@ -56,7 +57,7 @@ def process_multistart_sample(raw_sample, params, params_to_internal):
             )
             raise ValueError(msg)
 
-        list_sample = list(raw_sample)
+        external_sample = raw_sample
 
     elif not isinstance(raw_sample, (list, tuple)):
         msg = (
@@ -65,8 +66,8 @@ def process_multistart_sample(raw_sample, params, params_to_internal):
         )
         raise TypeError(msg)
     else:
-        list_sample = list(raw_sample)
+        external_sample = list(raw_sample)
 
-    sample = np.array([params_to_internal(x) for x in list_sample])
+    sample = params_to_internal_batch(external_sample)
 
     return sample
@@ -0,0 +1,95 @@
+"""Share criterion evaluations between the criterion and nonlinear constraints."""
+
+from typing import Callable, NamedTuple
+
+import numpy as np
+from pybaum import tree_just_flatten
+
+from estimagic.batch_evaluators import process_batch_evaluator
+from estimagic.parameters.tree_registry import get_registry
+
+
+class SharedCriterion(NamedTuple):
+    criterion: Callable
+    batch_evaluator: Callable
+
+
+def get_shared_criterion(criterion, converter, batch_evaluator, max_cache_size):
+    """Get a criterion whose evaluations are shared between all functions that use it.
+
+    The criterion is evaluated at most once per parameter vector as long as the result
+    is in the cache. This allows constraints that are derived from the criterion output
+    to reuse the evaluations that were done for the criterion and its numerical
+    derivative and vice versa.
+
+    The batch evaluator is meant for numerical derivatives of functions that are
+    evaluated at internal parameter vectors and are composed of the shared criterion
+    and cheap transformations of its output. It evaluates the criterion at all internal
+    parameter vectors that are not cached yet with the wrapped batch evaluator and then
+    evaluates the (cheap) function in the main process.
+
+    Args:
+        criterion (callable): The user provided criterion function with partialled
+            kwargs.
+        converter (Converter): NamedTuple with methods to convert between internal and
+            external parameters.
+        batch_evaluator (str or callable): The batch evaluator used for the criterion.
+        max_cache_size (int): Maximal number of criterion outputs that are stored. If
+            the cache is full, the oldest entries are removed.
+
+    Returns:
+        SharedCriterion: NamedTuple with entries "criterion" and "batch_evaluator".
+
+    """
+    registry = get_registry(extended=True)
+    batch_evaluator = process_batch_evaluator(batch_evaluator)
+    cache = {}
+
+    def get_key(params):
+        flat = np.array(tree_just_flatten(params, registry=registry), dtype=float)
+        return flat.tobytes()
+
+    def remove_oldest_entries():
+        while len(cache) > max_cache_size:
+            del cache[next(iter(cache))]
+
+    def shared_criterion(params):
+        key = get_key(params)
+        if key in cache:
+            out = cache[key]
+        else:
+            out = criterion(params)
+            cache[key] = out
+            remove_oldest_entries()
+        return out
+
+    def sharing_batch_evaluator(func, arguments, **kwargs):
+        params_list = [converter.params_from_internal(arg) for arg in arguments]
+        keys = [get_key(params) for params in params_list]
+
+        new = {}
+        for key, params in zip(keys, params_list):
+            if key not in cache and key not in new:
+                new[key] = params
+
+        failed = {}
+        if new:
+            results = batch_evaluator(
+                func=criterion, arguments=list(new.values()), **kwargs
+            )
+            for key, res in zip(new, results):
+                if isinstance(res, str):
+                    failed[key] = res
+                else:
+                    cache[key] = res
+
+        out = [
+            failed[key] if key in failed else func(arg)
+            for key, arg in zip(keys, arguments)
+        ]
+        remove_oldest_entries()
+        return out
+
+    return SharedCriterion(
+        criterion=shared_criterion, batch_evaluator=sharing_batch_evaluator
+    )
@@ -2,6 +2,15 @@
 
 import numpy as np
 
+from estimagic.config import IS_NUMBA_INSTALLED
+
+if IS_NUMBA_INSTALLED:
+    from numba import njit
+else:
+
+    def njit(**kwargs):  # noqa: ARG001
+        return lambda func: func
+
 
 def minimize_trust_cg(
     model_gradient, model_hessian, trustregion_radius, *, gtol_abs=1e-8, gtol_rel=1e-6
@@ -27,6 +36,24 @@ def minimize_trust_cg(
     Returns:
         np.ndarray: Solution vector of shape (n,).
 
+    """
+    return _minimize_trust_cg(
+        np.ascontiguousarray(model_gradient, dtype=np.float64),
+        np.ascontiguousarray(model_hessian, dtype=np.float64),
+        float(trustregion_radius),
+        float(gtol_abs),
+        float(gtol_rel),
+    )
+
+
+@njit(cache=True)
+def _minimize_trust_cg(
+    model_gradient, model_hessian, trustregion_radius, gtol_abs, gtol_rel
+):
+    """Minimize the quadratic subproblem via conjugate gradient.
+
+    See ``minimize_trust_cg`` for the arguments.
+
     """
     n = len(model_gradient)
     max_iter = n * 2
@@ -66,6 +93,7 @@ def minimize_trust_cg(
     return x_candidate
 
 
+@njit(cache=True)
 def _update_vectors_for_next_iteration(
     x_candidate, residual, direction, hessian, alpha
 ):
@@ -97,6 +125,7 @@ def _update_vectors_for_next_iteration(
     return x_candidate, residual, direction
 
 
+@njit(cache=True)
 def _get_distance_to_trustregion_boundary(candidate, direction, radius):
     """Compute the distance of the candidate vector to trustregion boundary.
 
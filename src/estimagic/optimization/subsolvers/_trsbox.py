@@ -2,6 +2,15 @@
 
 import numpy as np
 
+from estimagic.config import IS_NUMBA_INSTALLED
+
+if IS_NUMBA_INSTALLED:
+    from numba import njit
+else:
+
+    def njit(**kwargs):  # noqa: ARG001
+        return lambda func: func
+
 
 def minimize_trust_trsbox(
     model_gradient,
@@ -47,6 +56,12 @@ def minimize_trust_trsbox(
             of shape (n,).
 
     """
+    # consistent input types mean that only one signature of each kernel is compiled
+    model_gradient = np.ascontiguousarray(model_gradient, dtype=np.float64)
+    model_hessian = np.ascontiguousarray(model_hessian, dtype=np.float64)
+    lower_bounds = np.ascontiguousarray(lower_bounds, dtype=np.float64)
+    upper_bounds = np.ascontiguousarray(upper_bounds, dtype=np.float64)
+
     n = len(model_gradient)
     x_center = np.zeros(n)
 
@@ -147,7 +162,7 @@ def minimize_trust_trsbox(
                 hess_g,
             )
 
-        if index_bound_active is not None:
+        if index_bound_active != -1:
             n_fixed_variables += 1
             if gradient_projected[index_bound_active] >= 0:
                 x_bounded[index_bound_active] = 1
@@ -324,7 +339,7 @@ def _perform_alternative_trustregion_step(
 
             total_reduction = total_reduction + current_reduction
             if (
-                index_active_bound is not None
+                index_active_bound != -1
                 and index_angle_greatest_reduction == n_angles - 1
             ):
                 n_fixed_variables += 1
@@ -400,7 +415,7 @@ def _update_candidate_vectors_and_reduction(
     """Update candidate vectors and the associated criterion reduction."""
     current_min = g_hess_g / gradient_projected_sumsq
 
-    if index_bound_active is None and current_min > 0:
+    if index_bound_active == -1 and current_min > 0:
         if curve_min != -1.0:
             curve_min = min(curve_min, current_min)
         else:
@@ -431,11 +446,16 @@ def _update_candidate_vectors_and_reduction(
     )
 
 
+@njit(cache=True)
 def _take_constrained_step_up_to_boundary(
     x_candidate, gradient_projected, step_len, lower_bounds, upper_bounds
 ):
-    """Reduce step length, where boundary is hit, to preserve simple bounds."""
-    index_bound_active = None
+    """Reduce step length, where boundary is hit, to preserve simple bounds.
+
+    The index of the bound that becomes active is -1 if no bound becomes active.
+
+    """
+    index_bound_active = -1
 
     for i in range(len(x_candidate)):
         if gradient_projected[i] != 0:
@@ -455,6 +475,7 @@ def _take_constrained_step_up_to_boundary(
     return step_len, index_bound_active
 
 
+@njit(cache=True)
 def _calc_upper_bound_on_tangent(
     x_candidate,
     search_direction,
@@ -463,11 +484,16 @@ def _calc_upper_bound_on_tangent(
     upper_bounds,
     n_fixed_variables,
 ):
-    """Calculate upper bound on tangent of half the angle to the boundary."""
-    bound_on_tangent = 1
+    """Calculate upper bound on tangent of half the angle to the boundary.
+
+    The index of the active bound is -1 and the active bound is 0 if no bound
+    restricts the angle.
+
+    """
+    bound_on_tangent = 1.0
     free_variable_reached_bound = False
-    index_active_bound = None
-    active_bound = None
+    index_active_bound = -1
+    active_bound = 0
 
     for i in range(len(x_candidate)):
         if x_bounded[i] == 0:
@@ -514,6 +540,7 @@ def _calc_upper_bound_on_tangent(
     )
 
 
+@njit(cache=True)
 def _calc_greatest_criterion_reduction(
     bound_on_tangent, s_hess_s, x_hess_s, x_hess_x, x_grad, s_norm
 ):
@@ -524,12 +551,13 @@ def _calc_greatest_criterion_reduction(
     tangent of half the angle to the trust-region boundary.
 
     """
-    previous_reduction = None
-    next_reduction = None
+    previous_reduction = np.nan
+    next_reduction = np.nan
 
-    max_reduction = 0
+    max_reduction = 0.0
     index_angle_greatest_reduction = -1
-    old_reduction = 0
+    old_reduction = 0.0
+    tangent = 0.0
     n_angles = int(17 * bound_on_tangent + 3.1)
 
     for i in range(n_angles):
@@ -612,6 +640,7 @@ def _compute_new_search_direction_and_norm(
     return search_direction, s_norm
 
 
+@njit(cache=True)
 def _calc_new_reduction(tangent, sine, s_hess_s, x_hess_x, x_hess_s, x_grad, s_norm):
     """Calculate the new reduction in the criterion function."""
     raw_reduction = s_hess_s + tangent * (tangent * x_hess_x - 2.0 * x_hess_s)
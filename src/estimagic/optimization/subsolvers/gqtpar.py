@@ -5,7 +5,15 @@ from typing import NamedTuple, Union
 import numpy as np
 from scipy.linalg import cho_solve, solve_triangular
 from scipy.linalg.lapack import dpotrf as compute_cholesky_factorization
-from scipy.optimize._trustregion_exact import estimate_smallest_singular_value
+
+from estimagic.config import IS_NUMBA_INSTALLED
+
+if IS_NUMBA_INSTALLED:
+    from numba import njit
+else:
+
+    def njit(**kwargs):  # noqa: ARG001
+        return lambda func: func
 
 
 class HessianInfo(NamedTuple):
@@ -613,3 +621,70 @@ def _compute_terms_to_make_leading_submatrix_singular(hessian_info, k):
         )
 
     return delta, v
+
+
+def estimate_smallest_singular_value(upper_triangular):
+    """Estimate the smallest singular value of an upper triangular matrix.
+
+    Also estimates the corresponding right singular vector in O(n**2) operations.
+    This follows ``scipy.optimize._trustregion_exact.estimate_smallest_singular_value``
+    but is written such that it can be compiled with numba.
+
+    The procedure is based on Cline et al. (1979), "An estimate for the condition
+    number of a matrix". First, a vector e with components selected from {+1, -1} is
+    chosen such that the solution w of the system ``U.T w = e`` is as large as
+    possible (Golub and Van Loan (2013), "Matrix computations", pp. 140-142). Then
+    ``U v = w`` is solved by backward substitution.
+
+    Args:
+        upper_triangular (np.ndarray): Square upper triangular matrix of shape (n, n).
+
+    Returns:
+        Tuple:
+        - s_min (float): Estimated smallest singular value.
+        - z_min (np.ndarray): Estimated right singular vector of shape (n,).
+
+    """
+    # the cholesky factor from LAPACK is in fortran order; converting it means that
+    # only one signature of the kernel is compiled
+    return _estimate_smallest_singular_value(
+        np.ascontiguousarray(upper_triangular, dtype=np.float64)
+    )
+
+
+@njit(cache=True)
+def _estimate_smallest_singular_value(upper_triangular):
+    """Estimate the smallest singular value of an upper triangular matrix.
+
+    See ``estimate_smallest_singular_value`` for the arguments.
+
+    """
+    n = upper_triangular.shape[0]
+
+    p = np.zeros(n)
+    w = np.empty(n)
+
+    for k in range(n):
+        wp = (1 - p[k]) / upper_triangular[k, k]
+        wm = (-1 - p[k]) / upper_triangular[k, k]
+        pp = p[k + 1 :] + upper_triangular[k, k + 1 :] * wp
+        pm = p[k + 1 :] + upper_triangular[k, k + 1 :] * wm
+
+        if abs(wp) + np.sum(np.abs(pp)) >= abs(wm) + np.sum(np.abs(pm)):
+            w[k] = wp
+            p[k + 1 :] = pp
+        else:
+            w[k] = wm
+            p[k + 1 :] = pm
+
+    v = np.empty(n)
+    for i in range(n - 1, -1, -1):
+        v[i] = (w[i] - upper_triangular[i, i + 1 :] @ v[i + 1 :]) / upper_triangular[
+            i, i
+        ]
+
+    v_norm = np.linalg.norm(v)
+    s_min = np.linalg.norm(w) / v_norm
+    z_min = v / v_norm
+
+    return s_min, z_min
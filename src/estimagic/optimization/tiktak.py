@@ -15,10 +15,13 @@ import warnings
 from functools import partial
 
 import numpy as np
+from scipy.special import gamma
 from scipy.stats import qmc, triang
 
 from estimagic.batch_evaluators import process_batch_evaluator
 from estimagic.decorators import AlgoInfo
+from estimagic.exceptions import StopOptimizationError
+from estimagic.logging.write_to_database import append_rows
 from estimagic.optimization.optimization_logging import (
     log_scheduled_steps_and_get_ids,
     update_step_status,
@@ -38,6 +41,7 @@ def run_multistart_optimization(
     logging,
     database,
     error_handling,
+    budget_tracker=None,
 ):
     steps = determine_steps(options["n_samples"], options["n_optimizations"])
 
@@ -47,9 +51,15 @@ def run_multistart_optimization(
         database=database,
     )
 
+    chunk_size = options["exploration_chunk_size"]
     if options["sample"] is not None:
         sample = options["sample"]
-    else:
+        if chunk_size is not None:
+            sample = (
+                sample[start : start + chunk_size]
+                for start in range(0, len(sample), chunk_size)
+            )
+    elif chunk_size is None:
         sample = draw_exploration_sample(
             x=x,
             lower=lower_sampling_bounds,
@@ -62,6 +72,19 @@ def run_multistart_optimization(
         )
 
         sample = np.vstack([x.reshape(1, -1), sample])
+    else:
+        sample = draw_exploration_sample_in_chunks(
+            x=x,
+            lower=lower_sampling_bounds,
+            upper=upper_sampling_bounds,
+            # -1 because we add start parameters
+            n_samples=options["n_samples"] - 1,
+            chunk_size=chunk_size,
+            sampling_distribution=options["sampling_distribution"],
+            sampling_method=options["sampling_method"],
+            seed=options["seed"],
+        )
+        sample = _prepend_start_params(x, sample)
 
     if logging:
         update_step_status(
@@ -75,15 +98,27 @@ def run_multistart_optimization(
     else:
         criterion = partial(list(problem_functions.values())[0], task="criterion")
 
-    exploration_res = run_explorations(
-        criterion,
-        primary_key=primary_key,
-        sample=sample,
-        batch_evaluator=options["batch_evaluator"],
-        n_cores=options["n_cores"],
-        step_id=scheduled_steps[0],
-        error_handling=options["exploration_error_handling"],
-    )
+    if chunk_size is None:
+        exploration_res = run_explorations(
+            criterion,
+            primary_key=primary_key,
+            sample=sample,
+            batch_evaluator=options["batch_evaluator"],
+            n_cores=options["n_cores"],
+            step_id=scheduled_steps[0],
+            error_handling=options["exploration_error_handling"],
+        )
+    else:
+        exploration_res = run_explorations_in_chunks(
+            criterion,
+            primary_key=primary_key,
+            sample_chunks=sample,
+            n_best=options["n_optimizations"],
+            batch_evaluator=options["batch_evaluator"],
+            n_cores=options["n_cores"],
+            step_id=scheduled_steps[0],
+            error_handling=options["exploration_error_handling"],
+        )
 
     if logging:
         update_step_status(
@@ -106,19 +141,31 @@ def run_multistart_optimization(
             "The number of optimizations has been reduced from "
             f"{options['n_optimizations']} to {len(sorted_sample)}."
         )
-        skipped_steps = scheduled_steps[-n_skipped_steps:]
-        scheduled_steps = scheduled_steps[:-n_skipped_steps]
+        scheduled_steps = _skip_last_steps(
+            scheduled_steps, n_skipped_steps, logging, database
+        )
 
-        if logging:
-            for step in skipped_steps:
-                update_step_status(
-                    step=step,
-                    new_status="skipped",
-                    database=database,
-                )
+    start_sample = sorted_sample
+    if options["clustering_critical_distance"] is not None:
+        critical_distance = options["clustering_critical_distance"]
+        if critical_distance == "mlsl":
+            critical_distance = get_mlsl_critical_distance(
+                n_samples=options["n_samples"], n_params=len(x)
+            )
+        start_sample = cluster_exploration_sample(
+            sorted_sample=sorted_sample,
+            lower=lower_sampling_bounds,
+            upper=upper_sampling_bounds,
+            critical_distance=critical_distance,
+            n_optimizations=n_optimizations,
+        )
+        scheduled_steps = _skip_last_steps(
+            scheduled_steps, n_optimizations - len(start_sample), logging, database
+        )
+        n_optimizations = len(start_sample)
 
     batched_sample = get_batched_optimization_sample(
-        sorted_sample=sorted_sample,
+        sorted_sample=start_sample,
         n_optimizations=n_optimizations,
         batch_size=options["batch_size"],
     )
@@ -145,19 +192,39 @@ def run_multistart_optimization(
 
     batch_evaluator = options["batch_evaluator"]
 
+    local_algorithm = partial(
+        _run_local_optimization,
+        local_algorithm=local_algorithm,
+        logging=logging,
+        database=database,
+    )
+
     weight_func = partial(
         options["mixing_weight_method"],
         min_weight=options["mixing_weight_bounds"][0],
         max_weight=options["mixing_weight_bounds"][1],
     )
 
+    budget_message = None
     opt_counter = 0
     for batch in batched_sample:
         weight = weight_func(opt_counter, n_optimizations)
         starts = [weight * state["best_x"] + (1 - weight) * x for x in batch]
 
+        batch_functions = problem_functions
+        if options["racing"] and state["x_history"]:
+            known_optima = {
+                "x": np.array(state["x_history"]),
+                "results": state["result_history"],
+                "xtol": convergence_criteria["xtol"],
+            }
+            batch_functions = {
+                name: partial(func, known_optima=known_optima)
+                for name, func in problem_functions.items()
+            }
+
         arguments = [
-            {**problem_functions, "x": x, "step_id": step}
+            {**batch_functions, "x": x, "step_id": step}
             for x, step in zip(starts, scheduled_steps)
         ]
 
@@ -178,7 +245,9 @@ def run_multistart_optimization(
         )
         opt_counter += len(batch)
         scheduled_steps = scheduled_steps[len(batch) :]
-        if is_converged:
+        if budget_tracker is not None:
+            budget_message = budget_tracker.get_exhaustion_message()
+        if is_converged or budget_message is not None:
             if logging:
                 for step in scheduled_steps:
                     update_step_status(
@@ -188,7 +257,9 @@ def run_multistart_optimization(
                     )
             break
 
-    raw_res = state["best_res"]
+    raw_res = state["best_res"].copy()
+    if budget_message is not None:
+        raw_res["message"] = budget_message
     raw_res["multistart_info"] = {
         "start_parameters": state["start_history"],
         "local_optima": state["result_history"],
@@ -199,6 +270,42 @@ def run_multistart_optimization(
     return raw_res
 
 
+def _skip_last_steps(scheduled_steps, n_skipped_steps, logging, database):
+    """Mark the last n_skipped_steps steps as skipped and return the remaining ones."""
+    if n_skipped_steps <= 0:
+        return scheduled_steps
+
+    skipped_steps = scheduled_steps[-n_skipped_steps:]
+    if logging:
+        for step in skipped_steps:
+            update_step_status(
+                step=step,
+                new_status="skipped",
+                database=database,
+            )
+    return scheduled_steps[:-n_skipped_steps]
+
+
+def _run_local_optimization(local_algorithm, logging, database, **kwargs):
+    """Run a local optimization that can be stopped early.
+
+    If the local optimization is stopped because it came close to a known local
+    optimum, the result of that local optimum is returned.
+
+    """
+    try:
+        res = local_algorithm(**kwargs)
+    except StopOptimizationError as e:
+        res = e.current_status
+        if logging:
+            update_step_status(
+                step=kwargs["step_id"],
+                new_status="complete",
+                database=database,
+            )
+    return res
+
+
 def determine_steps(n_samples, n_optimizations):
     """Determine the number and type of steps for the multistart optimization.
 
@@ -264,6 +371,60 @@ def draw_exploration_sample(
             Each row represents a vector of parameter values.
 
     """
+    _check_sampling_inputs(lower, upper, sampling_distribution, sampling_method)
+    draw_unscaled = _get_unscaled_sampler(len(lower), sampling_method, seed)
+    return _scale_sample(
+        draw_unscaled(n_samples), x, lower, upper, sampling_distribution
+    )
+
+
+def draw_exploration_sample_in_chunks(
+    x,
+    lower,
+    upper,
+    n_samples,
+    chunk_size,
+    sampling_distribution,
+    sampling_method,
+    seed,
+):
+    """Draw the sample of the first stage of the tiktak algorithm in chunks.
+
+    Concatenating the chunks yields the same sample as
+    :func:`draw_exploration_sample`, but at most ``chunk_size`` points are held in
+    memory at the same time. Latin hypercube samples cannot be drawn in chunks.
+
+    Args:
+        x (np.ndarray): Internal parameter vector of shape (n_params,).
+        lower (np.ndarray): Vector of internal lower bounds of shape (n_params,).
+        upper (np.ndarray): Vector of internal upper bounds of shape (n_params,).
+        n_samples (int): Number of sample points.
+        chunk_size (int): Maximal number of sample points per chunk.
+        sampling_distribution (str): One of "uniform", "triangular".
+        sampling_method (str): One of "sobol", "halton" or "random".
+        seed (int): Random seed.
+
+    Yields:
+        np.ndarray: Numpy arrays of shape (chunk_size, n_params). The last chunk can
+            be shorter.
+
+    """
+    _check_sampling_inputs(lower, upper, sampling_distribution, sampling_method)
+    if sampling_method == "latin_hypercube":
+        raise ValueError(
+            "Latin hypercube samples cannot be drawn in chunks. Use another "
+            "sampling_method or set exploration_chunk_size to None."
+        )
+    draw_unscaled = _get_unscaled_sampler(len(lower), sampling_method, seed)
+
+    for start in range(0, n_samples, chunk_size):
+        n_draws = min(chunk_size, n_samples - start)
+        yield _scale_sample(
+            draw_unscaled(n_draws), x, lower, upper, sampling_distribution
+        )
+
+
+def _check_sampling_inputs(lower, upper, sampling_distribution, sampling_method):
     valid_rules = ["sobol", "halton", "latin_hypercube", "random"]
     valid_distributions = ["uniform", "triangular"]
 
@@ -282,27 +443,36 @@ def draw_exploration_sample(
                 f"soft_{name}_bounds for all parameters."
             )
 
+
+def _get_unscaled_sampler(n_params, sampling_method, seed):
+    """Get a function that draws the next n points from the unit hypercube."""
     if sampling_method == "sobol":
         # Draw `n` points from the open interval (lower, upper)^d.
         # Note that scipy uses the half-open interval [lower, upper)^d internally.
         # We apply a burn-in phase of 1, i.e. we skip the first point in the sequence
         # and thus exclude the lower bound.
-        sampler = qmc.Sobol(d=len(lower), scramble=False, seed=seed)
+        sampler = qmc.Sobol(d=n_params, scramble=False, seed=seed)
         _ = sampler.fast_forward(1)
-        sample_unscaled = sampler.random(n=n_samples)
+        draw = sampler.random
 
     elif sampling_method == "halton":
-        sampler = qmc.Halton(d=len(lower), scramble=False, seed=seed)
-        sample_unscaled = sampler.random(n=n_samples)
+        sampler = qmc.Halton(d=n_params, scramble=False, seed=seed)
+        draw = sampler.random
 
     elif sampling_method == "latin_hypercube":
-        sampler = qmc.LatinHypercube(d=len(lower), strength=1, seed=seed)
-        sample_unscaled = sampler.random(n=n_samples)
+        sampler = qmc.LatinHypercube(d=n_params, strength=1, seed=seed)
+        draw = sampler.random
 
     elif sampling_method == "random":
         rng = get_rng(seed)
-        sample_unscaled = rng.uniform(size=(n_samples, len(lower)))
 
+        def draw(n):
+            return rng.uniform(size=(n, n_params))
+
+    return draw
+
+
+def _scale_sample(sample_unscaled, x, lower, upper, sampling_distribution):
     if sampling_distribution == "uniform":
         sample_scaled = qmc.scale(sample_unscaled, lower, upper)
     elif sampling_distribution == "triangular":
@@ -316,6 +486,17 @@ def draw_exploration_sample(
     return sample_scaled
 
 
+def _prepend_start_params(x, sample_chunks):
+    """Add the start parameters as first point of the first chunk."""
+    x = x.reshape(1, -1)
+    is_first = True
+    for chunk in sample_chunks:
+        yield np.vstack([x, chunk]) if is_first else chunk
+        is_first = False
+    if is_first:
+        yield x
+
+
 def run_explorations(
     func, primary_key, sample, batch_evaluator, n_cores, step_id, error_handling
 ):
@@ -345,6 +526,123 @@ def run_explorations(
             "root_contributions": None or 2d numpy array with the root_contributions
                 entries of the function evaluations.
 
+    """
+    raw_values = _evaluate_exploration_sample(
+        func=func,
+        primary_key=primary_key,
+        sample=sample,
+        batch_evaluator=process_batch_evaluator(batch_evaluator),
+        n_cores=n_cores,
+        step_id=step_id,
+        error_handling=error_handling,
+    )
+
+    is_valid = np.isfinite(raw_values)
+
+    if not is_valid.any():
+        raise RuntimeError(
+            "All function evaluations of the exploration phase in a multistart "
+            "optimization are invalid. Check your code or the sampling bounds."
+        )
+
+    valid_values = raw_values[is_valid]
+    valid_sample = sample[is_valid]
+
+    # this sorts from low to high values; internal criterion and derivative took care
+    # of the sign switch.
+    sorting_indices = np.argsort(valid_values)
+
+    out = {
+        "sorted_values": valid_values[sorting_indices],
+        "sorted_sample": valid_sample[sorting_indices],
+    }
+
+    return out
+
+
+def run_explorations_in_chunks(
+    func,
+    primary_key,
+    sample_chunks,
+    n_best,
+    batch_evaluator,
+    n_cores,
+    step_id,
+    error_handling,
+):
+    """Do the function evaluations for the exploration phase chunk by chunk.
+
+    In contrast to :func:`run_explorations`, only the scalar function values of the
+    current chunk and the ``n_best`` best points evaluated so far are kept in memory.
+
+    Args:
+        func (callable): See :func:`run_explorations`.
+        primary_key: The primary criterion entry of the local optimizer. Needed to
+            interpret the output of the internal criterion function.
+        sample_chunks (iterable): Iterable of 2d numpy arrays where each row is a
+            sampled internal parameter vector.
+        n_best (int): Number of best parameter vectors that are kept.
+        batch_evaluator (str or callable): See :ref:`batch_evaluators`.
+        n_cores (int): Number of cores.
+        step_id (int): The identifier of the exploration step.
+        error_handling (str): One of "raise" or "continue".
+
+    Returns:
+        dict: A dictionary with the the following entries:
+            "sorted_values": 1d numpy array with the ``n_best`` lowest function
+                values. Invalid function values are excluded.
+            "sorted_sample": 2d numpy array with corresponding internal parameter
+                vectors.
+
+    """
+    batch_evaluator = process_batch_evaluator(batch_evaluator)
+
+    best_values = np.array([])
+    best_sample = None
+    for chunk in sample_chunks:
+        raw_values = _evaluate_exploration_sample(
+            func=func,
+            primary_key=primary_key,
+            sample=chunk,
+            batch_evaluator=batch_evaluator,
+            n_cores=n_cores,
+            step_id=step_id,
+            error_handling=error_handling,
+        )
+        is_valid = np.isfinite(raw_values)
+
+        if best_sample is None:
+            best_sample = np.empty((0, chunk.shape[1]))
+        values = np.concatenate([best_values, raw_values[is_valid]])
+        sample = np.vstack([best_sample, chunk[is_valid]])
+
+        # stable sorting keeps the earlier evaluated point in case of ties
+        keep = np.argsort(values, kind="stable")[:n_best]
+        best_values = values[keep]
+        best_sample = sample[keep]
+
+    if len(best_values) == 0:
+        raise RuntimeError(
+            "All function evaluations of the exploration phase in a multistart "
+            "optimization are invalid. Check your code or the sampling bounds."
+        )
+
+    out = {
+        "sorted_values": best_values,
+        "sorted_sample": best_sample,
+    }
+
+    return out
+
+
+def _evaluate_exploration_sample(
+    func, primary_key, sample, batch_evaluator, n_cores, step_id, error_handling
+):
+    """Evaluate func on all points of sample and return the scalar function values.
+
+    If func is the internal criterion function and logging is used, the evaluations
+    are written to the database at once after all evaluations are done.
+
     """
     algo_info = AlgoInfo(
         primary_criterion_entry=primary_key,
@@ -362,9 +660,11 @@ def run_explorations(
         error_handling=error_handling,
     )
 
-    arguments = [{"x": x, "fixed_log_data": {"step": int(step_id)}} for x in sample]
+    log_in_bulk = isinstance(func, partial) and func.keywords.get("logging", False)
+    if log_in_bulk:
+        _func = partial(_func, return_log_entry=True)
 
-    batch_evaluator = process_batch_evaluator(batch_evaluator)
+    arguments = [{"x": x, "fixed_log_data": {"step": int(step_id)}} for x in sample]
 
     criterion_outputs = batch_evaluator(
         _func,
@@ -375,31 +675,71 @@ def run_explorations(
         error_handling="raise",
     )
 
+    if log_in_bulk:
+        log_entries = [entry for _, entry in criterion_outputs if entry is not None]
+        append_rows(
+            log_entries,
+            "optimization_iterations",
+            database=func.keywords["database"],
+        )
+        criterion_outputs = [out for out, _ in criterion_outputs]
+
     values = [aggregate_func_output_to_value(c, primary_key) for c in criterion_outputs]
 
-    raw_values = np.array(values)
+    return np.array(values, dtype=float)
 
-    is_valid = np.isfinite(raw_values)
 
-    if not is_valid.any():
-        raise RuntimeError(
-            "All function evaluations of the exploration phase in a multistart "
-            "optimization are invalid. Check your code or the sampling bounds."
-        )
+def cluster_exploration_sample(
+    sorted_sample, lower, upper, critical_distance, n_optimizations
+):
+    """Select start points that are not close to a better point of the sample.
 
-    valid_values = raw_values[is_valid]
-    valid_sample = sample[is_valid]
+    As in multi level single linkage (`Rinnooy Kan and Timmer
+    <https://doi.org/10.1007/BF02592071>`_), a point of the exploration sample is
+    skipped if there is a point with a better function value within the critical
+    distance. It would most likely lead to the same local optimum. Distances are
+    measured after scaling the sampling bounds to the unit hypercube.
 
-    # this sorts from low to high values; internal criterion and derivative took care
-    # of the sign switch.
-    sorting_indices = np.argsort(valid_values)
+    Args:
+        sorted_sample (np.ndarray): 2d numpy array with internal parameter vectors,
+            sorted from best to worst function value.
+        lower (np.ndarray): Vector of internal lower sampling bounds.
+        upper (np.ndarray): Vector of internal upper sampling bounds.
+        critical_distance (float): Critical distance in the unit hypercube.
+        n_optimizations (int): Maximal number of selected start points.
 
-    out = {
-        "sorted_values": valid_values[sorting_indices],
-        "sorted_sample": valid_sample[sorting_indices],
-    }
+    Returns:
+        np.ndarray: 2d numpy array with the selected start points, sorted from best
+            to worst function value.
 
-    return out
+    """
+    scaled = (sorted_sample - lower) / (upper - lower)
+
+    selected = []
+    for i in range(len(scaled)):
+        if len(selected) == n_optimizations:
+            break
+        distances = np.linalg.norm(scaled[:i] - scaled[i], axis=1)
+        if i == 0 or distances.min() > critical_distance:
+            selected.append(i)
+
+    return sorted_sample[selected]
+
+
+def get_mlsl_critical_distance(n_samples, n_params, sigma=4):
+    """Calculate the critical distance of multi level single linkage.
+
+    Args:
+        n_samples (int): Number of sampled points.
+        n_params (int): Number of parameters.
+        sigma (float): Tuning parameter of the critical distance. Default 4.
+
+    Returns:
+        float: The critical distance in the unit hypercube.
+
+    """
+    volume_term = gamma(1 + n_params / 2) * sigma * np.log(n_samples) / n_samples
+    return volume_term ** (1 / n_params) / np.sqrt(np.pi)
 
 
 def get_batched_optimization_sample(sorted_sample, n_optimizations, batch_size):
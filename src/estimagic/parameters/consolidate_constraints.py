@@ -140,6 +140,10 @@ def _consolidate_equality_constraints(equality_constraints):
 def _join_overlapping_lists(candidates):
     """Bundle all candidates with with non-empty intersection.
 
+    Overlapping candidates are joined with a union-find structure, such that the
+    runtime is almost linear in the total number of elements. Bundles are ordered by
+    the first candidate that belongs to them. Empty candidates are ignored.
+
     Args:
         candidates (list): List of potentially overlapping lists.
 
@@ -148,36 +152,33 @@ def _join_overlapping_lists(candidates):
             and sorted.
 
     """
-    bundles = []
-
-    while len(candidates) > 0:
-        new_candidates = _unite_first_with_all_intersecting_elements(candidates)
-        if len(candidates) == len(new_candidates):
-            bundles.append(sorted(new_candidates[0]))
-            candidates = candidates[1:]
-        else:
-            candidates = new_candidates
-
-    return bundles
-
-
-def _unite_first_with_all_intersecting_elements(indices):
-    """Helper function to bundle overlapping indices.
-
-    Args:
-        indices (list): A list lists with indices.
-
-    """
-    first = set(indices[0])
-    new_first = first
-    new_others = []
-    for idx in indices[1:]:
-        if len(first.intersection(idx)) > 0:
-            new_first = new_first.union(idx)
-        else:
-            new_others.append(idx)
-
-    return [new_first, *new_others]
+    parent = {}
+
+    def _find(element):
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        # path compression
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+
+    for candidate in candidates:
+        for element in candidate:
+            parent.setdefault(element, element)
+        if len(candidate) > 0:
+            first_root = _find(next(iter(candidate)))
+            for element in candidate:
+                root = _find(element)
+                if root != first_root:
+                    parent[root] = first_root
+
+    bundles = {}
+    for candidate in candidates:
+        for element in candidate:
+            bundles.setdefault(_find(element), set()).add(element)
+
+    return [sorted(bundle) for bundle in bundles.values()]
 
 
 def _consolidate_fixes_with_equality_constraints(
@@ -325,20 +326,22 @@ def _plug_equality_constraints_into_selectors(
         is_equal_to[sorted(eq["index"])[1:]] = sorted(eq["index"])[0]
     post_replacements = is_equal_to.astype(int)
     is_fixed_to_other = is_equal_to >= 0
-    helper = pd.Series(post_replacements)
-    replace_dict = helper[helper >= 0].to_dict()
+    free_position = np.where(is_fixed_to_other, post_replacements, np.arange(n_params))
 
     plugged_in = []
     for constr in other_constraints:
         new = constr.copy()
-        new["index"] = pd.Series(constr["index"]).replace(replace_dict).tolist()
+        new["index"] = free_position[np.asarray(constr["index"], dtype=int)].tolist()
         plugged_in.append(new)
 
     linear_constraints, others = _split_constraints(plugged_in, "linear")
 
-    pc = []
+    # drop constraints of the same type on the same parameters
+    pc, seen = [], set()
     for constr in others:
-        if not _is_redundant(constr, pc):
+        key = (constr["type"], tuple(constr["index"]))
+        if key not in seen:
+            seen.add(key)
             pc.append(constr)
 
     pc += linear_constraints
@@ -353,8 +356,8 @@ def _consolidate_linear_constraints(
 
     Consolidation entails the following steps:
     - Plugging fixes and equality constraints into the linear constraints
-    - Collect weights of those constraints that overlap into weight DataFrames
-    - Collect corresponding right hand sides (bounds or values) in DataFrames
+    - Collect weights of those constraints that overlap into weight matrices
+    - Collect corresponding right hand sides (bounds or values) in matrices
     - Express box constraints of parameters involved in linear constraints as
       additional linear constraints.
     - Rescale the weights for easier detection of linear dependence
@@ -363,6 +366,14 @@ def _consolidate_linear_constraints(
     - Construct a list of consolidated constraint dictionaries that contain
         all matrices needed for the kernel transformations.
 
+    The weights of all constraints are stored in coordinate format (one entry per
+    row, column and non-zero weight) until they are split into bundles, such that the
+    runtime scales with the number of non-zero weights and not with the product of
+    the number of constraints and parameters.
+
+    Right hand sides are stored as 2d arrays with the columns "lower_bound",
+    "upper_bound" and "value".
+
     Args:
         params_vec (np.ndarray): 1d numpy array wtih parameters
         linear_constraints (list): Linear constraints that already have processed
@@ -374,138 +385,172 @@ def _consolidate_linear_constraints(
         list: Processed and consolidated linear constraints.
 
     """
-    weights, right_hand_side = _transform_linear_constraints_to_pandas_objects(
-        linear_constraints, n_params=len(params_vec)
+    n_params = len(params_vec)
+    rows, cols, weights, right_hand_side = _collect_linear_constraints(
+        linear_constraints
     )
 
-    weights = _plug_equality_constraints_into_linear_weights(
-        weights, constr_info["post_replacements"]
+    rows, cols, weights = _plug_equality_constraints_into_linear_weights(
+        rows, cols, weights, constr_info["post_replacements"]
     )
-    weights, right_hand_side = _plug_fixes_into_linear_weights_and_rhs(
+    rows, cols, weights, right_hand_side = _plug_fixes_into_linear_weights_and_rhs(
+        rows,
+        cols,
         weights,
         right_hand_side,
         constr_info["is_fixed_to_value"],
         constr_info["fixed_values"],
     )
 
-    involved_parameters = [set(w[w != 0].index) for _, w in weights.iterrows()]
+    # rows and cols are sorted by row; constraints without non-zero weights drop out
+    row_ids, row_starts = np.unique(rows, return_index=True)
+    involved_parameters = np.split(cols, row_starts[1:])
 
     bundled_indices = _join_overlapping_lists(involved_parameters)
 
+    bundle_of_param = np.full(n_params, -1)
+    for i, involved_params in enumerate(bundled_indices):
+        bundle_of_param[involved_params] = i
+    bundle_of_row = bundle_of_param[[c[0] for c in involved_parameters]]
+
     pc = []
-    for involved_parameters in bundled_indices:
-        w = weights[involved_parameters][
-            (weights[involved_parameters] != 0).any(axis=1)
-        ].copy(deep=True)
-        rhs = right_hand_side.loc[w.index].copy(deep=True)
+    for i, involved_params in enumerate(bundled_indices):
+        params_arr = np.array(involved_params)
+        positions = np.flatnonzero(bundle_of_row == i)
+        w = np.zeros((len(positions), len(params_arr)))
+        for j, pos in enumerate(positions):
+            start, stop = row_starts[pos], row_starts[pos] + len(
+                involved_parameters[pos]
+            )
+            w[j, np.searchsorted(params_arr, cols[start:stop])] = weights[start:stop]
+        rhs = right_hand_side[row_ids[positions]]
+
         w, rhs = _express_bounds_as_linear_constraints(
-            w, rhs, constr_info["lower_bounds"], constr_info["upper_bounds"]
+            w,
+            rhs,
+            params_arr,
+            constr_info["lower_bounds"],
+            constr_info["upper_bounds"],
         )
         w, rhs = _rescale_linear_constraints(w, rhs)
         w, rhs = _drop_redundant_linear_constraints(w, rhs)
-        _check_consolidated_weights(w, param_names=param_names)
+        _check_consolidated_weights(w, params_arr, param_names=param_names)
         to_internal, from_internal = _get_kernel_transformation_matrices(w)
         constr = {
-            "index": list(w.columns),
+            "index": params_arr.tolist(),
             "type": "linear",
             "to_internal": to_internal,
             "from_internal": from_internal,
-            "right_hand_side": rhs,
+            "right_hand_side": pd.DataFrame(
+                rhs, columns=["lower_bound", "upper_bound", "value"]
+            ),
         }
         pc.append(constr)
 
     return pc
 
 
-def _transform_linear_constraints_to_pandas_objects(linear_constranits, n_params):
-    """Collect information from the linear constraint dictionaries into pandas objects.
+def _collect_linear_constraints(linear_constraints):
+    """Collect information from the linear constraint dictionaries into arrays.
 
     Args:
         linear_constraints (list): List of constraint of type "linear".
-        n_params (int): number of parameters.
 
     Returns:
-        weights (pd.DataFrame): DataFrame with one row per constraint and one column
-            per parameter. Columns names are the ilocs of the parameters in params.
-        rhs (pd.DataFrame): DataFrame with the columns "value", "lower_bound" and
-            "upper_bound" that collects the right hand sides of the constraints.
+        rows (np.ndarray): Row (i.e. constraint) of each weight.
+        cols (np.ndarray): Column (i.e. parameter iloc) of each weight.
+        weights (np.ndarray): The weights.
+        rhs (np.ndarray): 2d array with one row per constraint and the columns
+            "lower_bound", "upper_bound" and "value".
 
     """
-    all_weights, all_values, all_lbs, all_ubs = [], [], [], []
-    for constr in linear_constranits:
-        all_weights.append(constr["weights"])
-        all_values.append(constr.get("value", np.nan))
-        all_lbs.append(constr.get("lower_bound", -np.inf))
-        all_ubs.append(constr.get("upper_bound", np.inf))
-
-    weights = pd.concat(all_weights, axis=1).T.reset_index()
-    weights = weights.reindex(columns=np.arange(n_params)).fillna(0)
-    values = pd.Series(all_values, name="value")
-    lbs = pd.Series(all_lbs, name="lower_bound")
-    ubs = pd.Series(all_ubs, name="upper_bound")
-    rhs = pd.concat([values, lbs, ubs], axis=1)
+    rows, cols, weights, rhs = [], [], [], []
+    for i, constr in enumerate(linear_constraints):
+        rows.append(np.full(len(constr["weights"]), i))
+        cols.append(constr["weights"].index.to_numpy(dtype=int))
+        weights.append(constr["weights"].to_numpy(dtype=float))
+        rhs.append(
+            [
+                constr.get("lower_bound", -np.inf),
+                constr.get("upper_bound", np.inf),
+                constr.get("value", np.nan),
+            ]
+        )
 
-    return weights, rhs
+    return (
+        np.concatenate(rows),
+        np.concatenate(cols),
+        np.concatenate(weights),
+        np.array(rhs, dtype=float).reshape(-1, 3),
+    )
 
 
-def _plug_equality_constraints_into_linear_weights(weights, post_replacements):
+def _plug_equality_constraints_into_linear_weights(
+    rows, cols, weights, post_replacements
+):
     """Sum the weights of equality constrained parameters.
 
     The sum of the weights is then the new weight of the equality constrained parameter
     that is actually free. The weights of the other parameters are set to zero.
 
     Args:
-        weights (pd.DataFrame): Weight matrices for linear constraints.
-        post_replacements (pd.Series): The _post_replacements column of pp.
+        rows (np.ndarray): Row of each weight.
+        cols (np.ndarray): Column of each weight.
+        weights (np.ndarray): The weights.
+        post_replacements (np.ndarray): The post_replacements from constr_info.
 
     Returns:
-        plugged_weights (pd.DataFrame)
+        rows (np.ndarray): Row of each plugged weight. Sorted by row and column.
+        cols (np.ndarray): Column of each plugged weight.
+        weights (np.ndarray): The plugged weights.
 
     """
-    w = weights.T
-    plugged_iloc = pd.Series(post_replacements)
-    plugged_iloc = plugged_iloc.where(plugged_iloc >= 0, np.arange(len(plugged_iloc)))
-    w["plugged_iloc"] = plugged_iloc
-
-    plugged_weights = w.groupby("plugged_iloc").sum()
-    plugged_weights = plugged_weights.reindex(w.index).fillna(0).T
-
-    return plugged_weights
+    n_params = len(post_replacements)
+    free_position = np.where(
+        post_replacements >= 0, post_replacements, np.arange(n_params)
+    )
+    keys = rows * n_params + free_position[cols]
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    plugged_weights = np.bincount(inverse.ravel(), weights=weights)
+    plugged_rows, plugged_cols = np.divmod(unique_keys, n_params)
+    return plugged_rows, plugged_cols, plugged_weights
 
 
 def _plug_fixes_into_linear_weights_and_rhs(
-    weights, rhs, is_fixed_to_value, fixed_value
+    rows, cols, weights, rhs, is_fixed_to_value, fixed_value
 ):
-    """Set weights of fixed parameters to 0 and adjust right hand sides accordingly.
+    """Drop weights of fixed parameters and adjust right hand sides accordingly.
+
+    Weights that are zero are dropped as well.
 
     Args:
-        weights (pd.DataFrame): Weight matrix for linear constraint.
-        rhs (pd.DataFrame): Right hand side of the linear constraint.
-        is_fixed_to_value (pd.Series): The _is_fixed_to_value column of pp.
-        fixed_value (pd.Series): The _fixed_value column of pp.
+        rows (np.ndarray): Row of each weight.
+        cols (np.ndarray): Column of each weight.
+        weights (np.ndarray): The weights.
+        rhs (np.ndarray): Right hand sides of the linear constraints.
+        is_fixed_to_value (np.ndarray): The is_fixed_to_value entry of constr_info.
+        fixed_value (np.ndarray): The fixed_values entry of constr_info.
 
     Returns:
-        new_weights (pd.DataFrame)
-        new_rhs (pd.DataFrame)
+        rows (np.ndarray)
+        cols (np.ndarray)
+        weights (np.ndarray)
+        new_rhs (np.ndarray)
 
     """
-    ilocs = np.arange(len(fixed_value))
-    fixed_ilocs = ilocs[is_fixed_to_value].tolist()
-    new_rhs = rhs.copy()
-    new_weights = weights.copy()
-
-    if len(fixed_ilocs) > 0:
-        fixed_values = fixed_value[fixed_ilocs]
-        fixed_contribution = weights[fixed_ilocs] @ fixed_values
-        for column in ["lower_bound", "upper_bound", "value"]:
-            new_rhs[column] = new_rhs[column] - fixed_contribution
-        for i in fixed_ilocs:
-            new_weights[i] = 0
+    is_fixed = is_fixed_to_value[cols]
+    fixed_contribution = np.bincount(
+        rows[is_fixed],
+        weights=weights[is_fixed] * fixed_value[cols[is_fixed]],
+        minlength=len(rhs),
+    )
+    new_rhs = rhs - fixed_contribution.reshape(-1, 1)
 
-    return new_weights, new_rhs
+    keep = ~is_fixed & (weights != 0)
+    return rows[keep], cols[keep], weights[keep], new_rhs
 
 
-def _express_bounds_as_linear_constraints(weights, rhs, lower, upper):
+def _express_bounds_as_linear_constraints(weights, rhs, involved_params, lower, upper):
     """Express bounds of linearly constrained params as linear constraint.
 
     In general it is easier to keep bounds separately from the constraints
@@ -514,37 +559,29 @@ def _express_bounds_as_linear_constraints(weights, rhs, lower, upper):
     reparametrization.
 
     Args:
-        weights (pd.DataFrame): The weight matrix of the linear constraint.
-        rhs (pd.DataFrame): The right hand side of the linear constraint.
+        weights (np.ndarray): The weight matrix of the linear constraint.
+        rhs (np.ndarray): The right hand side of the linear constraint.
+        involved_params (np.ndarray): Ilocs of the parameters in the columns of
+            weights.
         lower (np.ndarray): Lower bounds.
         upper (np.ndarray): Upper bounds.
 
     Returns:
-        extended_weights (pd.DataFrame)
-        extended_rhs (pd.DataFrame)
+        extended_weights (np.ndarray)
+        extended_rhs (np.ndarray)
 
     """
-    additional_pc = []
-    for i in weights.columns:
-        new = {}
-        if np.isfinite(lower[i]):
-            new["lower_bound"] = lower[i]
-        if np.isfinite(upper[i]):
-            new["upper_bound"] = upper[i]
-        if new != {}:
-            new["weights"] = pd.Series([1], name="w", index=[i])
-            additional_pc.append(new)
-
-    if len(additional_pc) > 0:
-        new_weights, new_rhs = _transform_linear_constraints_to_pandas_objects(
-            additional_pc, len(lower)
-        )
-        new_weights = new_weights[weights.columns]
+    lb = lower[involved_params]
+    ub = upper[involved_params]
+    has_bounds = np.isfinite(lb) | np.isfinite(ub)
+
+    new_weights = np.eye(len(involved_params))[has_bounds]
+    new_rhs = np.column_stack(
+        [lb[has_bounds], ub[has_bounds], np.full(has_bounds.sum(), np.nan)]
+    )
 
-        extended_weights = pd.concat([weights, new_weights]).reset_index(drop=True)
-        extended_rhs = pd.concat([rhs, new_rhs]).reset_index(drop=True)
-    else:
-        extended_weights, extended_rhs = weights, rhs
+    extended_weights = np.vstack([weights, new_weights])
+    extended_rhs = np.vstack([rhs, new_rhs])
 
     return extended_weights, extended_rhs
 
@@ -555,24 +592,26 @@ def _rescale_linear_constraints(weights, rhs):
     This will make it easier to detect redundant rows.
 
     Args:
-        weights (pd.DataFrame): The weight matrix of the linear constraint.
-        rhs (pd.DataFrame): The right hand side of the linear constraint.
+        weights (np.ndarray): The weight matrix of the linear constraint.
+        rhs (np.ndarray): The right hand side of the linear constraint.
 
     Returns:
-        new_weights (pd.DataFrame)
-        new_rhs (pd.DataFrame)
+        new_weights (np.ndarray)
+        new_rhs (np.ndarray)
 
     """
-    first_nonzero = weights.replace(0, np.nan).bfill(axis=1).iloc[:, 0]
-    scaling_factor = 1 / first_nonzero.to_numpy().reshape(-1, 1)
-    new_weights = scaling_factor * weights
+    first_nonzero = weights[np.arange(len(weights)), (weights != 0).argmax(axis=1)]
+    scaling_factor = 1 / first_nonzero.reshape(-1, 1)
+    # adding zero turns negative zeros into zeros
+    new_weights = scaling_factor * weights + 0.0
     scaled_rhs = scaling_factor * rhs
-    new_rhs = scaled_rhs.copy()
-    new_rhs["lower_bound"] = scaled_rhs["lower_bound"].where(
-        scaling_factor.flatten() > 0, scaled_rhs["upper_bound"]
-    )
-    new_rhs["upper_bound"] = scaled_rhs["upper_bound"].where(
-        scaling_factor.flatten() > 0, scaled_rhs["lower_bound"]
+    is_positive = scaling_factor.flatten() > 0
+    new_rhs = np.column_stack(
+        [
+            np.where(is_positive, scaled_rhs[:, 0], scaled_rhs[:, 1]),
+            np.where(is_positive, scaled_rhs[:, 1], scaled_rhs[:, 0]),
+            scaled_rhs[:, 2],
+        ]
     )
 
     return new_weights, new_rhs
@@ -581,49 +620,53 @@ def _rescale_linear_constraints(weights, rhs):
 def _drop_redundant_linear_constraints(weights, rhs):
     """Drop linear constraints that are implied by other linear constraints.
 
-    This is not yet very smart. We just check for linearly dependent weights.
+    This is not yet very smart. We just check for identical rows in the rescaled
+    weights. The order of first appearance of the remaining rows is preserved.
 
     Args:
-        weights (pd.DataFrame): The weight matrix of the linear constraint.
-        rhs (pd.DataFrame): The right hand side of the linear constraint.
+        weights (np.ndarray): The weight matrix of the linear constraint.
+        rhs (np.ndarray): The right hand side of the linear constraint.
 
     Returns:
-        new_weights (pd.DataFrame)
-        new_rhs (pd.DataFrame)
+        new_weights (np.ndarray)
+        new_rhs (np.ndarray)
 
     """
-    weights["dupl_group"] = weights.groupby(list(weights.columns)).ngroup()
-    rhs["dupl_group"] = weights["dupl_group"]
-    weights.set_index("dupl_group", inplace=True)
-
-    new_weights = weights.drop_duplicates()
-
-    def _consolidate_fix(x):
-        vc = x.value_counts(dropna=True)
-        if len(vc) == 0:
-            return np.nan
-        elif len(vc) == 1:
-            return vc.index[0]
-        else:
+    _, first_index, inverse = np.unique(
+        weights, axis=0, return_index=True, return_inverse=True
+    )
+    order = np.argsort(first_index)
+    group_of_unique = np.empty_like(order)
+    group_of_unique[order] = np.arange(len(order))
+    group = group_of_unique[inverse.ravel()]
+    n_groups = len(order)
+
+    new_weights = weights[first_index[order]]
+
+    lb = np.full(n_groups, -np.inf)
+    np.maximum.at(lb, group, rhs[:, 0])
+    ub = np.full(n_groups, np.inf)
+    np.minimum.at(ub, group, rhs[:, 1])
+
+    fix = np.full(n_groups, np.nan)
+    has_value = np.isfinite(rhs[:, 2])
+    for g, value in zip(group[has_value], rhs[has_value, 2]):
+        if np.isnan(fix[g]):
+            fix[g] = value
+        elif fix[g] != value:
             raise ValueError
 
-    ub = rhs.groupby("dupl_group")["upper_bound"].min()
-    lb = rhs.groupby("dupl_group")["lower_bound"].max()
-    fix = rhs.groupby("dupl_group")["value"].apply(_consolidate_fix)
-
     # remove the bounds for fixed parameters
-    ub = ub.where(fix.isnull(), np.inf)
-    lb = lb.where(fix.isnull(), -np.inf)
+    is_fixed = np.isfinite(fix)
+    lb[is_fixed] = -np.inf
+    ub[is_fixed] = np.inf
 
-    new_rhs = pd.concat(
-        [lb, ub, fix], axis=1, names=["lower_bound", "upper_bound", "value"]
-    )
-    new_rhs = new_rhs.reindex(new_weights.index)
+    new_rhs = np.column_stack([lb, ub, fix])
 
     return new_weights, new_rhs
 
 
-def _check_consolidated_weights(weights, param_names):
+def _check_consolidated_weights(weights, involved_params, param_names):
     """Check the rank condition on the linear weights."""
     n_constraints, n_params = weights.shape
 
@@ -640,16 +683,18 @@ def _check_consolidated_weights(weights, param_names):
         "constraints as linear constraints but as bounds, fixes, increasing or "
         "decreasing constraints."
     )
-    relevant_names = [param_names[i] for i in weights.columns]
+    relevant_names = [param_names[i] for i in involved_params]
 
     if n_constraints > n_params:
+        weights_df = pd.DataFrame(weights, columns=involved_params)
         raise InvalidConstraintError(
-            msg_too_many + msg_general.format(relevant_names, weights)
+            msg_too_many + msg_general.format(relevant_names, weights_df)
         )
 
     if np.linalg.matrix_rank(weights) < n_constraints:
+        weights_df = pd.DataFrame(weights, columns=involved_params)
         raise InvalidConstraintError(
-            msg_rank + msg_general.format(relevant_names, weights)
+            msg_rank + msg_general.format(relevant_names, weights_df)
         )
 
 
@@ -659,7 +704,7 @@ def _get_kernel_transformation_matrices(weights):
     See :ref:`linear_constraint_implementation` for details.
 
     Args:
-        weights (pd.DataFrame): Weight matrix of a linear constraint.
+        weights (np.ndarray): Weight matrix of a linear constraint.
 
     """
     n_constraints, n_params = weights.shape
@@ -684,23 +729,6 @@ def _get_kernel_transformation_matrices(weights):
     return to_internal, from_internal
 
 
-def _is_redundant(candidate, others):
-    """Check if a constraint is redundant given other constraints.
-
-    Applicable to all but linear constraints.
-
-    """
-    assert candidate["type"] != "linear"
-    if len(others) == 0:
-        is_redundant = False
-    else:
-        same_type, _ = _split_constraints(others, candidate["type"])
-        duplicates = [c for c in same_type if c["index"] == candidate["index"]]
-        is_redundant = len(duplicates) > 0
-
-    return is_redundant
-
-
 def _unique_values(arr, dropna=True):
     if dropna:
         arr = arr[np.isfinite(arr)]
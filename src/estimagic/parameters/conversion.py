@@ -1,5 +1,6 @@
 """Aggregate the multiple parameter and function output conversions into on."""
 
+from collections.abc import Sequence
 from typing import NamedTuple, Callable
 
 import numpy as np
@@ -32,6 +33,8 @@ def get_converter(
     - Scaling of the parameter space (scale_conversion)
 
     The resulting converter can transform parameters, function outputs and derivatives.
+    Parameters can be converted one at a time or in batches, where a batch of internal
+    parameters is a 2d array with one parameter vector per row.
 
     If possible, fast paths for some or all transformations are chosen.
 
@@ -133,6 +136,35 @@ def get_converter(
             raise ValueError(msg)
         return out
 
+    def _params_to_internal_batch(params_batch):
+        if isinstance(params_batch, np.ndarray) and params_batch.ndim == 2:
+            x_flat = params_batch.astype(float)
+        else:
+            x_flat = np.array(
+                [tree_converter.params_flatten(p) for p in params_batch]
+            ).reshape(len(params_batch), -1)
+        x_internal = space_converter.params_to_internal(x_flat)
+        x_scaled = scale_converter.params_to_internal(x_internal)
+        return x_scaled
+
+    def _params_from_internal_batch(x, return_type="tree"):
+        x = np.atleast_2d(x)
+        x_unscaled = scale_converter.params_from_internal(x)
+        x_external = space_converter.params_from_internal(x_unscaled)
+
+        if return_type == "flat":
+            out = x_external
+        elif return_type in ("tree", "tree_and_flat"):
+            x_tree = LazyUnflattenedParams(x_external, tree_converter.params_unflatten)
+            out = x_tree if return_type == "tree" else (x_tree, x_external)
+        else:
+            msg = (
+                f"Invalid return type: {return_type}. Must be one of 'tree', 'flat', "
+                "'tree_and_flat'"
+            )
+            raise ValueError(msg)
+        return out
+
     def _derivative_to_internal(derivative_eval, x, jac_is_flat=False):
         if jac_is_flat:
             jacobian = derivative_eval
@@ -158,6 +190,8 @@ def get_converter(
         derivative_to_internal=_derivative_to_internal,
         func_to_internal=_func_to_internal,
         has_transforming_constraints=space_converter.has_transforming_constraints,
+        params_to_internal_batch=_params_to_internal_batch,
+        params_from_internal_batch=_params_from_internal_batch,
     )
 
     return converter, internal_params
@@ -169,6 +203,30 @@ class Converter(NamedTuple):
     derivative_to_internal: Callable
     func_to_internal: Callable
     has_transforming_constraints: bool
+    params_to_internal_batch: Callable
+    params_from_internal_batch: Callable
+
+
+class LazyUnflattenedParams(Sequence):
+    """Sequence of parameter pytrees that are only unflattened when accessed.
+
+    Args:
+        flat (np.ndarray): 2d array where each row is a flat external parameter vector.
+        unflatten (callable): Function that converts one row of ``flat`` into a pytree.
+
+    """
+
+    def __init__(self, flat, unflatten):
+        self.flat = flat
+        self._unflatten = unflatten
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyUnflattenedParams(self.flat[index], self._unflatten)
+        return self._unflatten(self.flat[index])
+
+    def __len__(self):
+        return len(self.flat)
 
 
 def aggregate_func_output_to_value(f_eval, primary_key):
@@ -216,6 +274,22 @@ def _fast_params_from_internal(x, return_type="tree"):
         return x
 
 
+def _fast_params_from_internal_batch(x, return_type="tree"):
+    x = np.atleast_2d(x).astype(float)
+    if return_type == "tree_and_flat":
+        return x, x
+    else:
+        return x
+
+
+def _fast_params_to_internal_batch(params_batch):
+    if isinstance(params_batch, np.ndarray):
+        out = params_batch.astype(float)
+    else:
+        out = np.array(params_batch, dtype=float)
+    return out
+
+
 def _get_fast_path_converter(params, lower_bounds, upper_bounds, primary_key):
     def _fast_derivative_to_internal(
         derivative_eval, x, jac_is_flat=True  # noqa: ARG001
@@ -229,6 +303,8 @@ def _get_fast_path_converter(params, lower_bounds, upper_bounds, primary_key):
         derivative_to_internal=_fast_derivative_to_internal,
         func_to_internal=UNPACK_FUNCTIONS[primary_key],
         has_transforming_constraints=False,
+        params_to_internal_batch=_fast_params_to_internal_batch,
+        params_from_internal_batch=_fast_params_from_internal_batch,
     )
 
     if lower_bounds is None:
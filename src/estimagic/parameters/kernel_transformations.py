@@ -22,6 +22,15 @@ using matrix calculus. See for example 'Matrix Differential Calculus with
 Applications in Statistics and Econometrics' by Magnus and Neudecker. In
 specific cases we refer to posts on math.stackexchange.com.
 
+Remarks on batched evaluation:
+------------------------------
+
+The functions that transform values (but not the jacobians) operate on the last
+axis of their input and broadcast over all leading axes. This allows to transform
+many parameter vectors and many constraints of the same type and size at once. In
+the latter case, the transformation matrices of linear constraints are stacked along
+the first axis.
+
 .. rubric:: References
 
 .. _post_mathoverflow:
@@ -29,13 +38,17 @@ specific cases we refer to posts on math.stackexchange.com.
 
 """
 
+from functools import lru_cache
+
 import numpy as np
+from scipy.linalg import solve_triangular
 
 from estimagic.utilities import (
     chol_params_to_lower_triangular_matrix,
-    cov_matrix_to_sdcorr_params,
+    cov_matrix_to_sdcorr_params,  # noqa: F401
     cov_params_to_matrix,
     dimension_to_number_of_triangular_elements,
+    number_of_triangular_elements_to_dimension,
     robust_cholesky,
     sdcorr_params_to_matrix,
 )
@@ -43,9 +56,9 @@ from estimagic.utilities import (
 
 def covariance_to_internal(external_values, constr):
     """Do a cholesky reparametrization."""
-    cov = cov_params_to_matrix(external_values)
-    chol = robust_cholesky(cov)
-    return chol[np.tril_indices(len(cov))]
+    cov = _cov_params_to_matrices(external_values)
+    chol = _robust_cholesky_stacked(cov)
+    return chol[(..., *np.tril_indices(cov.shape[-1]))]
 
 
 def covariance_to_internal_jacobian(external_values, constr):
@@ -63,6 +76,10 @@ def covariance_to_internal_jacobian(external_values, constr):
     .. math::
         \frac{\mathrm{d}x}{\mathrm{d}c} = (\frac{\mathrm{d}c}{\mathrm{d}x})^{-1}
 
+    The jacobian of ``covariance_from_internal`` is lower triangular, such that the
+    inverse can be calculated by forward substitution. If the Cholesky factor has zeros
+    on its diagonal, the jacobian is singular and we fall back to the pseudo inverse.
+
     Args:
         external_values (np.ndarray): Row-wise half-vectorized covariance matrix
 
@@ -76,15 +93,18 @@ def covariance_to_internal_jacobian(external_values, constr):
     internal = chol[np.tril_indices(len(chol))]
 
     deriv = covariance_from_internal_jacobian(internal, constr=None)
-    deriv = np.linalg.pinv(deriv)
+    if (np.diag(chol) != 0).all():
+        deriv = solve_triangular(deriv, np.eye(len(deriv)), lower=True)
+    else:
+        deriv = np.linalg.pinv(deriv)
     return deriv
 
 
 def covariance_from_internal(internal_values, constr):
     """Undo a cholesky reparametrization."""
-    chol = chol_params_to_lower_triangular_matrix(internal_values)
-    cov = chol @ chol.T
-    return cov[np.tril_indices(len(chol))]
+    chol = _chol_params_to_lower_triangular_matrices(internal_values)
+    cov = chol @ np.swapaxes(chol, -1, -2)
+    return cov[(..., *np.tril_indices(chol.shape[-1]))]
 
 
 def covariance_from_internal_jacobian(internal_values, constr):
@@ -116,6 +136,17 @@ def covariance_from_internal_jacobian(internal_values, constr):
 
     where :math:`c := \text{external}` and :math:`x := \text{internal}`.
 
+    Materializing :math:`K`, :math:`L` and :math:`X \otimes I` requires
+    :math:`O(\text{dim}^4)` memory. The implementation therefore evaluates the
+    entries of the result directly. Written element-wise, the above formula is
+
+    .. math::
+        \frac{\partial S_{ij}}{\partial X_{kl}} =
+            \delta_{ik} X_{jl} + \delta_{jk} X_{il} \,,
+
+    for :math:`i \geq j` and :math:`k \geq l`. In the row-wise ordering of the
+    lower triangular elements, the result is a lower triangular matrix.
+
     Args:
         internal_values (np.ndarray): Cholesky factors stored in an "internal"
             format.
@@ -125,25 +156,18 @@ def covariance_from_internal_jacobian(internal_values, constr):
 
     """
     chol = chol_params_to_lower_triangular_matrix(internal_values)
-    dim = len(chol)
-
-    K = _commutation_matrix(dim)
-    L = _elimination_matrix(dim)
-
-    left = np.eye(dim**2) + K
-    right = np.kron(chol, np.eye(dim))
-
-    intermediate = left @ right
+    rows_i, rows_j, cols_k, cols_l = _tril_index_grids(len(chol))
 
-    deriv = L @ intermediate @ L.T
+    deriv = (rows_i == cols_k) * chol[rows_j, cols_l]
+    deriv += (rows_j == cols_k) * chol[rows_i, cols_l]
     return deriv
 
 
 def sdcorr_to_internal(external_values, constr):
     """Convert sdcorr to cov and do a cholesky reparametrization."""
-    cov = sdcorr_params_to_matrix(external_values)
-    chol = robust_cholesky(cov)
-    return chol[np.tril_indices(len(cov))]
+    cov = _sdcorr_params_to_matrices(external_values)
+    chol = _robust_cholesky_stacked(cov)
+    return chol[(..., *np.tril_indices(cov.shape[-1]))]
 
 
 def sdcorr_to_internal_jacobian(external_values, constr):
@@ -162,6 +186,9 @@ def sdcorr_to_internal_jacobian(external_values, constr):
     .. math::
         \frac{\mathrm{d}x}{\mathrm{d}p} = (\frac{\mathrm{d}p}{\mathrm{d}x})^{-1}
 
+    If the jacobian of ``sdcorr_from_internal`` is singular, we fall back to the
+    pseudo inverse.
+
     Args:
         external_values (np.ndarray): Row-wise half-vectorized modified correlation
             matrix.
@@ -176,15 +203,18 @@ def sdcorr_to_internal_jacobian(external_values, constr):
     internal = chol[np.tril_indices(len(chol))]
 
     deriv = sdcorr_from_internal_jacobian(internal, constr=None)
-    deriv = np.linalg.pinv(deriv)
+    if (np.diag(chol) != 0).all():
+        deriv = np.linalg.solve(deriv, np.eye(len(deriv)))
+    else:
+        deriv = np.linalg.pinv(deriv)
     return deriv
 
 
 def sdcorr_from_internal(internal_values, constr):
     """Undo a cholesky reparametrization."""
-    chol = chol_params_to_lower_triangular_matrix(internal_values)
-    cov = chol @ chol.T
-    return cov_matrix_to_sdcorr_params(cov)
+    chol = _chol_params_to_lower_triangular_matrices(internal_values)
+    cov = chol @ np.swapaxes(chol, -1, -2)
+    return _cov_matrices_to_sdcorr_params(cov)
 
 
 def sdcorr_from_internal_jacobian(internal_values, constr):
@@ -228,6 +258,23 @@ def sdcorr_from_internal_jacobian(internal_values, constr):
     .. math::
         \frac{\mathrm{d}p}{\mathrm{d}x} = T \frac{\mathrm{d}p'}{\mathrm{d}x'} D
 
+    As in ``covariance_from_internal_jacobian``, the implementation evaluates the
+    entries of the result directly instead of materializing the Kronecker products.
+    Let :math:`s_i` be the i-th standard deviation and :math:`R` the correlation
+    matrix. Then
+
+    .. math::
+        \frac{\partial s_i}{\partial X_{kl}} = \delta_{ik} \frac{X_{il}}{s_i}
+
+    and for :math:`i > j`
+
+    .. math::
+        \frac{\partial R_{ij}}{\partial X_{kl}} =
+            \frac{\delta_{ik} X_{jl} + \delta_{jk} X_{il}}{s_i s_j}
+            - R_{ij} \left(
+                \frac{\delta_{ik} X_{il}}{s_i^2} + \frac{\delta_{jk} X_{jl}}{s_j^2}
+            \right) \,.
+
     Args:
         internal_values (np.ndarray): Cholesky factors stored in an "internal"
             format.
@@ -239,41 +286,34 @@ def sdcorr_from_internal_jacobian(internal_values, constr):
     X = chol_params_to_lower_triangular_matrix(internal_values)
     dim = len(X)
 
-    identity = np.eye(dim)
-    S = X @ X.T
-
-    #  the wrong formulation in the tinyurl stated: A = np.multiply(I, X)
-    A = np.sqrt(np.multiply(identity, S))
-
-    V = np.linalg.inv(A)
-
-    K = _commutation_matrix(dim)
-    Y = np.diag(identity.ravel("F"))
+    sds = np.sqrt((X**2).sum(axis=1))
+    corr = (X @ X.T) / np.outer(sds, sds)
 
-    #  with the wrong formulation in the tinyurl we would have had U = Y
-    norms = np.sqrt((X**2).sum(axis=1).reshape(-1, 1))
-    XX = X / norms
-    U = Y @ np.kron(identity, XX) @ K
+    _, _, cols_k, cols_l = _tril_index_grids(dim)
+    rows_i, rows_j = np.tril_indices(dim, k=-1)
+    rows_i = rows_i.reshape(-1, 1)
+    rows_j = rows_j.reshape(-1, 1)
 
-    N = np.kron(identity, X) @ K + np.kron(X, identity)
+    sd_part = (np.arange(dim).reshape(-1, 1) == cols_k) * X[cols_k, cols_l]
+    sd_part = sd_part / sds.reshape(-1, 1)
 
-    VS = V @ S
-    B = np.kron(V, V)
-    H = np.kron(VS, identity)
-    J = np.kron(identity, VS)
+    is_i = rows_i == cols_k
+    is_j = rows_j == cols_k
+    corr_part = (is_i * X[rows_j, cols_l] + is_j * X[rows_i, cols_l]) / (
+        sds[rows_i] * sds[rows_j]
+    )
+    corr_part -= corr[rows_i, rows_j] * (
+        is_i * X[rows_i, cols_l] / sds[rows_i] ** 2
+        + is_j * X[rows_j, cols_l] / sds[rows_j] ** 2
+    )
 
-    intermediate = U + B @ N - (H + J) @ B @ U
-
-    T = _transformation_matrix(dim)
-    D = _duplication_matrix(dim)
-
-    deriv = T @ intermediate @ D
+    deriv = np.vstack([sd_part, corr_part])
     return deriv
 
 
 def probability_to_internal(external_values, constr):
     """Reparametrize probability constrained parameters to internal."""
-    return external_values / external_values[-1]
+    return external_values / external_values[..., -1:]
 
 
 def probability_to_internal_jacobian(external_values, constr):
@@ -312,7 +352,7 @@ def probability_to_internal_jacobian(external_values, constr):
 
 def probability_from_internal(internal_values, constr):
     """Reparametrize probability constrained parameters from internal."""
-    return internal_values / internal_values.sum()
+    return internal_values / internal_values.sum(axis=-1, keepdims=True)
 
 
 def probability_from_internal_jacobian(internal_values, constr):
@@ -347,7 +387,7 @@ def probability_from_internal_jacobian(internal_values, constr):
 
 def linear_to_internal(external_values, constr):
     """Reparametrize linear constraint to internal."""
-    return constr["to_internal"] @ external_values
+    return _stacked_matvec(constr["to_internal"], external_values)
 
 
 def linear_to_internal_jacobian(external_values, constr):
@@ -356,13 +396,96 @@ def linear_to_internal_jacobian(external_values, constr):
 
 def linear_from_internal(internal_values, constr):
     """Reparametrize linear constraint from internal."""
-    return constr["from_internal"] @ internal_values
+    return _stacked_matvec(constr["from_internal"], internal_values)
 
 
 def linear_from_internal_jacobian(internal_values, constr):
     return constr["from_internal"]
 
 
+def _stacked_matvec(matrices, vectors):
+    """Multiply a (stack of) square matrices with a (stack of) vectors."""
+    return np.matmul(np.asarray(matrices), vectors[..., np.newaxis])[..., 0]
+
+
+def _chol_params_to_lower_triangular_matrices(params):
+    """Stacked version of ``chol_params_to_lower_triangular_matrix``."""
+    dim = number_of_triangular_elements_to_dimension(params.shape[-1])
+    mat = np.zeros(params.shape[:-1] + (dim, dim))
+    mat[(..., *np.tril_indices(dim))] = params
+    return mat
+
+
+def _cov_params_to_matrices(cov_params):
+    """Stacked version of ``cov_params_to_matrix``."""
+    lower = _chol_params_to_lower_triangular_matrices(cov_params)
+    return lower + np.swapaxes(np.tril(lower, k=-1), -1, -2)
+
+
+def _sdcorr_params_to_matrices(sdcorr_params):
+    """Stacked version of ``sdcorr_params_to_matrix``."""
+    dim = number_of_triangular_elements_to_dimension(sdcorr_params.shape[-1])
+    sds = sdcorr_params[..., :dim]
+    corr = np.zeros(sdcorr_params.shape[:-1] + (dim, dim))
+    corr[(..., *np.tril_indices(dim, k=-1))] = sdcorr_params[..., dim:]
+    corr += np.swapaxes(corr, -1, -2)
+    corr[..., np.arange(dim), np.arange(dim)] = 1
+    return corr * sds[..., np.newaxis] * sds[..., np.newaxis, :]
+
+
+def _cov_matrices_to_sdcorr_params(cov):
+    """Stacked version of ``cov_matrix_to_sdcorr_params``."""
+    dim = cov.shape[-1]
+    sds = np.sqrt(np.diagonal(cov, axis1=-2, axis2=-1))
+    corr = cov / (sds[..., np.newaxis] * sds[..., np.newaxis, :])
+    correlations = corr[(..., *np.tril_indices(dim, k=-1))]
+    return np.concatenate([sds, correlations], axis=-1)
+
+
+def _robust_cholesky_stacked(matrices):
+    """Apply ``robust_cholesky`` to a (stack of) matrices.
+
+    The regular cholesky decomposition is tried on the whole stack first. Only if it
+    fails, the robust version is applied to each matrix separately.
+
+    """
+    try:
+        chol = np.linalg.cholesky(matrices)
+    except np.linalg.LinAlgError:
+        dim = matrices.shape[-1]
+        flat = matrices.reshape(-1, dim, dim)
+        chol = np.array([robust_cholesky(mat) for mat in flat])
+        chol = chol.reshape(matrices.shape)
+    return chol
+
+
+@lru_cache(maxsize=16)
+def _tril_index_grids(dim):
+    """Return broadcastable index grids for jacobians w.r.t. lower triangular elements.
+
+    Rows and columns of the jacobians are ordered like the row-wise half-vectorization
+    of a dim x dim matrix. The row indices have shape (n, 1), the column indices have
+    shape (1, n), where n is the number of lower triangular elements.
+
+    Args:
+        dim (int): The dimension.
+
+    Returns:
+        tuple: Row indices i and j and column indices k and l. The arrays are read-only.
+
+    """
+    rows_i, rows_j = np.tril_indices(dim)
+    grids = (
+        rows_i.reshape(-1, 1),
+        rows_j.reshape(-1, 1),
+        rows_i.reshape(1, -1),
+        rows_j.reshape(1, -1),
+    )
+    for grid in grids:
+        grid.setflags(write=False)
+    return grids
+
+
 def _elimination_matrix(dim):
     r"""Construct (row-wise) elimination matrix.
 
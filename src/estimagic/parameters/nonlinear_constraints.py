@@ -18,6 +18,7 @@ def process_nonlinear_constraints(
     converter,
     numdiff_options,
     skip_checks,
+    shared_criterion=None,
 ):
     """Process and prepare nonlinear constraints for internal use.
 
@@ -37,6 +38,10 @@ def process_nonlinear_constraints(
         skip_checks (bool): Whether checks on the inputs are skipped. This makes the
             optimization faster, especially for very fast constraint functions. Default
             False.
+        shared_criterion (SharedCriterion or None): NamedTuple with a caching version
+            of the criterion and a batch evaluator that shares criterion evaluations.
+            Required for constraints with ``"from_criterion": True``, whose constraint
+            function takes the criterion output instead of the parameters.
 
     Returns:
         list[dict]: List of processed constraints.
@@ -45,18 +50,30 @@ def process_nonlinear_constraints(
     # do checks first to fail fast
     constraint_evals = []
     for _constraint in nonlinear_constraints:
-        _eval = _check_validity_and_return_evaluation(_constraint, params, skip_checks)
+        _eval = _check_validity_and_return_evaluation(
+            _constraint, params, skip_checks, shared_criterion
+        )
         constraint_evals.append(_eval)
 
     processed = []
     for _constraint, _eval in zip(nonlinear_constraints, constraint_evals):
-        _processed_constraint = _process_nonlinear_constraint(
-            _constraint,
-            constraint_eval=_eval,
-            params=params,
-            converter=converter,
-            numdiff_options=numdiff_options,
-        )
+        if _constraint.get("from_criterion", False):
+            _processed_constraint = _process_constraint_from_criterion(
+                _constraint,
+                constraint_eval=_eval,
+                params=params,
+                converter=converter,
+                numdiff_options=numdiff_options,
+                shared_criterion=shared_criterion,
+            )
+        else:
+            _processed_constraint = _process_nonlinear_constraint(
+                _constraint,
+                constraint_eval=_eval,
+                params=params,
+                converter=converter,
+                numdiff_options=numdiff_options,
+            )
         processed.append(_processed_constraint)
 
     return processed
@@ -89,6 +106,7 @@ def _process_nonlinear_constraint(
     options = numdiff_options.copy()
     options.pop("lower_bounds", None)
     options.pop("upper_bounds", None)
+    options.pop("sparsity", None)
 
     if "derivative" in c:
         if not callable(c["derivative"]):
@@ -129,9 +147,74 @@ def _process_nonlinear_constraint(
         )
         return np.atleast_2d(jac_internal)
 
-    # ==================================================================================
-    # Transform constraint function and derive bounds
-    # ==================================================================================
+    def _internal_constraint_func(x):
+        params = converter.params_from_internal(x)
+        select = external_selector(params)
+        return np.atleast_1d(constraint_func(select))
+
+    return _get_internal_constraint(
+        c,
+        internal_func=_internal_constraint_func,
+        internal_jacobian=_internal_jacobian,
+        n_constr=_n_constr,
+    )
+
+
+def _process_constraint_from_criterion(
+    c, constraint_eval, params, converter, numdiff_options, shared_criterion
+):
+    """Process a single nonlinear constraint that is derived from the criterion output.
+
+    The constraint function is evaluated on the output of the shared criterion. Its
+    Jacobian is calculated numerically with respect to the internal parameters, using
+    the same numdiff options as the criterion. Thus, all evaluation points that were
+    already used for the criterion or its numerical derivative are taken from the
+    cache of the shared criterion and each new point is only simulated once.
+
+    """
+    constraint_func = c["func"]
+    criterion = shared_criterion.criterion
+
+    if constraint_eval is None:
+        constraint_eval = constraint_func(criterion(params))
+
+    _n_constr = len(np.atleast_1d(constraint_eval))
+
+    options = numdiff_options.copy()
+    options.pop("sparsity", None)
+    options["batch_evaluator"] = shared_criterion.batch_evaluator
+
+    def _internal_constraint_func(x):
+        params = converter.params_from_internal(x)
+        return np.atleast_1d(constraint_func(criterion(params))).astype(float)
+
+    def _internal_jacobian(x):
+        jac = first_derivative(_internal_constraint_func, x, **options)["derivative"]
+        return np.atleast_2d(jac)
+
+    return _get_internal_constraint(
+        c,
+        internal_func=_internal_constraint_func,
+        internal_jacobian=_internal_jacobian,
+        n_constr=_n_constr,
+    )
+
+
+def _get_internal_constraint(c, internal_func, internal_jacobian, n_constr):
+    """Transform constraint function and derive bounds.
+
+    Args:
+        c (dict): The user provided constraint.
+        internal_func (callable): Function of internal parameters that returns the
+            untransformed constraint values as 1d numpy array.
+        internal_jacobian (callable): Function of internal parameters that returns the
+            Jacobian of internal_func.
+        n_constr (int): Number of untransformed constraints.
+
+    Returns:
+        dict: The processed constraint.
+
+    """
     _type = "eq" if "value" in c else "ineq"
 
     if _type == "eq":
@@ -144,13 +227,9 @@ def _process_nonlinear_constraint(
         _value = np.atleast_1d(np.array(c["value"], dtype=float))
 
         def internal_constraint_func(x):
-            params = converter.params_from_internal(x)
-            select = external_selector(params)
-            out = np.atleast_1d(constraint_func(select)) - _value
-            return out
+            return internal_func(x) - _value
 
-        jacobian_from_internal = _internal_jacobian
-        n_constr = _n_constr
+        jacobian_from_internal = internal_jacobian
 
     else:
         # ==============================================================================
@@ -161,25 +240,18 @@ def _process_nonlinear_constraint(
         # satify this condition we do not change anything, otherwise we need to perform
         # a transformation.
 
-        def _internal_constraint_func(x):
-            params = converter.params_from_internal(x)
-            select = external_selector(params)
-            return np.atleast_1d(constraint_func(select))
-
         lower_bounds = c.get("lower_bounds", 0)
         upper_bounds = c.get("upper_bounds", np.inf)
 
         transformation = _get_transformation(lower_bounds, upper_bounds)
 
-        internal_constraint_func = _compose_funcs(
-            _internal_constraint_func, transformation["func"]
-        )
+        internal_constraint_func = _compose_funcs(internal_func, transformation["func"])
 
         jacobian_from_internal = _compose_funcs(
-            _internal_jacobian, transformation["derivative"]
+            internal_jacobian, transformation["derivative"]
         )
 
-        n_constr = 2 * _n_constr if transformation["name"] == "stack" else _n_constr
+        n_constr = 2 * n_constr if transformation["name"] == "stack" else n_constr
 
     internal_constr = {
         "n_constr": n_constr,
@@ -387,7 +459,9 @@ def _get_transformation_type(lower_bounds, upper_bounds):
 # ======================================================================================
 
 
-def _check_validity_and_return_evaluation(c, params, skip_checks):
+def _check_validity_and_return_evaluation(
+    c, params, skip_checks, shared_criterion=None
+):
     """Check that nonlinear constraints are valid.
 
     Returns:
@@ -414,6 +488,30 @@ def _check_validity_and_return_evaluation(c, params, skip_checks):
             "Entry 'jac' in nonlinear constraints has be callable."
         )
 
+    # ==================================================================================
+    # check constraints that are derived from the criterion output
+    # ==================================================================================
+
+    from_criterion = c.get("from_criterion", False)
+
+    if from_criterion:
+        if shared_criterion is None:
+            raise InvalidConstraintError(
+                "Constraints with 'from_criterion' can only be used during "
+                "optimization."
+            )
+        if "derivative" in c:
+            raise InvalidConstraintError(
+                "Constraints with 'from_criterion' cannot have a 'derivative' entry. "
+                "Their derivatives are calculated numerically from shared criterion "
+                "evaluations."
+            )
+        if {"selector", "loc", "query"} & set(c):
+            raise InvalidConstraintError(
+                "Constraints with 'from_criterion' cannot have a selector because "
+                "their function takes the criterion output instead of params."
+            )
+
     # ==================================================================================
     # check bounds
     # ==================================================================================
@@ -492,7 +590,10 @@ def _check_validity_and_return_evaluation(c, params, skip_checks):
         selector = _process_selector(c)
 
         try:
-            constraint_eval = c["func"](selector(params))
+            if from_criterion:
+                constraint_eval = c["func"](shared_criterion.criterion(params))
+            else:
+                constraint_eval = c["func"](selector(params))
         except Exception as e:
             raise InvalidFunctionError(
                 f"Error when evaluating function of constraint {c}."
@@ -76,37 +76,28 @@ def get_space_converter(
         upper_bounds=internal_params.upper_bounds,
         param_names=internal_params.names,
     )
+    _grouped_transformations = group_transformations(transformations)
+
     _params_to_internal = partial(
         reparametrize_to_internal,
         internal_free=constr_info["internal_free"],
-        transformations=transformations,
+        transformations=_grouped_transformations,
     )
 
     _params_from_internal = partial(
         reparametrize_from_internal,
         fixed_values=constr_info["internal_fixed_values"],
         pre_replacements=constr_info["pre_replacements"],
-        transformations=transformations,
+        transformations=_grouped_transformations,
         post_replacements=constr_info["post_replacements"],
     )
 
-    _dim_internal = int(constr_info["internal_free"].sum())
-
-    _pre_replace_jac = pre_replace_jacobian(
-        pre_replacements=constr_info["pre_replacements"], dim_in=_dim_internal
-    )
-
-    _post_replace_jac = post_replace_jacobian(
-        post_replacements=constr_info["post_replacements"]
-    )
-
     _derivative_to_internal = partial(
         convert_external_derivative_to_internal,
         fixed_values=constr_info["internal_fixed_values"],
         pre_replacements=constr_info["pre_replacements"],
         transformations=transformations,
-        pre_replace_jac=_pre_replace_jac,
-        post_replace_jac=_post_replace_jac,
+        post_replacements=constr_info["post_replacements"],
     )
 
     _has_transforming_constraints = bool(transformations)
@@ -164,14 +155,16 @@ def reparametrize_to_internal(
 
     Args:
         external (np.ndarray or pandas.DataFrmae): 1d array with of external parameter
-            values or params DataFrame.
+            values or params DataFrame. Can also be a 2d array where each row is an
+            external parameter vector.
         internal_free (np.ndarray): 1d array of lenth n_external that determines
             which parameters are free.
-        transformations (list): Processed transforming constraints.
+        transformations (list): Processed transforming constraints. Can also be
+            grouped transforming constraints (see ``group_transformations``).
 
     Returns:
         internal_params (numpy.ndarray): 1d numpy array of free reparametrized
-            parameters.
+            parameters. 2d if external was 2d.
 
     """
     with_internal_values = external.copy()
@@ -179,9 +172,11 @@ def reparametrize_to_internal(
     for constr in transformations:
         func = getattr(kt, f"{constr['type']}_to_internal")
 
-        with_internal_values[constr["index"]] = func(external[constr["index"]], constr)
+        with_internal_values[..., constr["index"]] = func(
+            external[..., constr["index"]], constr
+        )
 
-    internal = with_internal_values[internal_free]
+    internal = with_internal_values[..., internal_free]
 
     return internal
 
@@ -196,7 +191,8 @@ def reparametrize_from_internal(
     """Convert a numpy array of internal parameters to a params DataFrame.
 
     Args:
-        internal (numpy.ndarray): 1d numpy array with internal parameters
+        internal (numpy.ndarray): 1d numpy array with internal parameters or 2d array
+            where each row is an internal parameter vector.
         fixed_values (numpy.ndarray): 1d numpy array of length n_external. It contains
             NaN for parameters that are not fixed and an internal representation of the
             value to which a parameter has been fixed for all others.
@@ -204,14 +200,15 @@ def reparametrize_from_internal(
             element in array contains the position of the internal parameter that has to
             be copied to the i_th position of the external parameter vector or -1 if no
             value has to be copied.
-        transformations (list): Processed transforming constraints.
+        transformations (list): Processed transforming constraints. Can also be
+            grouped transforming constraints (see ``group_transformations``).
         post_replacements (numpy.ndarray): 1d numpy array of lenth n_external. The i_th
             element contains the position a parameter in the transformed parameter
             vector that has to be copied to duplicated and copied to the i_th position
             of the external parameter vector.
 
     Returns:
-        numpy.ndarray: Array with external parameters
+        numpy.ndarray: Array with external parameters. 2d if internal was 2d.
 
     """
     # do pre-replacements
@@ -220,8 +217,8 @@ def reparametrize_from_internal(
     # do transformations
     for constr in transformations:
         func = getattr(kt, f"{constr['type']}_from_internal")
-        external_values[constr["index"]] = func(
-            external_values[constr["index"]], constr
+        external_values[..., constr["index"]] = func(
+            external_values[..., constr["index"]], constr
         )
 
     # do post-replacements
@@ -230,15 +227,49 @@ def reparametrize_from_internal(
     return external_values
 
 
+def group_transformations(transformations):
+    """Group transforming constraints of the same type and size.
+
+    The kernel transformations broadcast over leading axes. Stacking the indices of
+    all constraints of the same type and size into a 2d array thus allows to transform
+    all of them with one vectorized call instead of looping over the constraints.
+
+    Args:
+        transformations (list): Processed transforming constraints.
+
+    Returns:
+        list: List of grouped constraints. Each group is a dictionary with the entries
+            "type" and "index", where "index" is a 2d array with one row per
+            constraint. Groups of linear constraints additionally contain the stacked
+            "to_internal" and "from_internal" matrices.
+
+    """
+    groups = {}
+    for constr in transformations:
+        key = (constr["type"], len(constr["index"]))
+        groups.setdefault(key, []).append(constr)
+
+    grouped = []
+    for (type_, _), constraints in groups.items():
+        group = {
+            "type": type_,
+            "index": np.array([constr["index"] for constr in constraints]),
+        }
+        if type_ == "linear":
+            for key in ["to_internal", "from_internal"]:
+                group[key] = np.stack([np.asarray(c[key]) for c in constraints])
+        grouped.append(group)
+
+    return grouped
+
+
 def convert_external_derivative_to_internal(
     external_derivative,
     internal_values,
     fixed_values,
     pre_replacements,
     transformations,
-    post_replacements=None,
-    pre_replace_jac=None,
-    post_replace_jac=None,
+    post_replacements,
 ):
     r"""Compute the derivative of the criterion utilizing an external derivative.
 
@@ -259,6 +290,13 @@ def convert_external_derivative_to_internal(
     second part denotes the derivative of the parameter transform from inner
     to external.
 
+    The jacobians of the pre- and post-replacement steps are selection and
+    duplication matrices and the jacobian of the transformation step is block
+    diagonal. None of them is materialized. Instead, the external derivative is
+    multiplied from the right with each of them via index gathers, scatter-adds and
+    products with the small kernel jacobians, such that the cost scales with the
+    number of non-zero entries instead of the squared number of parameters.
+
     Args:
         external_derivative (numpy.ndarray): The external derivative evaluated at
             external values mapped from ``internal_values``.
@@ -275,8 +313,6 @@ def convert_external_derivative_to_internal(
             element contains the position a parameter in the transformed parameter
             vector that has to be copied to duplicated and copied to the i_th position
             of the external parameter vector.
-        pre_replace_jac (np.ndarray): 2d Array with the jacobian of pre_replace
-        post_replacment_jacobian (np.ndarray): 2d Array with the jacobian post_replace
 
     Returns:
         deriv (numpy.ndarray): The gradient or Jacobian.
@@ -286,38 +322,59 @@ def convert_external_derivative_to_internal(
 
     pre_replaced = pre_replace(internal_values, fixed_values, pre_replacements)
 
-    if post_replacements is None and post_replace_jac is None:
-        raise ValueError(
-            "either post_replacements or post_replace_jac must be specified."
-        )
+    deriv = np.atleast_2d(external_derivative).astype(float)
+    deriv = _right_multiply_post_replace_jacobian(deriv, post_replacements)
+    deriv = _right_multiply_transformation_jacobian(
+        deriv, transformations, pre_replaced
+    )
+    deriv = _right_multiply_pre_replace_jacobian(deriv, pre_replacements, dim_in)
+
+    # return gradient with shape (len(params),)
+    if deriv.shape[0] == 1:
+        deriv = deriv.flatten()
+    return deriv
 
-    if pre_replace_jac is None:
-        pre_replace_jac = pre_replace_jacobian(pre_replacements, dim_in)
 
-    if post_replace_jac is None:
-        post_replace_jac = post_replace_jacobian(post_replacements)
+def _right_multiply_post_replace_jacobian(mat, post_replacements):
+    """Calculate ``mat @ post_replace_jacobian(post_replacements)``.
 
-    transform_jac = transformation_jacobian(transformations, pre_replaced)
+    Each column of the result is the sum of the columns of ``mat`` whose parameters are
+    copies of the corresponding transformed parameter.
 
-    external_derivative = np.atleast_2d(external_derivative)
-    tall_external = external_derivative.shape[0] > external_derivative.shape[1]
+    """
+    mask = post_replacements >= 0
+    out = mat.copy()
+    out[:, mask] = 0
+    np.add.at(out, (slice(None), post_replacements[mask]), mat[:, mask])
+    return out
 
-    mat_list = [
-        external_derivative,
-        post_replace_jac,
-        transform_jac,
-        pre_replace_jac,
-    ]
 
-    if tall_external:
-        deriv = _multiply_from_right(mat_list)
-    else:
-        deriv = _multiply_from_left(mat_list)
+def _right_multiply_transformation_jacobian(mat, transformations, pre_replaced):
+    """Calculate ``mat @ transformation_jacobian(transformations, pre_replaced)``.
 
-    # return gradient with shape (len(params),)
-    if deriv.shape[0] == 1:
-        deriv = deriv.flatten()
-    return deriv
+    Only the columns that belong to transforming constraints are changed.
+
+    """
+    out = mat.copy()
+    for constr in transformations:
+        block_indices = constr["index"]
+        jacobian_func = getattr(kt, f"{constr['type']}_from_internal_jacobian")
+        jac = jacobian_func(pre_replaced[block_indices], constr)
+        out[:, block_indices] = mat[:, block_indices] @ jac
+    return out
+
+
+def _right_multiply_pre_replace_jacobian(mat, pre_replacements, dim_in):
+    """Calculate ``mat @ pre_replace_jacobian(pre_replacements, dim_in)``.
+
+    Each column of the result is the sum of the columns of ``mat`` whose parameters are
+    filled with the corresponding internal parameter.
+
+    """
+    mask = pre_replacements >= 0
+    out = np.zeros((len(mat), dim_in))
+    np.add.at(out, (slice(None), pre_replacements[mask]), mat[:, mask])
+    return out
 
 
 def _multiply_from_left(mat_list):
@@ -350,7 +407,8 @@ def pre_replace(internal_values, fixed_values, pre_replacements):
     """Return pre-replaced parameters.
 
     Args:
-        internal (numpy.ndarray): 1d numpy array with internal parameter.
+        internal (numpy.ndarray): 1d numpy array with internal parameter or 2d array
+            where each row is an internal parameter vector.
         fixed_values (numpy.ndarray): 1d numpy array of length n_external. It contains
             NaN for parameters that are not fixed and an internal representation of the
             value to which a parameter has been fixed for all others.
@@ -372,11 +430,12 @@ def pre_replace(internal_values, fixed_values, pre_replacements):
         array([2., 0., 1.])
 
     """
-    pre_replaced = fixed_values.copy()
+    shape = internal_values.shape[:-1] + fixed_values.shape
+    pre_replaced = np.broadcast_to(fixed_values, shape).copy()
 
     mask = pre_replacements >= 0
     positions = pre_replacements[mask]
-    pre_replaced[mask] = internal_values[positions]
+    pre_replaced[..., mask] = internal_values[..., positions]
     return pre_replaced
 
 
@@ -452,7 +511,8 @@ def post_replace(external_values, post_replacements):
     """Return post-replaed parameters.
 
     Args:
-        external_values (numpy.ndarray): 1d numpy array of external params.
+        external_values (numpy.ndarray): 1d numpy array of external params or 2d
+            array where each row is a vector of external params.
         post_replacements (numpy.ndarray): 1d numpy array of lenth n_external. The i_th
             element contains the position a parameter in the transformed parameter
             vector that has to be copied to duplicated and copied to the i_th position
@@ -472,7 +532,7 @@ def post_replace(external_values, post_replacements):
 
     mask = post_replacements >= 0
     positions = post_replacements[mask]
-    post_replaced[mask] = post_replaced[positions]
+    post_replaced[..., mask] = post_replaced[..., positions]
     return post_replaced
 
 
@@ -0,0 +1,189 @@
+"""Evaluate functions of params and data as a parallel map-reduce over data shards.
+
+This is useful for likelihood functions whose contributions are independent across
+observations. The data is split into shards once. Each evaluation of the sharded
+function evaluates the user provided function on all shards in parallel and combines
+the results. By default, contributions and jacobians are concatenated and scalar
+values are summed. Outputs that are sums over observations, like gradients of a scalar
+criterion, have to be summed as well.
+
+"""
+
+import functools
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from estimagic.batch_evaluators import process_batch_evaluator
+
+
+class Shards(NamedTuple):
+    shards: list
+    n_cores: int
+    batch_evaluator: Callable
+    directory: Any = None
+
+
+def shard_data(data, n_shards=None, n_cores=1, batch_evaluator="joblib"):
+    """Split data into shards along the first axis.
+
+    If more than one core is used, the shards are stored once in temporary files that
+    are memory mapped by the worker processes. Thus, the data is not pickled and sent
+    to the workers in each evaluation. The files are removed when the Shards object
+    and all functions that use it are garbage collected.
+
+    Args:
+        data (pandas.DataFrame, pandas.Series, numpy.ndarray or dict): The data. All
+            rows have to be independent observations. If data is a dictionary, each
+            entry is split into the same number of shards.
+        n_shards (int or None): Number of shards. Default is n_cores.
+        n_cores (int): Number of cores used to evaluate functions on the shards.
+        batch_evaluator (str or callable): See :ref:`batch_evaluators`.
+
+    Returns:
+        Shards: NamedTuple with the shards (or the paths to the files where they are
+            stored), n_cores and the batch evaluator.
+
+    """
+    n_shards = n_cores if n_shards is None else n_shards
+    if n_shards < 1:
+        raise ValueError("n_shards must be a positive integer.")
+
+    shards = _split(data, n_shards)
+
+    if n_cores > 1:
+        directory = tempfile.TemporaryDirectory(prefix="estimagic_shards_")
+        paths = []
+        for i, shard in enumerate(shards):
+            path = str(Path(directory.name) / f"shard_{i}.pkl")
+            joblib.dump(shard, path)
+            paths.append(path)
+        shards = paths
+    else:
+        directory = None
+
+    return Shards(
+        shards=shards,
+        n_cores=n_cores,
+        batch_evaluator=process_batch_evaluator(batch_evaluator),
+        directory=directory,
+    )
+
+
+REDUCE_METHODS = ("concatenate", "sum")
+
+
+def get_sharded_function(func, shards, data_name="data", reduce="concatenate"):
+    """Get a function of params that is evaluated on all data shards.
+
+    The result can be used wherever estimagic expects a function of params, e.g. as
+    loglike or jacobian in ``estimate_ml`` or as criterion or derivative in
+    ``minimize``. Since the combined output has the same structure as the output of
+    func on the full data, no further changes are needed. Several functions, e.g. a
+    likelihood and its jacobian, can share the same shards.
+
+    Args:
+        func (callable): Function that takes params as first argument and the data
+            as keyword argument(s). All other arguments have to be partialled in. The
+            output can be a scalar, a numpy array, a pandas object, or a dictionary of
+            those.
+        shards (Shards): The output of ``shard_data``.
+        data_name (str or None): Name of the argument of func that receives the data.
+            If None, the data has to be a dictionary whose entries are passed as
+            keyword arguments to func.
+        reduce (str or dict): How the outputs on the shards are combined. Scalars and
+            dictionary entries called "value" are always summed. With "concatenate",
+            arrays and pandas objects are concatenated along the first axis, which is
+            correct for contributions and jacobians. With "sum", they are summed, which
+            is correct for gradients of a scalar criterion or hessians. For dictionary
+            outputs, reduce can be a dictionary that maps entries to "concatenate" or
+            "sum". Entries that are not in it are concatenated.
+
+    Returns:
+        callable: Function that only takes params.
+
+    """
+    if not isinstance(shards, Shards):
+        raise TypeError("shards must be the output of shard_data.")
+
+    methods = reduce.values() if isinstance(reduce, dict) else [reduce]
+    if not set(methods).issubset(REDUCE_METHODS):
+        raise ValueError(f"reduce must be one of {REDUCE_METHODS} or a dict of those.")
+
+    evaluate_on_shard = functools.partial(
+        _evaluate_on_shard, func=func, data_name=data_name
+    )
+
+    def sharded_function(params):
+        arguments = [{"params": params, "shard": shard} for shard in shards.shards]
+        results = shards.batch_evaluator(
+            func=evaluate_on_shard,
+            arguments=arguments,
+            n_cores=shards.n_cores,
+            error_handling="raise",
+            unpack_symbol="**",
+        )
+        return _combine(results, reduce=reduce)
+
+    # keep the temporary directory alive as long as the function exists
+    sharded_function.shards = shards
+
+    return sharded_function
+
+
+def _evaluate_on_shard(params, shard, func, data_name):
+    data = _load_shard(shard) if isinstance(shard, str) else shard
+    kwargs = data if data_name is None else {data_name: data}
+    return func(params, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_shard(path):
+    """Load a shard at most once per worker process."""
+    return joblib.load(path, mmap_mode="r")
+
+
+def _split(data, n_shards):
+    if isinstance(data, dict):
+        split_entries = {key: _split(val, n_shards) for key, val in data.items()}
+        return [
+            {key: val[i] for key, val in split_entries.items()} for i in range(n_shards)
+        ]
+
+    positions = np.array_split(np.arange(len(data)), n_shards)
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        out = [data.iloc[pos] for pos in positions]
+    else:
+        data = np.asarray(data)
+        out = [data[pos] for pos in positions]
+    return out
+
+
+def _combine(results, reduce="concatenate", key=None):
+    first = results[0]
+    if isinstance(first, dict):
+        out = {
+            k: _combine([res[k] for res in results], reduce=reduce, key=k)
+            for k in first
+        }
+    elif np.ndim(first) == 0 or _get_reduce_method(reduce, key) == "sum":
+        out = sum(results)
+    elif isinstance(first, (pd.DataFrame, pd.Series)):
+        out = pd.concat(results)
+    else:
+        out = np.concatenate(results)
+    return out
+
+
+def _get_reduce_method(reduce, key):
+    if key == "value":
+        method = "sum"
+    elif isinstance(reduce, dict):
+        method = reduce.get(key, "concatenate")
+    else:
+        method = reduce
+    return method
@@ -67,3 +67,11 @@ def check_numdiff_options(numdiff_options, usage):
             f"numdiff_options for {usage}: {invalid}"
         )
         raise ValueError(msg)
+
+    # the jax backend requires traceable functions, which is only the case for the
+    # user provided criterion in optimizations
+    is_numpy_backend = numdiff_options.get("backend", "numpy") == "numpy"
+    if usage != "optimization" and not is_numpy_backend:
+        raise ValueError(
+            f"Only the numpy backend is supported in numdiff_options for {usage}."
+        )
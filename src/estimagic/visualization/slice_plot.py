@@ -123,24 +123,21 @@ def slice_plot(
     if not np.isfinite(internal_params.upper_bounds[selected]).all():
         raise ValueError("All selected parameters must have finite upper bounds.")
 
-    evaluation_points, metadata = [], []
+    internal_points, metadata = [], []
     for pos in selected:
         lb = internal_params.lower_bounds[pos]
         ub = internal_params.upper_bounds[pos]
         grid = np.linspace(lb, ub, n_gridpoints)
+        grid = grid[grid != internal_params.values[pos]]
         name = internal_params.names[pos]
-        for param_value in grid:
-            if param_value != internal_params.values[pos]:
-                meta = {
-                    "name": name,
-                    "Parameter Value": param_value,
-                }
-
-                x = internal_params.values.copy()
-                x[pos] = param_value
-                point = converter.params_from_internal(x)
-                evaluation_points.append(point)
-                metadata.append(meta)
+
+        x = np.tile(internal_params.values, (len(grid), 1))
+        x[:, pos] = grid
+        internal_points.append(x)
+        metadata += [{"name": name, "Parameter Value": val} for val in grid]
+
+    internal_points = np.vstack(internal_points)
+    evaluation_points = list(converter.params_from_internal_batch(internal_points))
 
     batch_evaluator = process_batch_evaluator(batch_evaluator)
 
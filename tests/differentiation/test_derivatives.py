@@ -9,6 +9,8 @@ from estimagic.differentiation.derivatives import (
     _consolidate_one_step_derivatives,
     _convert_evaluation_data_to_frame,
     _convert_richardson_candidates_to_frame,
+    _get_one_step_points,
+    _get_two_step_points,
     _is_scalar_nan,
     _nan_skipping_batch_evaluator,
     _reshape_cross_step_evals,
@@ -360,7 +362,314 @@ def test_reshape_cross_step_evals():
     assert np.all(got.neg == expected_neg)
 
 
+@pytest.fixture()
+def steps_with_nans():
+    pos = np.array([[0.1, np.nan, 0.3], [0.2, 0.4, np.nan]])
+    neg = np.array([[-0.1, -0.2, np.nan], [np.nan, -0.4, -0.6]])
+    return Steps(pos=pos, neg=neg)
+
+
+def test_get_one_step_points(steps_with_nans):
+    x = np.array([1.0, 2.0, 3.0])
+    points, positions = _get_one_step_points(x, steps_with_nans)
+
+    expected_points, expected_positions = [], []
+    for pos, (sign, i, j) in enumerate(np.ndindex(2, 2, 3)):
+        step = steps_with_nans[sign][i, j]
+        if not np.isnan(step):
+            point = x.copy()
+            point[j] += step
+            expected_points.append(point)
+            expected_positions.append(pos)
+
+    aaae(points, np.array(expected_points))
+    assert positions.tolist() == expected_positions
+
+
+@pytest.mark.parametrize("cross", [False, True])
+def test_get_two_step_points(steps_with_nans, cross):
+    x = np.array([1.0, 2.0, 3.0])
+    points, positions = _get_two_step_points(x, steps_with_nans, cross=cross)
+
+    expected_points, expected_positions = [], []
+    for pos, (sign, i, j, k) in enumerate(np.ndindex(2, 2, 3, 3)):
+        step_j, step_k = steps_with_nans[sign][i, [j, k]]
+        skip = j > k or (cross and j == k) or np.isnan(step_j) or np.isnan(step_k)
+        if not skip:
+            point = x.copy()
+            point[j] += step_j
+            point[k] += -step_k if cross else step_k
+            expected_points.append(point)
+            expected_positions.append(pos)
+
+    aaae(points, np.array(expected_points))
+    assert positions.tolist() == expected_positions
+
+
 def test_is_scalar_nan():
     assert _is_scalar_nan(np.nan)
     assert not _is_scalar_nan(1.0)
     assert not _is_scalar_nan(np.array([np.nan]))
+
+
+def _banded_func(x):
+    padded = np.pad(x, 1)
+    return padded[:-2] * padded[1:-1] ** 2 + np.sin(padded[2:])
+
+
+@pytest.mark.parametrize("method", ["central", "forward", "backward"])
+def test_first_derivative_with_sparsity(method):
+    x = np.linspace(0.5, 1.5, 20)
+    idx = np.arange(20)
+    sparsity = np.abs(idx.reshape(-1, 1) - idx) <= 1
+
+    n_evals = []
+
+    def counting_batch_evaluator(func, arguments, n_cores, error_handling):
+        n_evals.append(len(arguments))
+        return [func(arg) for arg in arguments]
+
+    expected = first_derivative(_banded_func, x, method=method)["derivative"]
+    calculated = first_derivative(
+        _banded_func,
+        x,
+        method=method,
+        sparsity=sparsity,
+        batch_evaluator=counting_batch_evaluator,
+    )["derivative"]
+
+    aaae(calculated, expected)
+    assert (calculated[~sparsity] == 0).all()
+    assert n_evals[0] <= 2 * 3 + 1
+
+
+def test_first_derivative_with_sparsity_of_wrong_shape():
+    with pytest.raises(ValueError):
+        first_derivative(_banded_func, np.ones(3), sparsity=np.eye(4, dtype=bool))
+
+
+def test_second_derivative_with_sparsity():
+    x = np.linspace(0.5, 1.5, 10)
+    idx = np.arange(10)
+    sparsity = np.abs(idx.reshape(-1, 1) - idx) <= 1
+
+    def func(x):
+        return _banded_func(x).sum()
+
+    expected = second_derivative(func, x)["derivative"]
+    calculated = second_derivative(func, x, sparsity=sparsity)["derivative"]
+
+    aaae(calculated[sparsity], expected[sparsity])
+    assert (calculated[~sparsity] == 0).all()
+
+
+def test_first_derivative_with_adaptive_richardson_extrapolation():
+    def func(x):
+        return np.array([3 * x[0] + np.exp(5 * x[1]) + np.sin(40 * x[2]), 2 * x[3]])
+
+    x = np.array([1.0, 0.3, 0.2, 0.1])
+    expected = np.array([[3, 5 * np.exp(1.5), 40 * np.cos(8), 0], [0, 0, 0, 2]])
+
+    n_evals = []
+
+    def counting_batch_evaluator(func, arguments, n_cores, error_handling):
+        n_evals.append(sum(not _is_scalar_nan(arg) for arg in arguments))
+        return [func(arg) for arg in arguments]
+
+    calculated = first_derivative(
+        func,
+        x,
+        n_steps=6,
+        richardson_tolerance=1e-10,
+        batch_evaluator=counting_batch_evaluator,
+    )["derivative"]
+
+    aaae(calculated, expected, decimal=6)
+    assert sum(n_evals) < 2 * 6 * len(x) + 1
+
+
+@pytest.mark.parametrize("method", methods)
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_first_derivative_streaming_equals_standard(
+    binary_choice_inputs, method, chunk_size
+):
+    fix = binary_choice_inputs
+    func = partial(logit_loglikeobs, y=fix["y"], x=fix["x"])
+
+    n_evals_per_batch = []
+
+    def counting_batch_evaluator(func, arguments, n_cores, error_handling):
+        n_evals_per_batch.append(sum(not _is_scalar_nan(arg) for arg in arguments))
+        return [func(arg) for arg in arguments]
+
+    expected = first_derivative(func, fix["params_np"], method=method)["derivative"]
+    calculated = first_derivative(
+        func,
+        fix["params_np"],
+        method=method,
+        chunk_size=chunk_size,
+        batch_evaluator=counting_batch_evaluator,
+    )["derivative"]
+
+    aaae(calculated, expected, decimal=10)
+    assert max(n_evals_per_batch[1:]) <= max(chunk_size, 2)
+
+
+def test_first_derivative_streaming_into_float32_memmap(binary_choice_inputs, tmp_path):
+    fix = binary_choice_inputs
+    func = partial(logit_loglikeobs, y=fix["y"], x=fix["x"])
+    shape = (len(fix["y"]), len(fix["params_np"]))
+    out = np.memmap(tmp_path / "jac.dat", dtype=np.float32, mode="w+", shape=shape)
+
+    calculated = first_derivative(func, fix["params_np"], out=out)["derivative"]
+
+    assert calculated is out
+    expected = logit_loglikeobs_jacobian(fix["params_np"], fix["y"], fix["x"])
+    aaae(calculated, expected, decimal=5)
+
+
+def test_first_derivative_streaming_with_wrong_options():
+    with pytest.raises(ValueError, match="only supported for n_steps=1"):
+        first_derivative(np.sin, np.ones(2), n_steps=2, chunk_size=2)
+
+    with pytest.raises(ValueError, match="out must have shape"):
+        first_derivative(np.sin, np.ones(2), out=np.zeros((3, 2)))
+
+
+def _func_failing_above_one(x):
+    if x[0] > 1:
+        return np.full(2, np.nan)
+    return np.array([x[0] ** 2 * x[1], np.exp(x[1]) + x[0] * x[2] ** 3])
+
+
+def _func_failing_above_one_jacobian(x):
+    return np.array(
+        [
+            [2 * x[0] * x[1], x[0] ** 2, 0],
+            [x[2] ** 3, np.exp(x[1]), 3 * x[0] * x[2] ** 2],
+        ]
+    )
+
+
+def _get_counting_batch_evaluator():
+    evaluated = []
+
+    def counting_batch_evaluator(func, arguments, n_cores, error_handling):
+        evaluated.extend(arg for arg in arguments if not _is_scalar_nan(arg))
+        return [func(arg) for arg in arguments]
+
+    return counting_batch_evaluator, evaluated
+
+
+@pytest.mark.parametrize("n_steps", [1, 3])
+def test_first_derivative_staged_skips_steps_in_failed_directions(n_steps):
+    x = np.array([1.0, 0.5, 0.3])
+    batch_evaluator, evaluated = _get_counting_batch_evaluator()
+
+    calculated = first_derivative(
+        _func_failing_above_one,
+        x,
+        n_steps=n_steps,
+        staged=True,
+        batch_evaluator=batch_evaluator,
+    )["derivative"]
+
+    aaae(calculated, _func_failing_above_one_jacobian(x), decimal=5)
+    # further steps in the failed positive direction of x[0] are not evaluated
+    assert len(evaluated) == 2 * n_steps * len(x) + 1 - (n_steps - 1)
+
+
+def test_first_derivative_staged_falls_back_to_mirrored_steps():
+    x = np.array([1.0, 0.5, 0.3])
+    expected = _func_failing_above_one_jacobian(x)
+
+    unstaged = first_derivative(_func_failing_above_one, x, method="forward")
+    staged = first_derivative(_func_failing_above_one, x, method="forward", staged=True)
+
+    assert np.isnan(unstaged["derivative"][:, 0]).all()
+    aaae(staged["derivative"], expected, decimal=5)
+
+
+@pytest.mark.parametrize("method", methods_second_derivative)
+def test_second_derivative_staged(method):
+    def func(x):
+        return _func_failing_above_one(x)[1]
+
+    x = np.array([1.0, 0.5, 0.3])
+    expected = np.array([[0, 0, 0.27], [0, np.exp(0.5), 0], [0.27, 0, 1.8]])
+
+    batch_evaluator, staged_evaluated = _get_counting_batch_evaluator()
+    calculated = second_derivative(
+        func, x, method=method, staged=True, batch_evaluator=batch_evaluator
+    )["derivative"]
+
+    batch_evaluator, evaluated = _get_counting_batch_evaluator()
+    second_derivative(func, x, method=method, batch_evaluator=batch_evaluator)
+
+    aaae(calculated, expected, decimal=4)
+    if "central" in method:
+        assert len(staged_evaluated) < len(evaluated)
+
+
+def test_staged_derivatives_with_unsupported_options():
+    with pytest.raises(ValueError, match="staged evaluation is not available"):
+        first_derivative(np.sin, np.ones(2), staged=True, method="complex_step")
+
+
+def _analytic_func(x):
+    return np.array([np.exp(x[0]) * np.sin(x[1]), x[2] ** 3 / (1 + x[0] ** 2)])
+
+
+def _analytic_func_jacobian(x):
+    return np.array(
+        [
+            [np.exp(x[0]) * np.sin(x[1]), np.exp(x[0]) * np.cos(x[1]), 0],
+            [
+                -2 * x[0] * x[2] ** 3 / (1 + x[0] ** 2) ** 2,
+                0,
+                3 * x[2] ** 2 / (1 + x[0] ** 2),
+            ],
+        ]
+    )
+
+
+def test_first_derivative_complex_step():
+    x = np.array([0.5, 1.2, -0.7])
+    calculated = first_derivative(_analytic_func, x, method="complex_step")
+    aaae(calculated["derivative"], _analytic_func_jacobian(x), decimal=14)
+
+
+def test_first_derivative_complex_step_with_pytree_params():
+    params = {"a": 0.5, "b": np.array([1.2, -0.7])}
+
+    def func(params):
+        return _analytic_func(np.hstack([params["a"], params["b"]]))
+
+    calculated = first_derivative(func, params, method="complex_step")["derivative"]
+    expected = _analytic_func_jacobian(np.array([0.5, 1.2, -0.7]))
+    aaae(calculated["a"], expected[:, 0], decimal=14)
+    aaae(calculated["b"], expected[:, 1:], decimal=14)
+
+
+def test_first_derivative_complex_step_falls_back_to_central_differences():
+    x = np.array([0.5, 1.2, -0.7])
+
+    def func(x):
+        if np.iscomplexobj(x) and x[1].imag != 0:
+            raise TypeError("Complex input is not supported.")
+        return _analytic_func(x)
+
+    def real_func(x):
+        return _analytic_func(x.real).astype(float)
+
+    with pytest.warns(UserWarning):
+        calculated = first_derivative(func, x, method="complex_step")["derivative"]
+    aaae(calculated, _analytic_func_jacobian(x))
+
+    calculated = first_derivative(real_func, x, method="complex_step")["derivative"]
+    aaae(calculated, _analytic_func_jacobian(x))
+
+
+def test_first_derivative_complex_step_with_richardson_extrapolation():
+    with pytest.raises(ValueError, match="not implemented for complex steps"):
+        first_derivative(_analytic_func, np.ones(3), method="complex_step", n_steps=2)
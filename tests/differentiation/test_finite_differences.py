@@ -39,3 +39,12 @@ def test_jacobian_finite_differences(jacobian_inputs, method):
     expected_jac = jacobian_inputs.pop("expected_jac")
     calculated_jac = jacobian(**jacobian_inputs, method=method)
     aaae(calculated_jac, expected_jac)
+
+
+def test_jacobian_complex_step():
+    steps = Steps(pos=np.array([[1e-20, 1e-20]]), neg=np.full((1, 2), np.nan))
+    evals = Evals(
+        pos=np.array([[[1 + 2e-20j, np.nan + 0j]]]), neg=np.full((1, 1, 2), np.nan)
+    )
+    calculated_jac = jacobian(evals, steps, np.ones(1), "complex_step")
+    aaae(calculated_jac, np.array([[[2, np.nan]]]))
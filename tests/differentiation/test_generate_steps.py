@@ -213,3 +213,21 @@ def test_generate_steps_min_step_equals_base_step():
     expected_neg = np.array([[-0.1, -0.2], [-0.2, -0.4], [-0.3, -0.6]]).T
     aaae(calculated_steps.pos, expected_pos)
     aaae(calculated_steps.neg, expected_neg)
+
+
+def test_generate_steps_complex_step_ignores_bounds():
+    calculated_steps = generate_steps(
+        x=np.arange(3),
+        method="complex_step",
+        n_steps=1,
+        target="first_derivative",
+        base_steps=np.array([0.1, 0.2, 0.3]),
+        lower_bounds=np.arange(3),
+        upper_bounds=np.arange(3),
+        step_ratio=2.0,
+        min_steps=None,
+        scaling_factor=1.0,
+    )
+
+    aaae(calculated_steps.pos, np.array([[0.1, 0.2, 0.3]]))
+    assert np.isnan(calculated_steps.neg).all()
@@ -0,0 +1,161 @@
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from estimagic.batch_evaluators import jax_batch_evaluator
+from estimagic.config import IS_JAX_INSTALLED
+from estimagic.differentiation.derivatives import first_derivative, second_derivative
+from estimagic.differentiation.jax_backend import get_jax_derivative_func
+from estimagic.visualization.slice_plot import slice_plot
+from numpy.testing import assert_array_almost_equal as aaae
+
+if IS_JAX_INSTALLED:
+    import jax.numpy as jnp
+
+
+def _func(params):
+    a, b = params["a"], params["b"]
+    return {
+        "value": jnp.sum(jnp.exp(a)) * b**2,
+        "contributions": jnp.concatenate([jnp.sin(a), jnp.atleast_1d(b**3)]),
+    }
+
+
+PARAMS = {"a": np.array([0.1, 0.2, 0.3]), "b": 1.5}
+
+
+@pytest.mark.jax()
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+@pytest.mark.parametrize("key", ["value", "contributions"])
+def test_first_derivative_jax_backend_equals_finite_differences(key):
+    expected = first_derivative(
+        lambda p: {k: np.asarray(v) for k, v in _func(p).items()},
+        PARAMS,
+        key=key,
+    )["derivative"]
+
+    result = first_derivative(
+        _func, PARAMS, key=key, backend="jax", return_func_value=True
+    )
+
+    aaae(result["derivative"]["a"], expected["a"], decimal=6)
+    aaae(result["derivative"]["b"], expected["b"], decimal=6)
+    aaae(result["func_value"]["value"], _func(PARAMS)["value"])
+
+
+@pytest.mark.jax()
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+def test_second_derivative_jax_backend_equals_finite_differences():
+    expected = second_derivative(lambda p: float(_func(p)["value"]), PARAMS, n_steps=2)[
+        "derivative"
+    ]
+
+    calculated = second_derivative(_func, PARAMS, key="value", backend="jax")
+
+    for outer in ["a", "b"]:
+        for inner in ["a", "b"]:
+            aaae(
+                calculated["derivative"][outer][inner],
+                expected[outer][inner],
+                decimal=4,
+            )
+
+
+@pytest.mark.jax()
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+def test_jax_backend_with_pandas_params():
+    params = pd.Series([1.0, 2.0])
+    with pytest.raises(ValueError, match="pytrees of numpy arrays"):
+        first_derivative(lambda p: p @ p, params, backend="jax")
+
+
+@pytest.mark.jax()
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+@pytest.mark.parametrize("unpack_symbol", [None, "*", "**"])
+def test_jax_batch_evaluator(unpack_symbol):
+    def func(x, y):
+        return {"sum": x + y, "sq": jnp.sum(x**2)}
+
+    args = [(np.arange(2.0) + i, float(i)) for i in range(4)]
+    if unpack_symbol is None:
+        calculated = jax_batch_evaluator(
+            lambda xy: func(*xy), args, unpack_symbol=unpack_symbol
+        )
+    elif unpack_symbol == "*":
+        calculated = jax_batch_evaluator(func, args, unpack_symbol=unpack_symbol)
+    else:
+        arguments = [{"x": x, "y": y} for x, y in args]
+        calculated = jax_batch_evaluator(func, arguments, unpack_symbol=unpack_symbol)
+
+    for (x, y), got in zip(args, calculated):
+        aaae(got["sum"], x + y)
+        assert isinstance(got["sq"], float)
+        assert np.allclose(got["sq"], np.sum(x**2))
+
+
+@pytest.mark.jax()
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+def test_jax_batch_evaluator_falls_back_for_non_traceable_functions():
+    def func(x):
+        return float(np.sum(x))
+
+    with pytest.warns(UserWarning, match="could not be vectorized"):
+        calculated = jax_batch_evaluator(func, [np.ones(2), np.zeros(2)], n_cores=1)
+
+    assert calculated == [2.0, 0.0]
+
+
+@pytest.mark.jax()
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+def test_slice_plot_with_jax_batch_evaluator():
+    def func(params):
+        return jnp.sum(params**2)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        slice_plot(
+            func=func,
+            params=np.zeros(3),
+            lower_bounds=np.full(3, -1.0),
+            upper_bounds=np.ones(3),
+            batch_evaluator="jax",
+        )
+
+
+def test_first_derivative_with_invalid_backend():
+    with pytest.raises(ValueError, match="backend must be"):
+        first_derivative(np.sin, np.ones(2), backend="torch")
+
+
+@pytest.mark.slow()
+@pytest.mark.jax()
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+def test_benchmark_jax_backend_against_finite_differences():
+    """Gradients of a function with many parameters need one reverse pass in jax."""
+    rng = np.random.default_rng(1234)
+    data = rng.normal(size=(2_000, 300))
+
+    def func(x):
+        return jnp.sum(jnp.log1p(jnp.exp(data @ x)))
+
+    def np_func(x):
+        return np.sum(np.log1p(np.exp(data @ x)))
+
+    x = np.full(300, 0.01)
+
+    # the jit compilation happens once, e.g. at the start of an optimization
+    derivative_and_func_value = get_jax_derivative_func(func, x)
+    derivative_and_func_value(x)
+
+    start = time.perf_counter()
+    jax_gradient, _ = derivative_and_func_value(x)
+    jax_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fd_gradient = first_derivative(np_func, x, n_cores=1)["derivative"]
+    fd_time = time.perf_counter() - start
+
+    aaae(jax_gradient, fd_gradient, decimal=4)
+    assert jax_time < fd_time
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from estimagic.differentiation.sparsity import (
+    get_column_coloring,
+    jacobian_to_hessian_sparsity,
+    sparsity_to_internal,
+)
+from estimagic.parameters.conversion import get_converter
+from numpy.testing import assert_array_equal
+
+
+def _banded_sparsity(dim, bandwidth):
+    idx = np.arange(dim)
+    return np.abs(idx.reshape(-1, 1) - idx) <= bandwidth
+
+
+@pytest.mark.parametrize("bandwidth", [0, 1, 3])
+def test_get_column_coloring_is_structurally_orthogonal(bandwidth):
+    sparsity = _banded_sparsity(30, bandwidth)
+    colors = get_column_coloring(sparsity)
+
+    for color in np.unique(colors):
+        n_nonzero_per_row = sparsity[:, colors == color].sum(axis=1)
+        assert (n_nonzero_per_row <= 1).all()
+
+    assert colors.max() + 1 == 2 * bandwidth + 1
+
+
+def test_get_column_coloring_with_empty_column():
+    sparsity = np.array([[True, False, True], [True, False, False]])
+    assert_array_equal(get_column_coloring(sparsity), [0, 0, 1])
+
+
+def test_jacobian_to_hessian_sparsity():
+    sparsity = np.array([[True, True, False], [False, False, True]])
+    expected = np.array(
+        [[True, True, False], [True, True, False], [False, False, True]]
+    )
+    assert_array_equal(jacobian_to_hessian_sparsity(sparsity), expected)
+
+
+def test_sparsity_to_internal_with_fixed_and_equal_params():
+    params = np.array([0.0, 1.0, 2.0, 2.0])
+    constraints = [
+        {"loc": [0], "type": "fixed"},
+        {"loc": [2, 3], "type": "equality"},
+    ]
+    converter, internal = get_converter(
+        params=params,
+        constraints=constraints,
+        lower_bounds=None,
+        upper_bounds=None,
+        func_eval={"contributions": np.zeros(3)},
+        primary_key="contributions",
+        scaling=False,
+        scaling_options=None,
+    )
+    sparsity = np.array(
+        [
+            [True, True, False, False],
+            [True, False, True, False],
+            [False, False, False, True],
+        ]
+    )
+
+    calculated = sparsity_to_internal(sparsity, converter, internal.values)
+    expected = np.array([[True, False], [False, True], [False, True]])
+    assert_array_equal(calculated, expected)
+
+
+def test_sparsity_to_internal_with_transforming_constraints_raises():
+    params = np.array([0.2, 0.3, 0.5])
+    converter, internal = get_converter(
+        params=params,
+        constraints=[{"loc": [0, 1, 2], "type": "probability"}],
+        lower_bounds=None,
+        upper_bounds=None,
+        func_eval={"contributions": np.zeros(3)},
+        primary_key="contributions",
+        scaling=False,
+        scaling_options=None,
+    )
+    with pytest.raises(NotImplementedError):
+        sparsity_to_internal(np.eye(3, dtype=bool), converter, internal.values)
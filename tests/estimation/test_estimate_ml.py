@@ -5,7 +5,10 @@ import pandas as pd
 import pytest
 import scipy as sp
 import statsmodels.api as sm
-from estimagic.estimation.estimate_ml import estimate_ml
+from estimagic.estimation.estimate_ml import (
+    _get_caching_batch_evaluator,
+    estimate_ml,
+)
 from estimagic.examples.logit import logit_derivative, logit_hessian, logit_loglike
 from estimagic.examples.logit import logit_loglike_and_derivative as llad
 from numpy.testing import assert_array_equal
@@ -138,6 +141,7 @@ test_cases = list(
         [None, logit_hessian, False],  # hessian
     )
 )
+test_cases += [({"algorithm": "scipy_lbfgsb"}, logit_jacobian, "from_jacobian")]
 
 
 @pytest.mark.parametrize("optimize_options, jacobian, hessian", test_cases)
@@ -242,16 +246,21 @@ test_cases_constr = list(
             {"loc": [0, 1], "type": "linear", "lower_bound": -20, "weights": 1},
             {"loc": [0, 1], "type": "increasing"},
         ],
+        [None],  # hessian
     )
 )
+test_cases_constr.append(
+    (logit_jacobian, {"loc": [1, 2, 3], "type": "covariance"}, "from_jacobian")
+)
 
 
-@pytest.mark.parametrize("jacobian, constraints", test_cases_constr)
+@pytest.mark.parametrize("jacobian, constraints, hessian", test_cases_constr)
 def test_estimate_ml_with_logit_constraints(
     fitted_logit_model,
     logit_np_inputs,
     jacobian,
     constraints,
+    hessian,
 ):
     """Test that estimate_ml computes correct params and standard errors under different
     scenarios with constraints."""
@@ -278,6 +287,7 @@ def test_estimate_ml_with_logit_constraints(
         optimize_options=optimize_options,
         jacobian=jacobian,
         jacobian_kwargs=kwargs,
+        hessian=hessian,
         constraints=constraints,
     )
 
@@ -325,6 +335,45 @@ def test_estimate_ml_with_logit_constraints(
         aaae(summary["p_value"], got.p_values(method=method, seed=seed))
 
 
+def test_estimate_ml_hessian_from_jacobian_requires_closed_form_jacobian(
+    logit_np_inputs,
+):
+    kwargs = {"y": logit_np_inputs["y"], "x": logit_np_inputs["x"]}
+    evaluated_params = []
+
+    def counting_loglike(params, y, x):
+        evaluated_params.append(params)
+        return logit_loglike(params, y, x)
+
+    with pytest.raises(ValueError, match="requires a closed form jacobian"):
+        estimate_ml(
+            loglike=counting_loglike,
+            params=logit_np_inputs["params"],
+            loglike_kwargs=kwargs,
+            optimize_options="scipy_lbfgsb",
+            hessian="from_jacobian",
+        )
+
+    # the invalid combination is detected before any optimization or differentiation
+    assert evaluated_params == []
+
+
+def test_estimate_ml_hessian_from_jacobian_with_one_observation():
+    def loglike(params):
+        contributions = np.array([-0.5 * np.sum((params - 1) ** 2)])
+        return {"contributions": contributions, "value": contributions.sum()}
+
+    def jacobian(params):
+        return 1 - params
+
+    kwargs = {"loglike": loglike, "params": np.zeros(2), "optimize_options": False}
+    expected = estimate_ml(**kwargs)
+    calculated = estimate_ml(**kwargs, jacobian=jacobian, hessian="from_jacobian")
+
+    aaae(calculated._internal_hessian, -np.eye(2))
+    aaae(calculated._internal_hessian, expected._internal_hessian)
+
+
 def test_estimate_ml_optimize_options_false(fitted_logit_model, logit_np_inputs):
     """Test that estimate_ml computes correct covariances given correct params."""
     kwargs = {"y": logit_np_inputs["y"], "x": logit_np_inputs["x"]}
@@ -350,6 +399,87 @@ def test_estimate_ml_optimize_options_false(fitted_logit_model, logit_np_inputs)
     aaae(got.cov(method="jacobian"), fitted_logit_model.covjac, decimal=4)
 
 
+def test_estimate_ml_shares_evaluations_between_jacobian_and_hessian(
+    fitted_logit_model, logit_np_inputs
+):
+    kwargs = {"y": logit_np_inputs["y"], "x": logit_np_inputs["x"]}
+    params = fitted_logit_model.params
+    numdiff_options = {"base_steps": np.full(len(params), 1e-4)}
+
+    evaluated_params = []
+
+    def counting_loglike(params, y, x):
+        evaluated_params.append(params.copy())
+        return logit_loglike(params, y, x)
+
+    got = estimate_ml(
+        loglike=counting_loglike,
+        params=params,
+        loglike_kwargs=kwargs,
+        optimize_options=False,
+        numdiff_options=numdiff_options,
+    )
+
+    # the jacobian points coincide with the one-step points of the hessian and the
+    # center point is only evaluated once, before any derivative is calculated.
+    n_params = len(params)
+    n_two_step_points = 2 * n_params + 2 * n_params * (n_params - 1)
+    assert len(evaluated_params) == 1 + 2 * n_params + n_two_step_points
+    assert len({p.tobytes() for p in evaluated_params}) == len(evaluated_params)
+
+    aaae(got.cov(method="jacobian"), fitted_logit_model.covjac, decimal=4)
+    aaae(got.cov(method="hessian"), fitted_logit_model.cov_params(), decimal=4)
+
+
+def test_estimate_ml_streaming_jacobian_bypasses_the_cache(
+    fitted_logit_model, logit_np_inputs
+):
+    kwargs = {"y": logit_np_inputs["y"], "x": logit_np_inputs["x"]}
+    params = fitted_logit_model.params
+    numdiff_options = {"base_steps": np.full(len(params), 1e-4), "chunk_size": 2}
+
+    evaluated_params = []
+
+    def counting_loglike(params, y, x):
+        evaluated_params.append(params.copy())
+        return logit_loglike(params, y, x)
+
+    got = estimate_ml(
+        loglike=counting_loglike,
+        params=params,
+        loglike_kwargs=kwargs,
+        optimize_options=False,
+        numdiff_options=numdiff_options,
+    )
+
+    # the hessian evaluates the one-step points again because nothing was cached
+    n_params = len(params)
+    n_two_step_points = 2 * n_params + 2 * n_params * (n_params - 1)
+    assert len(evaluated_params) == 1 + 4 * n_params + n_two_step_points
+
+    aaae(got.cov(method="jacobian"), fitted_logit_model.covjac, decimal=4)
+    aaae(got.cov(method="hessian"), fitted_logit_model.cov_params(), decimal=4)
+
+
+def test_caching_batch_evaluator_only_stores_a_bounded_number_of_values():
+    def func(x):
+        return {"value": x.sum(), "contributions": x}
+
+    cache = {}
+    evaluator = _get_caching_batch_evaluator("joblib", cache=cache, maxsize=2)
+    arguments = [np.full(2, float(i)) for i in range(3)] + [np.zeros(2)]
+
+    calculated = evaluator(func=func, arguments=arguments, n_cores=1)
+    assert [res["value"] for res in calculated] == [0, 2, 4, 0]
+    assert all("contributions" in res for res in calculated)
+    assert list(cache.values()) == [{"value": 0}, {"value": 2}]
+
+    calculated = evaluator(func=func, arguments=arguments[:3], n_cores=1)
+    assert calculated[0] == {"value": 0}
+    assert "contributions" in calculated[2]
+    assert len(cache) == 2
+
+
 # ======================================================================================
 # Univariate normal case using dict params
 # ======================================================================================
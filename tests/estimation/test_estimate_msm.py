@@ -100,6 +100,26 @@ def test_estimate_msm(simulate_moments, moments_cov, optimize_options):
     assert summary["stars"].tolist() == [""] * 3
 
 
+def test_estimate_msm_with_sparsity():
+    start_params = np.array([3, 2, 1])
+    expected = estimate_msm(
+        simulate_moments=_sim_np,
+        empirical_moments=np.zeros(3),
+        moments_cov=cov_np,
+        params=start_params,
+        optimize_options="scipy_lbfgsb",
+    )
+    calculated = estimate_msm(
+        simulate_moments=_sim_np,
+        empirical_moments=np.zeros(3),
+        moments_cov=cov_np,
+        params=start_params,
+        optimize_options="scipy_lbfgsb",
+        numdiff_options={"sparsity": np.eye(3, dtype=bool)},
+    )
+    aaae(calculated.se(), expected.se())
+
+
 def test_check_and_process_numdiff_options_with_invalid_entries():
     with pytest.raises(ValueError):
         check_numdiff_options({"func": lambda x: x}, "estimate_msm")
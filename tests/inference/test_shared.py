@@ -53,6 +53,7 @@ def _from_internal(x, return_type="flat"):  # noqa: ARG001
 class FakeConverter(NamedTuple):
     has_transforming_constraints: bool = True
     params_from_internal: callable = _from_internal
+    params_from_internal_batch: callable = _from_internal
 
 
 class FakeInternalParams(NamedTuple):
@@ -206,6 +207,7 @@ def test_get_derivative_case():
     assert get_derivative_case(lambda x: True) == "closed-form"  # noqa: ARG005
     assert get_derivative_case(False) == "skip"
     assert get_derivative_case(None) == "numerical"
+    assert get_derivative_case("from_jacobian") == "from-jacobian"
 
 
 def test_to_numpy_invalid():
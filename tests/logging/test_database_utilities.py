@@ -13,7 +13,7 @@ from estimagic.logging.read_from_database import (
     read_new_rows,
     read_table,
 )
-from estimagic.logging.write_to_database import append_row, update_row
+from estimagic.logging.write_to_database import append_row, append_rows, update_row
 from numpy.testing import assert_array_equal
 
 
@@ -78,6 +78,18 @@ def test_optimization_iteration_table_scalar(tmp_path, iteration_data):
         assert res[key] == iteration_data[key]
 
 
+def test_append_rows(tmp_path, iteration_data):
+    path = tmp_path / "test.db"
+    database = load_database(path_or_database=path)
+    make_optimization_iteration_table(database)
+    rows = [iteration_data, {**iteration_data, "value": 3.0, "exceptions": "error"}]
+    append_rows(rows, "optimization_iterations", database)
+    res = read_last_rows(database, "optimization_iterations", 2, "dict_of_lists")
+    assert res["rowid"] == [1, 2]
+    assert res["value"] == [5.0, 3.0]
+    assert res["exceptions"] == [None, "error"]
+
+
 def test_steps_table(tmp_path):
     path = tmp_path / "test.db"
     database = load_database(path_or_database=path)
@@ -0,0 +1,138 @@
+import pickle
+import time
+
+import numpy as np
+import pytest
+from estimagic.examples.criterion_functions import sos_dict_criterion
+from estimagic.exceptions import InvalidKwargsError, StopOptimizationError
+from estimagic.optimization.budget import get_budget_tracker
+from estimagic.optimization.optimize import maximize, minimize
+from numpy.testing import assert_array_almost_equal as aaae
+
+
+@pytest.fixture()
+def tracker():
+    out = get_budget_tracker(
+        budget={"max_criterion_evaluations": 10},
+        x=np.ones(3),
+        criterion_value=3.0,
+    )
+    yield out
+    out.close()
+
+
+def test_pickled_tracker_shares_state(tracker):
+    copy = pickle.loads(pickle.dumps(tracker))
+    copy.update(n_criterion_evaluations=4, core_seconds=0.5, x=np.zeros(3), value=0.0)
+
+    assert tracker.n_criterion_evaluations == 4
+    assert tracker.core_seconds == 0.5
+    status = tracker.get_current_status("message")
+    aaae(status["solution_x"], np.zeros(3))
+    assert status["solution_criterion"] == 0
+
+
+def test_tracker_only_keeps_best_point(tracker):
+    tracker.update(n_criterion_evaluations=1, core_seconds=0, x=np.zeros(3), value=5.0)
+    aaae(tracker.get_current_status("message")["solution_x"], np.ones(3))
+
+
+def test_tracker_raises_when_exhausted(tracker):
+    tracker.stop_if_exhausted()
+    tracker.update(n_criterion_evaluations=10, core_seconds=0)
+    with pytest.raises(StopOptimizationError, match="10 criterion evaluations"):
+        tracker.stop_if_exhausted()
+
+
+def test_invalid_budget_entries():
+    with pytest.raises(InvalidKwargsError):
+        get_budget_tracker({"max_iterations": 10}, x=np.ones(2), criterion_value=1.0)
+
+
+def test_budget_of_criterion_evaluations_includes_numerical_derivatives():
+    res = minimize(
+        criterion=sos_dict_criterion,
+        params=np.arange(5) + 10.0,
+        algorithm="scipy_lbfgsb",
+        budget={"max_criterion_evaluations": 15},
+    )
+
+    assert "15 criterion evaluations" in res.message
+    assert not res.success
+    # each gradient evaluation needs 6 criterion evaluations
+    assert 15 <= res.n_criterion_evaluations <= 18
+    assert res.criterion < np.sum((np.arange(5) + 10.0) ** 2)
+    assert np.allclose(res.criterion, np.sum(res.params**2))
+
+
+def test_budget_with_maximize():
+    def criterion(x):
+        return -np.sum(x**2)
+
+    res = maximize(
+        criterion=criterion,
+        params=np.arange(3) + 5.0,
+        algorithm="scipy_neldermead",
+        budget={"max_criterion_evaluations": 10},
+    )
+
+    assert "criterion evaluations" in res.message
+    assert res.criterion > criterion(np.arange(3) + 5.0)
+    assert np.allclose(res.criterion, criterion(res.params))
+
+
+def test_wall_time_budget():
+    def slow_criterion(x):
+        time.sleep(0.01)
+        return np.sum(x**2)
+
+    start = time.time()
+    res = minimize(
+        criterion=slow_criterion,
+        params=np.arange(3) + 5.0,
+        algorithm="scipy_neldermead",
+        budget={"max_seconds": 0.3},
+    )
+
+    assert "wall time" in res.message
+    assert time.time() - start < 5
+
+
+def test_budget_with_multistart():
+    res = minimize(
+        criterion=sos_dict_criterion,
+        params=np.arange(4.0),
+        soft_lower_bounds=np.full(4, -5.0),
+        soft_upper_bounds=np.full(4, 10.0),
+        algorithm="scipy_lbfgsb",
+        multistart=True,
+        multistart_options={"convergence_max_discoveries": np.inf},
+        budget={"max_criterion_evaluations": 80},
+    )
+
+    assert "80 criterion evaluations" in res.message
+    assert len(res.multistart_info["local_optima"]) < 4
+
+
+@pytest.mark.parametrize(
+    "algorithm, algo_options",
+    [
+        ("neldermead_parallel", {}),
+        ("neldermead_parallel", {"n_cores": 2}),
+        ("pounders", {}),
+    ],
+)
+def test_budget_with_algorithms_that_use_batch_evaluators(algorithm, algo_options):
+    start_params = np.arange(3) + 5.0
+    res = minimize(
+        criterion=sos_dict_criterion,
+        params=start_params,
+        algorithm=algorithm,
+        algo_options=algo_options,
+        budget={"max_criterion_evaluations": 7},
+    )
+
+    assert "7 criterion evaluations" in res.message
+    assert not res.success
+    assert res.criterion < np.sum(start_params**2)
+    assert np.allclose(res.criterion, np.sum(res.params**2))
@@ -0,0 +1,141 @@
+import time
+
+import numpy as np
+import pytest
+from estimagic.decorators import mark_minimizer
+from estimagic.optimization.optimize import maximize, minimize
+from numpy.testing import assert_array_almost_equal as aaae
+
+
+def sos(x):
+    return x @ x
+
+
+def sos_dict(x):
+    return {"value": x @ x, "root_contributions": x}
+
+
+def sos_gradient(x):
+    return 2 * x
+
+
+def sos_criterion_and_gradient(x):
+    return {"value": x @ x}, 2 * x
+
+
+DERIVATIVE_CASES = [
+    {},
+    {"derivative": sos_gradient},
+    {"criterion_and_derivative": sos_criterion_and_gradient},
+]
+
+
+@pytest.mark.parametrize("criterion", [sos, sos_dict])
+@pytest.mark.parametrize("derivatives", DERIVATIVE_CASES)
+def test_fast_mode_gives_same_result(criterion, derivatives):
+    kwargs = {
+        "criterion": criterion,
+        "params": np.arange(4) + 1.0,
+        "algorithm": "scipy_lbfgsb",
+        **derivatives,
+    }
+    expected = minimize(**kwargs)
+    calculated = minimize(**kwargs, fast_mode=True)
+
+    aaae(calculated.params, expected.params)
+    assert calculated.n_criterion_evaluations == expected.n_criterion_evaluations
+    assert calculated.history is None
+
+
+@pytest.mark.parametrize("derivatives", DERIVATIVE_CASES)
+def test_fast_mode_with_maximize(derivatives):
+    derivatives = {
+        key: lambda x, f=func: _switch_sign(f(x)) for key, func in derivatives.items()
+    }
+    res = maximize(
+        criterion=lambda x: -sos(x),
+        params=np.arange(3) + 1.0,
+        algorithm="scipy_lbfgsb",
+        lower_bounds=np.full(3, 0.5),
+        fast_mode=True,
+        **derivatives,
+    )
+    aaae(res.params, np.full(3, 0.5))
+    assert np.allclose(res.criterion, -0.75)
+
+
+def _switch_sign(out):
+    if isinstance(out, tuple):
+        return tuple(_switch_sign(entry) for entry in out)
+    elif isinstance(out, dict):
+        return {key: -val for key, val in out.items()}
+    return -out
+
+
+def test_fast_mode_with_least_squares_optimizer():
+    res = minimize(
+        criterion=sos_dict,
+        params=np.arange(3) + 1.0,
+        algorithm="pounders",
+        fast_mode=True,
+    )
+    aaae(res.params, np.zeros(3), decimal=4)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"params": {"a": 1.0, "b": 2.0}, "criterion": lambda p: p["a"] ** 2},
+        {"constraints": [{"loc": [0, 1], "type": "increasing"}]},
+        {"scaling": True},
+        {"logging": "log.db"},
+        {"error_handling": "continue"},
+        {"multistart": True, "soft_lower_bounds": np.zeros(3)},
+        {"budget": {"max_seconds": 10}},
+        {"criterion": lambda x: {"contributions": x**2}},
+    ],
+)
+def test_incompatible_options_raise_an_error(kwargs):
+    kwargs = {
+        "criterion": sos,
+        "params": np.arange(3) + 1.0,
+        "algorithm": "scipy_lbfgsb",
+        **kwargs,
+    }
+    with pytest.raises(ValueError, match="fast_mode cannot be used"):
+        minimize(**kwargs, fast_mode=True)
+
+
+@mark_minimizer(name="timer")
+def _time_criterion_evaluations(criterion, x, n_evaluations=20_000):
+    start = time.perf_counter()
+    for _ in range(n_evaluations):
+        criterion(x)
+    runtime = time.perf_counter() - start
+    return {"solution_x": x, "solution_criterion": runtime / n_evaluations}
+
+
+def _evaluation_time(criterion, fast_mode):
+    res = minimize(
+        criterion=criterion,
+        params=np.arange(3) + 1.0,
+        algorithm=_time_criterion_evaluations,
+        fast_mode=fast_mode,
+        skip_checks=True,
+    )
+    return res.criterion
+
+
+@pytest.mark.slow()
+@pytest.mark.parametrize("criterion", [sos, sos_dict])
+def test_overhead_of_fast_mode_is_small(criterion):
+    x = np.arange(3) + 1.0
+    direct = min(
+        _time_criterion_evaluations(criterion, x)["solution_criterion"]
+        for _ in range(5)
+    )
+    fast = min(_evaluation_time(criterion, fast_mode=True) for _ in range(5))
+    slow = _evaluation_time(criterion, fast_mode=False)
+
+    assert fast - direct < 2e-6
+    assert fast < slow / 2
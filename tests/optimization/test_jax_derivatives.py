@@ -120,3 +120,21 @@ def test_least_squares_optimizer_pytree():
     assert np.allclose(res.params["a"], 0)
     assert np.allclose(res.params["b"], 0)
     aaae(res.params["c"], np.zeros(2))
+
+
+@pytest.mark.skipif(not IS_JAX_INSTALLED, reason="Needs jax.")
+@pytest.mark.parametrize("algorithm", ["scipy_lbfgsb", "scipy_ls_lm"])
+def test_jax_numdiff_backend(algorithm):
+    def criterion(x):
+        residuals = jnp.concatenate([x["a"] - 1, jnp.atleast_1d(x["b"] + 2)])
+        return {"root_contributions": residuals, "value": residuals @ residuals}
+
+    res = minimize(
+        criterion=criterion,
+        params={"a": np.zeros(2), "b": 0.0},
+        algorithm=algorithm,
+        numdiff_options={"backend": "jax"},
+    )
+
+    aaae(res.params["a"], np.ones(2))
+    assert np.allclose(res.params["b"], -2)
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+import pytest
+from estimagic.exceptions import InvalidKwargsError, UserFunctionRuntimeError
+from estimagic.optimization.optimize import minimize, minimize_many
+from numpy.testing import assert_array_almost_equal as aaae
+
+
+def criterion(x, target):
+    return (x - target) @ (x - target)
+
+
+def gradient(x, target):
+    return 2 * (x - target)
+
+
+def least_squares_criterion(x, target):
+    return {"root_contributions": x - target, "value": criterion(x, target)}
+
+
+@pytest.fixture()
+def targets():
+    rng = np.random.default_rng(5471)
+    return [rng.normal(size=3) for _ in range(10)]
+
+
+@pytest.mark.parametrize("n_cores", [1, 2])
+def test_minimize_many_gives_same_results_as_minimize(targets, n_cores):
+    res = minimize_many(
+        criterion=criterion,
+        params_list=[np.zeros(3)] * len(targets),
+        algorithm="scipy_lbfgsb",
+        problem_kwargs=[{"target": target} for target in targets],
+        n_cores=n_cores,
+    )
+
+    for i, target in enumerate(targets):
+        expected = minimize(
+            criterion=criterion,
+            params=np.zeros(3),
+            algorithm="scipy_lbfgsb",
+            criterion_kwargs={"target": target},
+        )
+        aaae(res.params[i], expected.params)
+        assert res.n_criterion_evaluations[i] == expected.n_criterion_evaluations
+
+    assert len(res) == len(targets)
+    assert res.success.all()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"algorithm": "scipy_lbfgsb", "derivative": gradient},
+        {"algorithm": "pounders", "criterion": least_squares_criterion},
+        {"algorithm": "scipy_lbfgsb", "lower_bounds": np.full(3, -0.1)},
+    ],
+)
+def test_minimize_many_with_different_user_functions_and_algorithms(targets, kwargs):
+    kwargs = {"criterion": criterion, **kwargs}
+    lower_bounds = kwargs.get("lower_bounds", np.full(3, -np.inf))
+
+    res = minimize_many(
+        params_list=[np.ones(3)] * len(targets),
+        problem_kwargs=[{"target": target} for target in targets],
+        **kwargs,
+    )
+
+    aaae(res.params, np.clip(targets, lower_bounds, np.inf), decimal=3)
+
+
+def test_minimize_many_with_pytree_params_and_constraints():
+    def criterion(params, target):
+        return ((params["value"] - target) ** 2).sum()
+
+    params = pd.DataFrame({"value": [1.0, 1.0, 3.0]}, index=["a", "b", "c"])
+
+    res = minimize_many(
+        criterion=criterion,
+        params_list=[params, params * 2],
+        algorithm="scipy_lbfgsb",
+        problem_kwargs=[{"target": np.array([1, 3, 1])}, {"target": 2.0}],
+        constraints=[{"loc": ["a", "b"], "type": "equality"}],
+    )
+
+    aaae(res.params, np.array([[2, 2, 1], [2, 2, 2]]))
+    assert res.param_names == ["a", "b", "c"]
+
+    calculated = res.get_params(0)
+    assert isinstance(calculated, pd.DataFrame)
+    aaae(calculated["value"], np.array([2, 2, 1]))
+
+    frame = res.to_frame()
+    assert list(frame.columns) == ["a", "b", "c", "criterion", "success"]
+    aaae(frame["criterion"], np.array([2, 0]))
+
+
+def test_minimize_many_continues_after_errors():
+    def criterion(x, fail):
+        if fail:
+            raise ValueError("Failed optimization.")
+        return x @ x
+
+    res = minimize_many(
+        criterion=criterion,
+        params_list=[np.ones(2), np.ones(2), np.ones(2)],
+        algorithm="scipy_lbfgsb",
+        problem_kwargs=[{"fail": False}, {"fail": True}, {"fail": False}],
+        error_handling="continue",
+        chunk_size=2,
+    )
+
+    assert res.success.tolist() == [True, False, True]
+    assert "Failed optimization." in res.messages[1]
+    assert np.isnan(res.params[1]).all()
+    assert np.isnan(res.criterion[1])
+    aaae(res.params[[0, 2]], np.zeros((2, 2)))
+
+
+def test_minimize_many_raises_errors():
+    def criterion(x, fail):
+        if fail:
+            raise ValueError("Failed optimization.")
+        return x @ x
+
+    with pytest.raises(UserFunctionRuntimeError):
+        minimize_many(
+            criterion=criterion,
+            params_list=[np.ones(2), np.ones(2)],
+            algorithm="scipy_neldermead",
+            problem_kwargs=[{"fail": False}, {"fail": True}],
+            constraints=[{"loc": [0, 1], "type": "equality"}],
+        )
+
+
+def test_invalid_problem_kwargs():
+    with pytest.raises(ValueError, match="one entry per element"):
+        minimize_many(
+            criterion=criterion,
+            params_list=[np.zeros(3)] * 2,
+            algorithm="scipy_lbfgsb",
+            problem_kwargs=[{"target": np.ones(3)}],
+        )
+
+    with pytest.raises(InvalidKwargsError):
+        minimize_many(
+            criterion=criterion,
+            params_list=[np.zeros(3)],
+            algorithm="scipy_lbfgsb",
+            problem_kwargs=[{"target": np.ones(3), "data": None}],
+        )
@@ -253,3 +253,96 @@ def test_multistart_with_least_squares_optimizers():
     )
 
     aaae(est.params, np.zeros(2))
+
+
+def test_exploration_in_chunks_finds_same_start_points(params, tmp_path):
+    options = {"n_samples": 40, "convergence_max_discoveries": np.inf, "seed": 0}
+
+    res_full = minimize(
+        criterion=sos_dict_criterion,
+        params=params,
+        algorithm="scipy_lbfgsb",
+        multistart=True,
+        multistart_options=options,
+    )
+    res_chunked = minimize(
+        criterion=sos_dict_criterion,
+        params=params,
+        algorithm="scipy_lbfgsb",
+        multistart=True,
+        multistart_options={**options, "exploration_chunk_size": 7},
+        logging=tmp_path / "chunked.db",
+    )
+
+    full_info = res_full.multistart_info
+    chunked_info = res_chunked.multistart_info
+    assert len(chunked_info["exploration_sample"]) == 4
+    aaae(chunked_info["exploration_results"], full_info["exploration_results"][:4])
+    aaae(
+        _params_list_to_aray(chunked_info["start_parameters"]),
+        _params_list_to_aray(full_info["start_parameters"]),
+    )
+
+    database = load_database(path_or_database=tmp_path / "chunked.db")
+    iterations, _ = read_new_rows(
+        database=database,
+        table_name="optimization_iterations",
+        last_retrieved=0,
+        return_type="dict_of_lists",
+    )
+    assert iterations["step"].count(1) == 40
+
+
+def test_clustering_reduces_number_of_local_optimizations(params):
+    options = {"n_samples": 100, "convergence_max_discoveries": np.inf}
+
+    res_full = minimize(
+        criterion=sos_dict_criterion,
+        params=params,
+        algorithm="scipy_lbfgsb",
+        multistart=True,
+        multistart_options=options,
+    )
+    res_clustered = minimize(
+        criterion=sos_dict_criterion,
+        params=params,
+        algorithm="scipy_lbfgsb",
+        multistart=True,
+        multistart_options={**options, "clustering_critical_distance": "mlsl"},
+    )
+
+    n_full = len(res_full.multistart_info["local_optima"])
+    n_clustered = len(res_clustered.multistart_info["local_optima"])
+    assert 1 <= n_clustered < n_full == 10
+    aaae(res_clustered.params["value"], np.zeros(4))
+
+
+def test_racing_stops_local_optimizations_early(params):
+    options = {
+        "n_samples": 100,
+        "convergence_max_discoveries": np.inf,
+        "convergence_relative_params_tolerance": 0.1,
+    }
+
+    res_full = minimize(
+        criterion=sos_dict_criterion,
+        params=params,
+        algorithm="scipy_lbfgsb",
+        multistart=True,
+        multistart_options=options,
+    )
+    res_racing = minimize(
+        criterion=sos_dict_criterion,
+        params=params,
+        algorithm="scipy_lbfgsb",
+        multistart=True,
+        multistart_options={**options, "racing": True},
+    )
+
+    optima = res_racing.multistart_info["local_optima"]
+    stopped = [opt for opt in optima if opt.message.startswith("Stopped early")]
+    assert len(optima) == 10
+    assert len(stopped) > 0
+    for opt in stopped:
+        aaae(opt.params["value"], optima[0].params["value"])
+    aaae(res_racing.params["value"], res_full.params["value"])
@@ -8,6 +8,7 @@ from itertools import product
 import numpy as np
 import pandas as pd
 import pytest
+from estimagic import get_benchmark_problems, minimize
 from estimagic.batch_evaluators import joblib_batch_evaluator
 from estimagic.config import TEST_FIXTURES_DIR
 from estimagic.optimization.pounders import internal_solve_pounders
@@ -170,3 +171,75 @@ def test_gqtpar(start_vec, criterion, pounders_options, trustregion_subproblem_o
 
     x_expected = np.array([0.1902789114691, 0.006131410288292, 0.01053088353832])
     aaae(result["solution_x"], x_expected, decimal=4)
+
+
+def test_speculative_candidates(
+    criterion, pounders_options, trustregion_subproblem_options
+):
+    n_evaluations = []
+
+    def counting_batch_evaluator(func, arguments, n_cores):
+        n_evaluations.append(len(arguments))
+        return joblib_batch_evaluator(func, arguments=arguments, n_cores=n_cores)
+
+    options = {
+        "x0": np.array([0.15, 0.008, 0.01]),
+        "criterion": criterion,
+        "gtol_abs": 1e-8,
+        "gtol_rel": 1e-8,
+        "gtol_scaled": 0,
+        "maxinterp": 7,
+        "solver_sub": "bntr",
+        "conjugate_gradient_method_sub": "trsbox",
+        "maxiter_sub": trustregion_subproblem_options["maxiter"],
+        "maxiter_gradient_descent_sub": trustregion_subproblem_options[
+            "maxiter_gradient_descent"
+        ],
+        "gtol_abs_sub": trustregion_subproblem_options["gtol_abs"],
+        "gtol_rel_sub": trustregion_subproblem_options["gtol_rel"],
+        "gtol_scaled_sub": trustregion_subproblem_options["gtol_scaled"],
+        "gtol_abs_conjugate_gradient_sub": trustregion_subproblem_options[
+            "gtol_abs_cg"
+        ],
+        "gtol_rel_conjugate_gradient_sub": trustregion_subproblem_options[
+            "gtol_rel_cg"
+        ],
+        "k_easy_sub": trustregion_subproblem_options["k_easy"],
+        "k_hard_sub": trustregion_subproblem_options["k_hard"],
+        "n_cores": 1,
+        **pounders_options,
+    }
+
+    result_sequential = internal_solve_pounders(
+        **options, batch_evaluator=joblib_batch_evaluator, n_speculative_candidates=1
+    )
+    result = internal_solve_pounders(
+        **options, batch_evaluator=counting_batch_evaluator, n_speculative_candidates=3
+    )
+
+    x_expected = np.array([0.1902789114691, 0.006131410288292, 0.01053088353832])
+    aaae(result["solution_x"], x_expected, decimal=4)
+    assert max(n_evaluations[1:]) > 1
+    # every evaluated point is stored in the history, i.e. no point is wasted
+    assert sum(n_evaluations) == len(result["history_x"])
+    assert sum(n_evaluations) <= 3 * len(result_sequential["history_x"])
+
+
+@pytest.mark.parametrize(
+    "problem_name, n_speculative_candidates",
+    [
+        ("linear_rank_one_bad_start", 1),
+        ("linear_rank_one_zero_columns_rows_good_start", 3),
+    ],
+)
+def test_rank_deficient_more_wild_problems(problem_name, n_speculative_candidates):
+    problem = get_benchmark_problems("more_wild")[problem_name]
+
+    result = minimize(
+        criterion=problem["inputs"]["criterion"],
+        params=problem["inputs"]["params"],
+        algorithm="pounders",
+        algo_options={"trustregion_n_speculative_candidates": n_speculative_candidates},
+    )
+
+    assert np.isclose(result.criterion, problem["solution"]["value"], rtol=1e-6)
@@ -1,5 +1,6 @@
 """Test the auxiliary functions of the pounders algorithm."""
 
+import time
 from collections import namedtuple
 from functools import partial
 
@@ -11,13 +12,22 @@ from estimagic.batch_evaluators import joblib_batch_evaluator
 from estimagic.config import TEST_FIXTURES_DIR
 from estimagic.optimization.pounders_history import LeastSquaresHistory
 from estimagic.optimization.pounders_auxiliary import (
+    ResidualModel,
+    _append_row_to_qr,
+    _check_candidate_point,
+    _check_candidate_point_from_scratch,
+    _get_interpolation_system,
+    MainModel,
     add_geomtery_points_to_make_main_model_fully_linear,
+    add_speculative_candidates_to_history,
     create_initial_residual_model,
     create_main_from_residual_model,
     evaluate_residual_model,
     find_affine_points,
     fit_residual_model,
     get_feature_matrices_residual_model,
+    solve_subproblem,
+    solve_subproblem_for_several_radii,
     update_main_model_with_new_accepted_x,
     update_residual_model,
     update_residual_model_with_new_accepted_x,
@@ -550,3 +560,262 @@ def test_fit_residual_model(data_fit_residual_model):
         coefficients_to_add["square_terms"],
         expected_coefficients["square_terms"],
     )
+
+
+def _get_random_residual_model_inputs(n_params, n_residuals, seed=0):
+    rng = np.random.default_rng(seed)
+    n_modelpoints = 2 * n_params + 1
+    n_poly_terms = n_params * (n_params + 1) // 2
+
+    centered_xs = rng.uniform(-1, 1, size=(n_modelpoints, n_params))
+    m_mat = np.column_stack([np.ones(n_params + 1), centered_xs[: n_params + 1]])
+    n_mat = rng.normal(size=(n_modelpoints, n_poly_terms))
+    z_mat = np.linalg.qr(rng.normal(size=(n_modelpoints, n_params)))[0]
+    n_z_mat = rng.normal(size=(n_poly_terms, n_params))
+
+    square_terms = rng.normal(size=(n_residuals, n_params, n_params))
+    residual_model = ResidualModel(
+        intercepts=rng.normal(size=n_residuals),
+        linear_terms=rng.normal(size=(n_params, n_residuals)),
+        square_terms=square_terms + square_terms.transpose(0, 2, 1),
+    )
+    centered_residuals = rng.normal(size=(n_modelpoints, n_residuals))
+
+    evaluate_inputs = {
+        "centered_xs": centered_xs,
+        "centered_residuals": centered_residuals,
+        "residual_model": residual_model,
+    }
+    fit_inputs = {
+        "m_mat": m_mat,
+        "n_mat": n_mat,
+        "z_mat": z_mat,
+        "n_z_mat": n_z_mat,
+        "n_modelpoints": n_modelpoints,
+    }
+    return evaluate_inputs, fit_inputs
+
+
+def _evaluate_residual_model_loop(centered_xs, centered_residuals, residual_model):
+    """Evaluate the residual model one residual and model point at a time."""
+    n_modelpoints, n_residuals = centered_xs.shape[0], centered_residuals.shape[1]
+    y_residuals = np.empty((n_modelpoints, n_residuals))
+    for j in range(n_residuals):
+        x_dot_square_terms = centered_xs @ residual_model.square_terms[j]
+        for i in range(n_modelpoints):
+            y_residuals[i, j] = (
+                centered_residuals[i, j]
+                - residual_model.linear_terms[:, j] @ centered_xs[i]
+                - 0.5 * (x_dot_square_terms[i] @ centered_xs[i])
+            )
+    return y_residuals
+
+
+def _fit_residual_model_loop(m_mat, n_mat, z_mat, n_z_mat, y_residuals, n_modelpoints):
+    """Fit the residual model one residual at a time."""
+    n_params = m_mat.shape[1] - 1
+    n_residuals = y_residuals.shape[1]
+    coeffs_linear = np.empty((n_residuals, n_params))
+    coeffs_square = np.empty((n_residuals, n_params, n_params))
+    n_z_mat_square = n_z_mat.T @ n_z_mat
+    for k in range(n_residuals):
+        coeffs_first_stage = np.linalg.solve(
+            n_z_mat_square, z_mat.T @ y_residuals[:, k]
+        )
+        beta = n_z_mat @ coeffs_first_stage
+        rhs = y_residuals[:, k] - n_mat @ beta
+        coeffs_linear[k] = np.linalg.solve(m_mat, rhs[: n_params + 1])[1:]
+        num = 0
+        for i in range(n_params):
+            coeffs_square[k, i, i] = beta[num]
+            num += 1
+            for j in range(i + 1, n_params):
+                coeffs_square[k, j, i] = beta[num] / np.sqrt(2)
+                coeffs_square[k, i, j] = beta[num] / np.sqrt(2)
+                num += 1
+    return {"linear_terms": coeffs_linear.T, "square_terms": coeffs_square}
+
+
+def _evaluate_and_fit(evaluate_func, fit_func, evaluate_inputs, fit_inputs):
+    y_residuals = evaluate_func(**evaluate_inputs)
+    coefficients = fit_func(**fit_inputs, y_residuals=y_residuals)
+    return y_residuals, coefficients
+
+
+@pytest.mark.parametrize("n_params, n_residuals", [(1, 1), (3, 7), (8, 20)])
+def test_residual_model_kernels_equal_loop_implementation(n_params, n_residuals):
+    inputs = _get_random_residual_model_inputs(n_params, n_residuals)
+
+    got = _evaluate_and_fit(evaluate_residual_model, fit_residual_model, *inputs)
+    expected = _evaluate_and_fit(
+        _evaluate_residual_model_loop, _fit_residual_model_loop, *inputs
+    )
+
+    aaae(got[0], expected[0])
+    aaae(got[1]["linear_terms"], expected[1]["linear_terms"])
+    aaae(got[1]["square_terms"], expected[1]["square_terms"])
+
+
+@pytest.mark.slow()
+def test_benchmark_residual_model_kernels_with_many_residuals():
+    """Micro-benchmark for the residual model kernels of pounders."""
+    inputs = _get_random_residual_model_inputs(n_params=60, n_residuals=1_500)
+
+    start = time.perf_counter()
+    got = _evaluate_and_fit(evaluate_residual_model, fit_residual_model, *inputs)
+    vectorized_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = _evaluate_and_fit(
+        _evaluate_residual_model_loop, _fit_residual_model_loop, *inputs
+    )
+    loop_time = time.perf_counter() - start
+
+    aaae(got[1]["square_terms"], expected[1]["square_terms"])
+    assert vectorized_time < loop_time / 5
+
+
+def test_append_row_to_qr():
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=(5, 4))
+    b = rng.normal(size=(5, 3))
+    q_mat, r_mat = np.linalg.qr(a[:4])
+
+    r_got, q_t_b_got = _append_row_to_qr(r_mat, q_mat.T @ b[:4], a[4], b[4])
+
+    aaae(np.triu(r_got), r_got)
+    aaae(r_got.T @ r_got, a.T @ a)
+    aaae(r_got.T @ q_t_b_got, a.T @ b)
+
+
+def test_check_candidate_point_equals_singular_value_criterion():
+    rng = np.random.default_rng(1234)
+    n_params = 3
+    n_poly_features = n_params * (n_params + 1) // 2
+    theta2 = 0.05
+
+    m_mat = np.column_stack([np.ones(n_params + 1), rng.normal(size=(4, 3))])
+    n_mat = rng.normal(size=(n_params + 1, n_poly_features))
+    system = _get_interpolation_system(m_mat, n_mat)
+
+    n_accepted = 0
+    for is_duplicate in [False, True, False, True, False]:
+        if is_duplicate:
+            m_row, n_row = m_mat[-1], n_mat[-1]
+        else:
+            m_row = np.concatenate([[1], rng.normal(size=n_params)])
+            n_row = rng.normal(size=n_poly_features)
+
+        m_candidate = np.vstack([m_mat, m_row])
+        n_candidate = np.vstack([n_mat, n_row])
+        expected = _check_candidate_point_from_scratch(
+            m_candidate, n_candidate, theta2, n_maxinterp=2 * n_params + 1
+        )
+
+        accept, candidate_system = _check_candidate_point(m_row, n_row, system, theta2)
+
+        assert accept == expected
+        if accept:
+            m_mat, n_mat = m_candidate, n_candidate
+            system = candidate_system
+            n_accepted += 1
+
+    assert n_accepted == 3
+
+
+def test_get_interpolation_system_with_rank_deficient_features():
+    m_mat = np.column_stack([np.ones(3), np.zeros((3, 2))])
+    assert _get_interpolation_system(m_mat, np.ones((3, 3))) is None
+
+
+SUBSOLVER_OPTIONS = {
+    "conjugate_gradient_method": "trsbox",
+    "maxiter": 50,
+    "maxiter_gradient_descent": 5,
+    "gtol_abs": 1e-8,
+    "gtol_rel": 1e-8,
+    "gtol_scaled": 0,
+    "gtol_abs_conjugate_gradient": 1e-8,
+    "gtol_rel_conjugate_gradient": 1e-6,
+    "k_easy": 0.1,
+    "k_hard": 0.2,
+}
+
+
+@pytest.mark.parametrize("solver", ["bntr", "gqtpar"])
+def test_solve_subproblem_for_several_radii(solver):
+    main_model = MainModel(
+        linear_terms=np.array([-2.0, 1.0, 0.5]),
+        square_terms=np.diag([0.1, 0.2, 0.3]),
+    )
+    x_accepted = np.zeros(3)
+
+    results = solve_subproblem_for_several_radii(
+        x_accepted=x_accepted,
+        main_model=main_model,
+        lower_bounds=None,
+        upper_bounds=None,
+        delta=1.0,
+        gamma0=0.5,
+        n_candidates=3,
+        solver=solver,
+        **SUBSOLVER_OPTIONS,
+    )
+    expected_first = solve_subproblem(
+        x_accepted=x_accepted,
+        main_model=main_model,
+        lower_bounds=None,
+        upper_bounds=None,
+        delta=1.0,
+        solver=solver,
+        **SUBSOLVER_OPTIONS,
+    )
+
+    assert len(results) == 3
+    aaae(results[0]["x"], expected_first["x"])
+
+    norm_order = np.inf if solver == "bntr" else 2
+    for k, result in enumerate(results):
+        assert np.linalg.norm(result["x"], ord=norm_order) <= 1.1 * 0.5**k
+        model_value = (
+            main_model.linear_terms @ result["x"]
+            + 0.5 * result["x"] @ main_model.square_terms @ result["x"]
+        )
+        aaae(result["criterion"], model_value)
+
+
+def test_solve_subproblem_for_several_radii_stops_at_interior_solution():
+    main_model = MainModel(linear_terms=np.array([-0.3, 0.3]), square_terms=np.eye(2))
+
+    results = solve_subproblem_for_several_radii(
+        x_accepted=np.zeros(2),
+        main_model=main_model,
+        lower_bounds=None,
+        upper_bounds=None,
+        delta=1.0,
+        gamma0=0.5,
+        n_candidates=5,
+        solver="bntr",
+        **SUBSOLVER_OPTIONS,
+    )
+
+    assert len(results) == 1
+    aaae(results[0]["x"], np.array([0.3, -0.3]))
+
+
+def test_add_speculative_candidates_to_history():
+    history = LeastSquaresHistory()
+    history.add_entries(np.zeros(2), np.array([2.0, 2.0]))
+
+    x_candidates = [np.array([1.0, 0]), np.array([0.5, 0]), np.array([0.25, 0])]
+    residuals = [np.array([3.0, 0]), np.array([1.0, 0]), np.array([1.5, 0])]
+    results = [{"x": x, "criterion": -float(i)} for i, x in enumerate(x_candidates)]
+
+    history, result_sub = add_speculative_candidates_to_history(
+        history, x_candidates, residuals, results
+    )
+
+    assert result_sub is results[1]
+    assert history.get_n_fun() == 4
+    aaae(history.get_xs(index=-1), x_candidates[1])
+    assert history.get_best_index() == 3
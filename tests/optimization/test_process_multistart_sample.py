@@ -8,18 +8,18 @@ samples = [
     (
         pd.DataFrame(np.ones((2, 3)), columns=["a", "b", "c"]),
         pd.Series([1, 2, 3], index=["a", "b", "c"], name="value").to_frame(),
-        lambda x: x["value"].to_numpy(),
+        lambda x: np.array(x, dtype=float),
     ),
     (
         np.ones((2, 3)),
         np.array([1, 2, 3]),
-        lambda x: x,
+        lambda x: x.astype(float),
     ),
 ]
 
 
-@pytest.mark.parametrize("sample, x, to_internal", samples)
-def test_process_multistart_sample(sample, x, to_internal):
-    calculated = process_multistart_sample(sample, x, to_internal)
+@pytest.mark.parametrize("sample, x, to_internal_batch", samples)
+def test_process_multistart_sample(sample, x, to_internal_batch):
+    calculated = process_multistart_sample(sample, x, to_internal_batch)
     expeceted = np.ones((2, 3))
     aaae(calculated, expeceted)
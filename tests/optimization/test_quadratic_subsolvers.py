@@ -2,7 +2,10 @@
 
 import numpy as np
 import pytest
+from estimagic.config import IS_NUMBA_INSTALLED
 from estimagic.optimization.pounders_auxiliary import MainModel
+from estimagic.optimization.subsolvers import _conjugate_gradient, _trsbox
+from estimagic.optimization.subsolvers import gqtpar as gqtpar_module
 from estimagic.optimization.subsolvers._conjugate_gradient import (
     minimize_trust_cg,
 )
@@ -17,6 +20,9 @@ from estimagic.optimization.subsolvers.gqtpar import (
     gqtpar,
 )
 from numpy.testing import assert_array_almost_equal as aaae
+from scipy.optimize._trustregion_exact import (
+    estimate_smallest_singular_value as scipy_estimate_smallest_singular_value,
+)
 
 # ======================================================================================
 # Subsolver BNTR
@@ -743,3 +749,105 @@ def test_trustregion_trsbox(linear_terms, square_terms, trustregion_radius, x_ex
     )
 
     aaae(x_out, x_expected, decimal=4)
+
+
+# ======================================================================================
+# Numba compiled and pure Python kernels
+# ======================================================================================
+
+
+def _use_pure_python_kernels(monkeypatch, module):
+    """Replace all numba compiled functions of a module by their Python versions."""
+    for name, obj in vars(module).copy().items():
+        if hasattr(obj, "py_func"):
+            monkeypatch.setattr(module, name, obj.py_func)
+
+
+@pytest.mark.skipif(not IS_NUMBA_INSTALLED, reason="Needs numba.")
+@pytest.mark.parametrize(
+    "linear_terms, square_terms, trustregion_radius, x_expected",
+    TEST_CASES_CG + TEST_CASES_TRSBOX,
+)
+def test_trsbox_numba_equals_pure_python(
+    linear_terms,
+    square_terms,
+    trustregion_radius,
+    x_expected,  # noqa: ARG001
+    monkeypatch,
+):
+    kwargs = {
+        "lower_bounds": -np.ones_like(linear_terms),
+        "upper_bounds": 0.5 * np.ones_like(linear_terms),
+    }
+    compiled = minimize_trust_trsbox(
+        linear_terms, square_terms, trustregion_radius, **kwargs
+    )
+
+    _use_pure_python_kernels(monkeypatch, _trsbox)
+    pure = minimize_trust_trsbox(
+        linear_terms, square_terms, trustregion_radius, **kwargs
+    )
+
+    aaae(compiled, pure, decimal=14)
+
+
+@pytest.mark.skipif(not IS_NUMBA_INSTALLED, reason="Needs numba.")
+@pytest.mark.parametrize(
+    "gradient, hessian, trustregion_radius, x_expected", TEST_CASES_CG
+)
+def test_conjugate_gradient_numba_equals_pure_python(
+    gradient, hessian, trustregion_radius, x_expected, monkeypatch
+):
+    compiled = minimize_trust_cg(gradient, hessian, trustregion_radius)
+
+    _use_pure_python_kernels(monkeypatch, _conjugate_gradient)
+    pure = minimize_trust_cg(gradient, hessian, trustregion_radius)
+
+    aaae(compiled, pure, decimal=14)
+    aaae(compiled, x_expected)
+
+
+@pytest.mark.skipif(not IS_NUMBA_INSTALLED, reason="Needs numba.")
+@pytest.mark.parametrize(
+    "linear_terms, square_terms, x_expected, criterion_expected", TEST_CASES_GQTPAR
+)
+def test_gqtpar_numba_equals_pure_python(
+    linear_terms, square_terms, x_expected, criterion_expected, monkeypatch
+):
+    main_model = MainModel(linear_terms=linear_terms, square_terms=square_terms)
+    compiled = gqtpar(main_model, x_candidate=np.zeros_like(x_expected))
+
+    _use_pure_python_kernels(monkeypatch, gqtpar_module)
+    pure = gqtpar(main_model, x_candidate=np.zeros_like(x_expected))
+
+    aaae(compiled["x"], pure["x"], decimal=14)
+    aaae(compiled["criterion"], criterion_expected)
+
+
+def test_estimate_smallest_singular_value_equals_scipy():
+    rng = np.random.default_rng(0)
+    upper_triangular = np.triu(rng.normal(size=(8, 8))) + 4 * np.eye(8)
+
+    s_min, z_min = gqtpar_module.estimate_smallest_singular_value(upper_triangular)
+    expected_s_min, expected_z_min = scipy_estimate_smallest_singular_value(
+        upper_triangular
+    )
+
+    aaae(s_min, expected_s_min, decimal=14)
+    aaae(z_min, expected_z_min, decimal=14)
+
+
+@pytest.mark.skipif(not IS_NUMBA_INSTALLED, reason="Needs numba.")
+def test_kernels_compile_one_signature_for_different_input_layouts():
+    rng = np.random.default_rng(0)
+    upper_triangular = np.triu(rng.normal(size=(4, 4))) + 4 * np.eye(4)
+    for candidate in [upper_triangular, np.asfortranarray(upper_triangular)]:
+        gqtpar_module.estimate_smallest_singular_value(candidate)
+
+    gradient = np.arange(4)
+    hessian = np.eye(4)
+    for candidate in [hessian, np.asfortranarray(hessian), hessian[::-1, ::-1]]:
+        minimize_trust_cg(gradient, candidate, trustregion_radius=1)
+
+    assert len(gqtpar_module._estimate_smallest_singular_value.signatures) == 1
+    assert len(_conjugate_gradient._minimize_trust_cg.signatures) == 1
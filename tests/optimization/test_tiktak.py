@@ -6,9 +6,13 @@ import pytest
 from estimagic.optimization.tiktak import (
     _linear_weights,
     _tiktak_weights,
+    cluster_exploration_sample,
     draw_exploration_sample,
+    draw_exploration_sample_in_chunks,
     get_batched_optimization_sample,
+    get_mlsl_critical_distance,
     run_explorations,
+    run_explorations_in_chunks,
     update_convergence_state,
 )
 from numpy.testing import assert_array_almost_equal as aaae
@@ -89,6 +93,105 @@ def test_run_explorations():
     aaae(calculated["sorted_sample"], exp_sample)
 
 
+chunk_test_cases = list(product(distributions, ["sobol", "halton", "random"]))
+
+
+@pytest.mark.parametrize("dist, rule", chunk_test_cases)
+def test_draw_exploration_sample_in_chunks(dist, rule):
+    kwargs = {
+        "x": np.ones(2) * 0.5,
+        "lower": np.zeros(2),
+        "upper": np.ones(2),
+        "n_samples": 10,
+        "sampling_distribution": dist,
+        "sampling_method": rule,
+        "seed": 1234,
+    }
+    chunks = list(draw_exploration_sample_in_chunks(chunk_size=4, **kwargs))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    aaae(np.vstack(chunks), draw_exploration_sample(**kwargs))
+
+
+def test_draw_exploration_sample_in_chunks_with_latin_hypercube():
+    chunks = draw_exploration_sample_in_chunks(
+        x=np.ones(2) * 0.5,
+        lower=np.zeros(2),
+        upper=np.ones(2),
+        n_samples=10,
+        chunk_size=4,
+        sampling_distribution="uniform",
+        sampling_method="latin_hypercube",
+        seed=1234,
+    )
+    with pytest.raises(ValueError, match="Latin hypercube"):
+        next(chunks)
+
+
+def test_run_explorations_in_chunks():
+    def _dummy(x, **kwargs):  # noqa: ARG001
+        return np.nan if x.sum() == 5 else (x.sum() - 11) ** 2
+
+    sample = np.arange(20).reshape(10, 2)
+    chunks = [sample[:3], sample[3:6], sample[6:]]
+
+    calculated = run_explorations_in_chunks(
+        func=_dummy,
+        primary_key="value",
+        sample_chunks=chunks,
+        n_best=3,
+        batch_evaluator="joblib",
+        n_cores=1,
+        step_id=0,
+        error_handling="raise",
+    )
+    expected = run_explorations(
+        func=_dummy,
+        primary_key="value",
+        sample=sample,
+        batch_evaluator="joblib",
+        n_cores=1,
+        step_id=0,
+        error_handling="raise",
+    )
+
+    aaae(calculated["sorted_values"], expected["sorted_values"][:3])
+    aaae(calculated["sorted_sample"], expected["sorted_sample"][:3])
+
+
+def test_cluster_exploration_sample():
+    sorted_sample = np.array([[0.0, 0], [1, 1], [0.5, 0], [8, 8], [9, 8], [4, 6]])
+
+    calculated = cluster_exploration_sample(
+        sorted_sample=sorted_sample,
+        lower=np.zeros(2),
+        upper=np.full(2, 10.0),
+        critical_distance=0.2,
+        n_optimizations=10,
+    )
+
+    aaae(calculated, sorted_sample[[0, 3, 5]])
+
+
+def test_cluster_exploration_sample_stops_at_n_optimizations():
+    calculated = cluster_exploration_sample(
+        sorted_sample=np.arange(10.0).reshape(5, 2),
+        lower=np.zeros(2),
+        upper=np.full(2, 10.0),
+        critical_distance=0.1,
+        n_optimizations=2,
+    )
+
+    aaae(calculated, np.array([[0.0, 1], [2, 3]]))
+
+
+def test_mlsl_critical_distance_decreases_with_n_samples():
+    distances = [get_mlsl_critical_distance(n, n_params=3) for n in [10, 100, 1000]]
+    assert distances[0] > distances[1] > distances[2] > 0
+    # for one parameter the formula simplifies to 4 * log(n) / n / 2
+    assert np.allclose(get_mlsl_critical_distance(100, 1), 2 * np.log(100) / 100)
+
+
 def test_get_batched_optimization_sample():
     calculated = get_batched_optimization_sample(
         sorted_sample=np.arange(12).reshape(6, 2),
@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 from estimagic import maximize, minimize
 from estimagic.config import IS_CYIPOPT_INSTALLED
+from estimagic.exceptions import InvalidConstraintError
 from estimagic.algorithms import AVAILABLE_ALGORITHMS
 from numpy.testing import assert_array_almost_equal as aaae
 
@@ -245,3 +246,79 @@ def test_general_example(general_example, algorithm, skip_checks):
 
     aaae(res.params["a"], np.array([optimal_p1, optimal_p2, 0, 0]), decimal=4)
     aaae(res.params["b"], np.array([0.0, 0]), decimal=5)
+
+
+# ======================================================================================
+# Test: constraints that are derived from the criterion output
+# ======================================================================================
+
+
+def _get_counting_simulation():
+    evaluated = []
+
+    def simulate(params):
+        evaluated.append(params.copy())
+        offset = np.linspace(1, 0, len(params))
+        x = params - offset
+        return {"value": x @ x, "product": np.prod(params[:-1])}
+
+    return simulate, evaluated
+
+
+def test_constraint_from_criterion_shares_evaluations():
+    simulate, evaluated = _get_counting_simulation()
+
+    res = minimize(
+        criterion=simulate,
+        params=np.ones(6),
+        algorithm="scipy_slsqp",
+        constraints={
+            "type": "nonlinear",
+            "from_criterion": True,
+            "func": lambda crit: crit["product"],
+            "value": 1.0,
+        },
+    )
+
+    expected = minimize(
+        criterion=criterion,
+        params=np.ones(6),
+        algorithm="scipy_slsqp",
+        constraints={
+            "type": "nonlinear",
+            "selector": lambda x: x[:-1],
+            "func": np.prod,
+            "value": 1.0,
+        },
+    )
+
+    aaae(res.params, expected.params, decimal=4)
+
+    # all evaluations after the first evaluation at the start params are unique
+    unique = {p.tobytes() for p in evaluated[1:]}
+    assert len(unique) == len(evaluated) - 1
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        {"derivative": lambda crit: 1.0},
+        {"selector": lambda params: params[:-1]},
+    ],
+)
+def test_constraint_from_criterion_with_invalid_entries(entries):
+    simulate, _ = _get_counting_simulation()
+
+    with pytest.raises(InvalidConstraintError):
+        minimize(
+            criterion=simulate,
+            params=np.ones(6),
+            algorithm="scipy_slsqp",
+            constraints={
+                "type": "nonlinear",
+                "from_criterion": True,
+                "func": lambda crit: crit["product"],
+                "value": 1.0,
+                **entries,
+            },
+        )
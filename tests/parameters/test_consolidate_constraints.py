@@ -0,0 +1,65 @@
+import time
+
+import numpy as np
+import pytest
+from estimagic.parameters.consolidate_constraints import _join_overlapping_lists
+from estimagic.parameters.conversion import get_converter
+from numpy.testing import assert_array_almost_equal as aaae
+
+
+def test_join_overlapping_lists():
+    candidates = [[5, 3], [1, 2], [7], [2, 8], [3, 4], [9, 1], []]
+    got = _join_overlapping_lists(candidates)
+    expected = [[3, 4, 5], [1, 2, 8, 9], [7]]
+    assert got == expected
+
+
+def _get_many_constraints(n_blocks):
+    """Five constraints of different types per block of six parameters."""
+    values, constraints = [], []
+    for _ in range(n_blocks):
+        start = len(values)
+        loc = list(range(start, start + 6))
+        values += [1.0, 1.0, 2.0, 3.0, 0.5, 0.5]
+        constraints += [
+            {"loc": loc[:2], "type": "equality"},
+            {"loc": loc[1:4], "type": "increasing"},
+            {"loc": loc[4:], "type": "linear", "weights": [1, 1], "value": 1},
+            {"loc": loc[2], "type": "fixed"},
+            {"loc": loc[4:], "type": "linear", "weights": [2, 2], "value": 2},
+        ]
+    return np.array(values), constraints
+
+
+def _build_converter(n_blocks):
+    params, constraints = _get_many_constraints(n_blocks)
+    start = time.perf_counter()
+    converter, internal = get_converter(
+        params=params,
+        constraints=constraints,
+        lower_bounds=None,
+        upper_bounds=None,
+        func_eval=1.0,
+        primary_key="value",
+        scaling=False,
+        scaling_options=None,
+    )
+    runtime = time.perf_counter() - start
+    return params, converter, internal, runtime
+
+
+def test_consolidation_with_many_constraints():
+    params, converter, internal, _ = _build_converter(n_blocks=600)
+
+    # per block: one equality, one fix and one of the two redundant linear constraints
+    # remove one free parameter each
+    assert len(internal.values) == 600 * 3
+    aaae(converter.params_from_internal(internal.values), params)
+
+
+@pytest.mark.slow()
+def test_consolidation_runtime_scales_linearly():
+    _build_converter(n_blocks=10)
+    runtimes = {n: _build_converter(n_blocks=n)[-1] for n in [150, 1200]}
+    # a quadratic implementation would be 64 times slower
+    assert runtimes[1200] / runtimes[150] < 24
@@ -114,6 +114,58 @@ def test_get_converter_with_trees():
     aaae(converter.func_to_internal({"contributions": {"d": 1, "e": 2}}), 3)
 
 
+def test_batch_conversion_with_transforming_constraints():
+    params = {"a": np.array([0.5, 0.2, 0.3]), "b": np.array([2, 0.5, 1.5]), "c": 3.0}
+    constraints = [
+        {"selector": lambda p: p["a"], "type": "probability"},
+        {"selector": lambda p: p["b"], "type": "covariance"},
+        {"selector": lambda p: p["c"], "type": "fixed"},
+    ]
+    converter, internal = get_converter(
+        params=params,
+        constraints=constraints,
+        lower_bounds=None,
+        upper_bounds=None,
+        func_eval=3,
+        primary_key="value",
+        scaling=True,
+        scaling_options=None,
+    )
+
+    rng = np.random.default_rng(seed=0)
+    x = internal.values + rng.uniform(0, 0.1, size=(5, len(internal.values)))
+
+    flat = converter.params_from_internal_batch(x, return_type="flat")
+    trees, flat_too = converter.params_from_internal_batch(x, "tree_and_flat")
+    aaae(flat, flat_too)
+    assert len(trees) == 5
+
+    for i, row in enumerate(x):
+        expected = converter.params_from_internal(row)
+        aaae(flat[i], converter.params_from_internal(row, return_type="flat"))
+        aaae(trees[i]["a"], expected["a"])
+        aaae(trees[i]["b"], expected["b"])
+
+    aaae(converter.params_to_internal_batch(list(trees)), x)
+    aaae(converter.params_to_internal_batch(flat), x)
+
+
+def test_batch_conversion_fast_path():
+    converter, _ = get_converter(
+        params=np.arange(3),
+        constraints=None,
+        lower_bounds=None,
+        upper_bounds=None,
+        func_eval=3,
+        primary_key="value",
+        scaling=False,
+        scaling_options=None,
+    )
+    x = np.arange(6).reshape(2, 3)
+    aaae(converter.params_from_internal_batch(x), x)
+    aaae(converter.params_to_internal_batch(list(x)), x)
+
+
 @pytest.fixture()
 def fast_kwargs():
     kwargs = {
@@ -116,3 +116,66 @@ def test_sdcorr_to_internal_jacobian(dim, seed):  # noqa: ARG001
     deriv = kt.sdcorr_to_internal_jacobian(external, None)
 
     aaae(deriv, numerical_deriv["derivative"], decimal=3)
+
+
+def _covariance_from_internal_jacobian_kronecker(internal_values):
+    chol = kt.chol_params_to_lower_triangular_matrix(internal_values)
+    dim = len(chol)
+    K = kt._commutation_matrix(dim)
+    L = kt._elimination_matrix(dim)
+    return L @ (np.eye(dim**2) + K) @ np.kron(chol, np.eye(dim)) @ L.T
+
+
+def _sdcorr_from_internal_jacobian_kronecker(internal_values):
+    X = kt.chol_params_to_lower_triangular_matrix(internal_values)
+    dim = len(X)
+    identity = np.eye(dim)
+    S = X @ X.T
+    V = np.linalg.inv(np.sqrt(np.multiply(identity, S)))
+    K = kt._commutation_matrix(dim)
+    Y = np.diag(identity.ravel("F"))
+    XX = X / np.sqrt((X**2).sum(axis=1).reshape(-1, 1))
+    U = Y @ np.kron(identity, XX) @ K
+    N = np.kron(identity, X) @ K + np.kron(X, identity)
+    VS = V @ S
+    B = np.kron(V, V)
+    H = np.kron(VS, identity)
+    J = np.kron(identity, VS)
+    intermediate = U + B @ N - (H + J) @ B @ U
+    T = kt._transformation_matrix(dim)
+    D = kt._duplication_matrix(dim)
+    return T @ intermediate @ D
+
+
+@pytest.mark.parametrize("dim, seed", to_test)
+def test_covariance_from_internal_jacobian_equals_kronecker_formula(dim, seed):
+    internal = get_internal_cholesky(dim, seed)
+    deriv = kt.covariance_from_internal_jacobian(internal, None)
+    aaae(deriv, _covariance_from_internal_jacobian_kronecker(internal))
+
+
+@pytest.mark.parametrize("dim, seed", to_test)
+def test_sdcorr_from_internal_jacobian_equals_kronecker_formula(dim, seed):
+    internal = get_internal_cholesky(dim, seed)
+    deriv = kt.sdcorr_from_internal_jacobian(internal, None)
+    aaae(deriv, _sdcorr_from_internal_jacobian_kronecker(internal))
+
+
+STACKED_CASES = [
+    ("covariance_to_internal", get_external_covariance),
+    ("covariance_from_internal", get_internal_cholesky),
+    ("sdcorr_to_internal", get_external_sdcorr),
+    ("sdcorr_from_internal", get_internal_cholesky),
+    ("probability_to_internal", get_external_probability),
+    ("probability_from_internal", get_internal_probability),
+]
+
+
+@pytest.mark.parametrize("func_name, get_values", STACKED_CASES)
+def test_kernel_transformations_broadcast_over_leading_axes(func_name, get_values):
+    func = getattr(kt, func_name)
+    stacked = np.array(
+        [[get_values(4, seed=2 * i + j) for j in range(2)] for i in range(3)]
+    )
+    expected = np.array([[func(vals, None) for vals in row] for row in stacked])
+    aaae(func(stacked, None), expected)
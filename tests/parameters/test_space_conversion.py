@@ -5,8 +5,17 @@ from estimagic.parameters.space_conversion import (
     InternalParams,
     _multiply_from_left,
     _multiply_from_right,
+    convert_external_derivative_to_internal,
     get_space_converter,
+    group_transformations,
+    post_replace_jacobian,
+    pre_replace,
+    pre_replace_jacobian,
+    reparametrize_from_internal,
+    reparametrize_to_internal,
+    transformation_jacobian,
 )
+from estimagic.parameters.process_constraints import process_constraints
 from estimagic.utilities import get_rng
 from numpy.testing import assert_array_almost_equal as aaae
 
@@ -309,3 +318,110 @@ def test_multiply_from_left_and_right(seed):
 
     aaae(calc_from_left, expected)
     aaae(calc_from_right, expected)
+
+
+@pytest.mark.parametrize(
+    "constraints, params, expected_internal", PARAMETRIZATION, ids=IDS
+)
+def test_derivative_conversion_equals_dense_jacobian_chain(
+    constraints, params, expected_internal
+):
+    transformations, constr_info = process_constraints(
+        constraints=constraints,
+        params_vec=params.values,
+        lower_bounds=params.lower_bounds,
+        upper_bounds=params.upper_bounds,
+        param_names=params.names,
+    )
+    internal_values = expected_internal.values
+    pre_replaced = pre_replace(
+        internal_values,
+        constr_info["internal_fixed_values"],
+        constr_info["pre_replacements"],
+    )
+
+    rng = get_rng(seed=1234)
+    external_derivative = rng.normal(size=(3, len(params.values)))
+
+    expected = _multiply_from_left(
+        [
+            external_derivative,
+            post_replace_jacobian(constr_info["post_replacements"]),
+            transformation_jacobian(transformations, pre_replaced),
+            pre_replace_jacobian(constr_info["pre_replacements"], len(internal_values)),
+        ]
+    )
+
+    calculated = convert_external_derivative_to_internal(
+        external_derivative=external_derivative,
+        internal_values=internal_values,
+        fixed_values=constr_info["internal_fixed_values"],
+        pre_replacements=constr_info["pre_replacements"],
+        transformations=transformations,
+        post_replacements=constr_info["post_replacements"],
+    )
+
+    aaae(calculated, expected)
+
+
+def _get_many_small_transformations():
+    rng = get_rng(seed=5471)
+    values, constraints = [], []
+    for _ in range(20):
+        start = len(values)
+        probs = rng.uniform(size=3)
+        values += list(probs / probs.sum())
+        constraints.append(
+            {"type": "probability", "index": np.arange(start, start + 3)}
+        )
+    for _ in range(10):
+        start = len(values)
+        chol = np.tril(rng.uniform(0.1, 1, size=(2, 2)))
+        values += list((chol @ chol.T)[np.tril_indices(2)])
+        constraints.append({"type": "covariance", "index": np.arange(start, start + 3)})
+    params = InternalParams(
+        values=np.array(values),
+        lower_bounds=np.full(len(values), -np.inf),
+        upper_bounds=np.full(len(values), np.inf),
+        names=[str(i) for i in range(len(values))],
+    )
+    return constraints, params
+
+
+def test_grouped_transformations_equal_ungrouped():
+    constraints, params = _get_many_small_transformations()
+    transformations, constr_info = process_constraints(
+        constraints=constraints,
+        params_vec=params.values,
+        lower_bounds=params.lower_bounds,
+        upper_bounds=params.upper_bounds,
+        param_names=params.names,
+    )
+    grouped = group_transformations(transformations)
+    assert len(grouped) == 2
+    assert {group["index"].shape for group in grouped} == {(20, 3), (10, 3)}
+
+    internal = {}
+    for name, transf in [("ungrouped", transformations), ("grouped", grouped)]:
+        internal[name] = reparametrize_to_internal(
+            params.values, constr_info["internal_free"], transf
+        )
+    aaae(internal["grouped"], internal["ungrouped"])
+
+    kwargs = {
+        "fixed_values": constr_info["internal_fixed_values"],
+        "pre_replacements": constr_info["pre_replacements"],
+        "post_replacements": constr_info["post_replacements"],
+    }
+    aaae(
+        reparametrize_from_internal(
+            internal["grouped"], transformations=grouped, **kwargs
+        ),
+        params.values,
+    )
+
+    batch = np.tile(internal["grouped"], (4, 1))
+    aaae(
+        reparametrize_from_internal(batch, transformations=grouped, **kwargs),
+        np.tile(params.values, (4, 1)),
+    )
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+import pytest
+from estimagic.estimation.estimate_ml import estimate_ml
+from estimagic.examples.logit import logit_derivative, logit_loglike
+from estimagic.optimization.optimize import maximize, minimize
+from estimagic.sharding import _combine, get_sharded_function, shard_data
+from numpy.testing import assert_array_almost_equal as aaae
+
+
+@pytest.fixture()
+def logit_data():
+    rng = np.random.default_rng(1234)
+    x = np.column_stack([np.ones(200), rng.normal(size=(200, 2))])
+    y = pd.Series((x @ np.array([0.5, -1, 1]) + rng.logistic(size=200) > 0) * 1.0)
+    return {"y": y, "x": x}
+
+
+def logit_jacobian(params, y, x):
+    return logit_derivative(params, y, x)["contributions"]
+
+
+@pytest.mark.parametrize("n_cores", [1, 2])
+def test_sharded_function_equals_unsharded_function(logit_data, n_cores):
+    shards = shard_data(logit_data, n_shards=3, n_cores=n_cores)
+    params = np.array([0.1, 0.2, -0.3])
+
+    sharded_loglike = get_sharded_function(logit_loglike, shards, data_name=None)
+    sharded_derivative = get_sharded_function(logit_derivative, shards, data_name=None)
+
+    expected = logit_loglike(params, **logit_data)
+    calculated = sharded_loglike(params)
+    assert np.allclose(calculated["value"], expected["value"])
+    aaae(calculated["contributions"], expected["contributions"])
+
+    expected = logit_derivative(params, **logit_data)
+    calculated = sharded_derivative(params)
+    aaae(calculated["value"], expected["value"])
+    aaae(calculated["contributions"], expected["contributions"])
+
+
+def test_sharded_function_with_data_argument():
+    def func(params, data):
+        return data["a"] * params
+
+    data = pd.DataFrame({"a": np.arange(5.0)}, index=list("abcde"))
+    sharded = get_sharded_function(func, shard_data(data, n_shards=2))
+    pd.testing.assert_series_equal(sharded(2.0), data["a"] * 2.0)
+
+
+def test_estimate_ml_with_sharded_loglike_and_jacobian(logit_data):
+    shards = shard_data(logit_data, n_shards=4)
+    kwargs = {
+        "params": np.zeros(3),
+        "optimize_options": "scipy_lbfgsb",
+    }
+
+    expected = estimate_ml(
+        loglike=logit_loglike,
+        loglike_kwargs=logit_data,
+        jacobian=logit_jacobian,
+        jacobian_kwargs=logit_data,
+        **kwargs,
+    )
+    calculated = estimate_ml(
+        loglike=get_sharded_function(logit_loglike, shards, data_name=None),
+        jacobian=get_sharded_function(logit_jacobian, shards, data_name=None),
+        **kwargs,
+    )
+
+    aaae(calculated.params, expected.params)
+    aaae(calculated.se(), expected.se())
+
+
+def test_bhhh_with_sharded_criterion(logit_data):
+    shards = shard_data(logit_data, n_shards=3)
+    res = maximize(
+        criterion=get_sharded_function(logit_loglike, shards, data_name=None),
+        derivative=get_sharded_function(logit_jacobian, shards, data_name=None),
+        params=np.zeros(3),
+        algorithm="bhhh",
+    )
+    expected = maximize(
+        criterion=logit_loglike,
+        criterion_kwargs=logit_data,
+        derivative=logit_jacobian,
+        derivative_kwargs=logit_data,
+        params=np.zeros(3),
+        algorithm="bhhh",
+    )
+    aaae(res.params, expected.params)
+
+
+def negative_loglike(params, y, x):
+    return -logit_loglike(params, y, x)["value"]
+
+
+def negative_gradient(params, y, x):
+    return -logit_derivative(params, y, x)["value"]
+
+
+def test_minimize_with_sharded_criterion_and_summed_gradient(logit_data):
+    shards = shard_data(logit_data, n_shards=3)
+    res = minimize(
+        criterion=get_sharded_function(negative_loglike, shards, data_name=None),
+        derivative=get_sharded_function(
+            negative_gradient, shards, data_name=None, reduce="sum"
+        ),
+        params=np.zeros(3),
+        algorithm="scipy_lbfgsb",
+    )
+    expected = minimize(
+        criterion=negative_loglike,
+        criterion_kwargs=logit_data,
+        derivative=negative_gradient,
+        derivative_kwargs=logit_data,
+        params=np.zeros(3),
+        algorithm="scipy_lbfgsb",
+    )
+    aaae(res.params, expected.params)
+
+
+def test_sharded_function_with_reduce_per_entry(logit_data):
+    def func(params, y, x):
+        return {
+            "contributions": logit_loglike(params, y, x)["contributions"],
+            "gradient": logit_derivative(params, y, x)["value"],
+        }
+
+    shards = shard_data(logit_data, n_shards=4)
+    sharded = get_sharded_function(
+        func, shards, data_name=None, reduce={"gradient": "sum"}
+    )
+
+    params = np.array([0.1, 0.2, -0.3])
+    calculated = sharded(params)
+    expected = func(params, **logit_data)
+    aaae(calculated["contributions"], expected["contributions"])
+    aaae(calculated["gradient"], expected["gradient"])
+
+
+def test_sharded_function_with_invalid_reduce(logit_data):
+    shards = shard_data(logit_data, n_shards=2)
+    with pytest.raises(ValueError, match="reduce must be one of"):
+        get_sharded_function(logit_loglike, shards, data_name=None, reduce="mean")
+
+
+def test_combine_sums_values_and_concatenates_contributions():
+    results = [
+        {"value": 1.0, "contributions": np.ones(2)},
+        {"value": 2.0, "contributions": np.zeros(1)},
+    ]
+    calculated = _combine(results)
+    assert calculated["value"] == 3
+    aaae(calculated["contributions"], np.array([1, 1, 0]))
+
+
+def test_shard_data_with_invalid_number_of_shards():
+    with pytest.raises(ValueError):
+        shard_data(np.arange(3), n_shards=0)